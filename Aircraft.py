@@ -5,31 +5,48 @@ Module functions
 - initialization 
 - compute_MTOW
 - display_specs
+- get_displayValue
 - output_specs
 
 
 Author: Matt Asper (matt.asper101@gmail.com)
-Last Revised: 22 December 2025
+Last Revised: 17 October 2026
 '''
 import csv
 import os
+import warnings
 from pathlib import Path
+import numpy as np
 from read_yml import read_yml
+from add_dictEntry import add_dictEntry
+from format_value import format_value
+from get_atmos import get_atmos
+from compute_subsystemMasses import compute_subsystemMasses
+from Profiler import PROFILER
+from units import get_unitFactor
 
 class Aircraft: # make dataclass?
 
-    def __init__(self, run_mode):
+    def __init__(self, run_mode, config_path="configs/group1_quad.yml", config_params=None):
         """
         This function initializes the vehicle and queries the user for requirements.
 
         inputs
         --------
+        run_mode                    :   str specifying how to initialize the vehicle; "manual" or "auto"
+        config_path                 :   path to the .yml config file used in "auto" mode
+        config_params               :   already parsed config dictionary; overrides config_path in "auto" mode
         self.reqs                   :   requirements dictionary {dict}
         self.reqs["range"]          :   required cruise range [m]
         self.reqs["payload"]        :   required payload [kg]
         self.reqs["vtas_cruise"]    :   required true airspeed during cruise [m/s]
         self.reqs["endurance"]      :   required endurance [s]
+        self.subsystem_params       :   subsystem mass model parameters {dict}; optional "subsystems" config section
+        self.prop_params            :   propeller parameters used for sizing {dict}; optional "prop" config section
+        self.display_units          :   units of the config each requirement is reported in {dict}
 
+        Requirement values given as lists in the config are converted to numpy arrays, in which case
+        one aircraft is sized per element and all of them converge together.
         
         outputs
         --------
@@ -45,15 +62,30 @@ class Aircraft: # make dataclass?
             self.reqs = dict()
 
             # query user to input requirements
-            self.reqs["range"]        = {"value": float(input("Input cruise range in meters: ")), "units": "m"}
-            self.reqs["payload"]      = {"value": float(input("Enter required payload in kilograms: ")), "units": "kg"}
-            self.reqs["vtas_cruise"]  = {"value": float(input("Enter required true cruise speed in meters per second: ")), "units": "m/s"}
-            self.reqs["endurance"]    = {"value": float(input("Enter required endurance in seconds: ")), "units": "s"}
+            self.reqs["range"]        = add_dictEntry("range", float(input("Input cruise range in meters: ")), "m")
+            self.reqs["payload"]      = add_dictEntry("payload", float(input("Enter required payload in kilograms: ")), "kg")
+            self.reqs["vtas_cruise"]  = add_dictEntry("vtas_cruise", float(input("Enter required true cruise speed in meters per second: ")), "m/s")
+            self.reqs["endurance"]    = add_dictEntry("endurance", float(input("Enter required endurance in seconds: ")), "s")
+
+            self.subsystem_params = dict()
+            self.prop_params = dict()
+            self.display_units = dict()
 
         elif run_mode == "auto":
-            full_path = Path("configs/group1_quad.yml")  # path to .yml config file
-            config_params = read_yml(full_path)
-            self.reqs = config_params["reqs"]
+            if config_params is None:
+                full_path = Path(config_path)  # path to .yml config file
+                config_params = read_yml(full_path)
+            self.reqs = {key: add_dictEntry(key, entry["value"], entry["units"])
+                         for key, entry in config_params["reqs"].items()}
+            self.display_units = {key: entry.get("display_units", entry["units"])
+                                  for key, entry in config_params["reqs"].items()}
+            self.subsystem_params = config_params.get("subsystems", dict())
+            self.prop_params = config_params.get("prop", dict())
+
+            # lists of requirements define a batch of aircraft
+            for value in self.reqs.values():
+                if isinstance(value["value"], (list, tuple)):
+                    value["value"] = np.asarray(value["value"], dtype=float)
 
         # initialize iteration counter for vehicle weight
         self.iter = 1
@@ -63,30 +95,89 @@ class Aircraft: # make dataclass?
 
         return
     
-    def compute_MTOW(self, margin=1):
+    @PROFILER.profile("MTOW_iteration")
+    def compute_MTOW(self, margin=1, method="anderson", tol=1e-6, max_iter=50, damping=0.5, **kwargs):
         """
-        This function computes the maximum takeoff weight of the aircraft.
+        This function computes the maximum takeoff weight of the aircraft by converging the sum of
+        the subsystem masses (see compute_subsystemMasses) to a fixed point. Requirement values may
+        be numpy arrays, in which case every design is converged in the same vectorized iteration.
 
         inputs
         ------
-        margin      :   factor added to MTOW computation to account for uncertainty
+        margin      :   factor added to MTOW computation to account for uncertainty; may be an array
+        method      :   str specifying the fixed-point update
+                            "anderson" Anderson acceleration (depth 1, per design)
+                            "damped" damped successive substitution
+        tol         :   convergence tolerance on the relative MTOW residual [-]
+        max_iter    :   maximum number of iterations, at least 1 [-]
+        damping     :   relaxation factor of the damped update [-]
+        kwargs      :   momentum theory model coefficients passed to compute_subsystemMasses
+                        (kappa, Cla, Cd_coeffs); scalars or arrays, e.g. uncertainty samples
 
         outputs
         ------
         self.reqs["MTOW"]   :   max takeoff weight of the aircraft [kg]
+        self.subsystem      :   dictionary of subsystem masses [kg]
+        self.P_hover        :   total hover power at MTOW [W]
+        self.residuals      :   list of the max relative MTOW residual at each iteration [-]
+        self.converged      :   bool (or array of bool per design) indicating MTOW convergence
+        self.iter           :   iteration counter [-]
 
         """
 
+        if method not in ("anderson", "damped"):
+            raise ValueError("Inappropriate MTOW update selected. Available methods include 'anderson' and 'damped'.")
+        if max_iter < 1:
+            raise ValueError(f"Inappropriate max_iter ({max_iter}) selected. At least one iteration is required.")
+
         if self.iter == 1:
             # first guess of MTOW assumes payload mass fraction is 15%
-            self.reqs["MTOW"] = {"value": self.reqs["payload"]["value"] / 0.15 * margin, "units": "kg"}
+            self.reqs["MTOW"] = add_dictEntry("MTOW", self.reqs["payload"]["value"] / 0.15 * margin, "kg")
 
-        else:
-            self.reqs["MTOW"]["value"] = 0  #reset MTOW for new calc
+        # sea level conditions for hover power
+        atmos = get_atmos(0)
+
+        MTOW = np.asarray(self.reqs["MTOW"]["value"], dtype=float)
+        MTOW_prev = res_prev = None
+        self.residuals = []
+
+        for _ in range(max_iter):
 
             # loop through vehicle subsystems and sum weights
-            for key, value in self.subsystem.items():
-                self.reqs["MTOW"]["value"] += self.subsystem[key][mass] * margin
+            masses, P_hover = compute_subsystemMasses(MTOW, self.reqs, self.subsystem_params, self.prop_params,
+                                                      atmos["rho"], atmos["a"], **kwargs)
+            res = sum(masses.values()) * margin - MTOW
+            res_rel = np.abs(res) / MTOW
+            self.residuals.append(float(np.max(res_rel)))
+
+            if self.residuals[-1] < tol:
+                break
+
+            # fixed-point update; Anderson reduces to a secant step on the residual of each design
+            MTOW_new = MTOW + damping * res
+            if method == "anderson" and res_prev is not None:
+                dres = res - res_prev
+                secant = np.abs(dres) > 1e-12 * MTOW
+                MTOW_new = np.where(secant, MTOW - res * (MTOW - MTOW_prev) / np.where(secant, dres, 1), MTOW_new)
+
+            MTOW_prev, res_prev = MTOW, res
+            MTOW = np.maximum(MTOW_new, 1e-3 * MTOW)  # keep the iterate physical
+            self.iter += 1
+        else:
+            # not converged: keep the iterate the last subsystem masses were computed at
+            MTOW = MTOW_prev
+
+        PROFILER.count("MTOW_iterations", len(self.residuals))
+
+        self.converged = (res_rel < tol)[()]
+        if not np.all(self.converged):
+            warnings.warn(f"MTOW did not converge for {np.size(res_rel) - np.count_nonzero(res_rel < tol)} "
+                          f"design(s) after {max_iter} iterations; see Aircraft.converged.", RuntimeWarning,
+                          stacklevel=3)  # the caller of the PROFILER wrapper
+
+        self.reqs["MTOW"]["value"] = MTOW[()]
+        self.subsystem = {key: add_dictEntry(key, mass[()], "kg") for key, mass in masses.items()}
+        self.P_hover = add_dictEntry("P_hover", np.asarray(P_hover)[()], "W")
 
     def display_specs(self):
         """"
@@ -97,9 +188,27 @@ class Aircraft: # make dataclass?
         print(f"-------------------------------\n")
 
         for key, value in self.reqs.items():
-            print(f"{key:15}: \t{round(value["value"],1):10} {value["units"]}\n")
+            display_value, units = self.get_displayValue(key)
+            print(f"{key:15}: \t{format_value(display_value, 1):10} {units}\n")
 
-    def output_specs(self, filepath, filename):
+    def get_displayValue(self, key):
+        """
+        This function converts a requirement from the internal units back to the units of the config
+        (MTOW in the units of the payload) for output.
+
+        Outputs
+        -----
+        value       :   requirement value in the display units
+        units       :   str specifying the display units
+        """
+
+        entry = self.reqs[key]
+        default = self.display_units.get("payload", entry["units"]) if key == "MTOW" else entry["units"]
+        units = self.display_units.get(key, default)
+
+        return entry["value"] * get_unitFactor(entry["units"], units), units
+
+    def output_specs(self, filepath, filename, store=None):
         """
         This function exports the aircraft specifications to a comma deliminted file.
 
@@ -107,8 +216,14 @@ class Aircraft: # make dataclass?
         ------
         filepath    : string that specifies the relative filepath for the csv file.
         filename    : filename for the csv file.        
+        store       : optional ResultsStore; when given, the specifications are appended to the store as
+                      one record (buffered, bulk written) instead of overwriting a csv file per design.
         """
-        
+
+        if store is not None:
+            store.append_design(aircraft=self, name=filename)
+            return
+
         # Create 'output' folder to export data to
         full_path = filepath + "/output/" + filename + ".csv"
 
@@ -128,8 +243,9 @@ class Aircraft: # make dataclass?
                 writer.writeheader()
 
                 # Write the data rows
-                for key, value in self.reqs.items():
-                    writer.writerow({'Specification': key, 'Value': value["value"], 'Units': value["units"]})
+                for key in self.reqs:
+                    value, units = self.get_displayValue(key)
+                    writer.writerow({'Specification': key, 'Value': value, 'Units': units})
 
             print(f"Successfully created/overwritten '{full_path}'")
             print(f"File size: {os.path.getsize(full_path)} bytes")
@@ -0,0 +1,210 @@
+"""
+This class holds the lift and drag polars of an airfoil tabulated over angle of attack x Reynolds number
+x Mach number and answers batched Cl/Cd queries by vectorized multilinear interpolation (see
+interpolate_multilinear), e.g. at every radial station of millions of rotor operating points at once.
+
+Polars are parsed from a text or CSV file once. The parsed tables are written to a compact binary cache
+next to the file (<file>.cache.npy and <file>.cache.json), which later runs memory-map instead of parsing
+the text again, and load() returns one shared polar per file and process.
+
+Polar file format
+--------
+One header row naming the columns, then one row per tabulated point; comma or whitespace delimited,
+lines starting with '#' are ignored. Every (alpha, Re, Mach) combination of the tabulated values must
+be present.
+alpha   :   angle of attack [deg]
+Re      :   Reynolds number [-]; optional, a single Reynolds number if missing
+Mach    :   Mach number [-]; optional, a single Mach number (0) if missing
+Cl      :   lift coefficient [-]
+Cd      :   drag coefficient [-]
+
+Functions
+--------
+- load
+- from_text
+- from_bailey
+- write_text
+- query
+- query_section
+
+Usage
+--------
+polar = AirfoilPolar.load("polars/bailey.csv")
+coeffs = polar.query(alpha, Re, Mach)  # coeffs["Cl"], coeffs["Cd"] with the broadcast shape of the inputs
+prop.run_propLoading("MT", T, rho, a, polar=polar)
+
+Last Revised: 17 October 2026
+"""
+import json
+import os
+from functools import lru_cache
+import numpy as np
+from compute_momentumTheory import CLA, CD_COEFFS
+from interpolate_multilinear import interpolate_multilinear
+from Profiler import PROFILER
+
+# sea level dynamic viscosity of air [kg/(m*s)]
+MU = 1.789e-5
+
+# columns of a polar file; Re and Mach may be omitted
+COLUMNS = ("alpha", "re", "mach", "cl", "cd")
+
+class AirfoilPolar:
+
+    def __init__(self, alpha, Re, Mach, table, name="airfoil"):
+        """
+        This function initializes a polar from its axes and table.
+
+        Inputs
+        -----
+        alpha       :   strictly increasing angles of attack [rad]
+        Re          :   strictly increasing Reynolds numbers [-]
+        Mach        :   strictly increasing Mach numbers [-]
+        table       :   array of shape (len(alpha), len(Re), len(Mach), 2) of (Cl, Cd); may be memory-mapped
+        name        :   str specifying the airfoil name
+        """
+
+        self.axes = {"alpha": np.asarray(alpha, dtype=float), "Re": np.asarray(Re, dtype=float),
+                     "Mach": np.asarray(Mach, dtype=float)}
+        self.table = table
+        self.name = name
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load(path):
+        """
+        This function returns one shared polar per file and process, memory-mapping the binary cache
+        of the file when it is up to date and building it otherwise.
+        """
+
+        stat = os.stat(path)
+        source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        try:
+            with open(f"{path}.cache.json") as file:
+                meta = json.load(file)
+            if meta["source"] == source:
+                table = np.load(f"{path}.cache.npy", mmap_mode="r")
+                return AirfoilPolar(meta["alpha"], meta["Re"], meta["Mach"], table, name=meta["name"])
+        except (OSError, ValueError, KeyError):
+            pass  # missing, stale or unreadable cache
+
+        polar = AirfoilPolar.from_text(path)
+
+        # each file is written under a temporary name and moved into place, the metadata last: readers
+        # never see a partial file, and an interrupted write leaves stale metadata, so the cache is rebuilt
+        tmp = f".{os.getpid()}.tmp"
+        with open(f"{path}.cache.npy{tmp}", "wb") as file:
+            np.save(file, polar.table)
+        os.replace(f"{path}.cache.npy{tmp}", f"{path}.cache.npy")
+        with open(f"{path}.cache.json{tmp}", "w") as file:
+            json.dump({"source": source, "name": polar.name,
+                       **{key: value.tolist() for key, value in polar.axes.items()}}, file)
+        os.replace(f"{path}.cache.json{tmp}", f"{path}.cache.json")
+
+        polar.table = np.load(f"{path}.cache.npy", mmap_mode="r")
+
+        return polar
+
+    @classmethod
+    def from_text(cls, path, name=None):
+        """
+        This function parses a polar file (see module docstring).
+        """
+
+        PROFILER.count("polar_parses")
+
+        with open(path) as file:
+            lines = [line for line in file if line.strip() and not line.lstrip().startswith("#")]
+
+        delimiter = "," if "," in lines[0] else None
+        header = [column.strip().lower() for column in lines[0].split(delimiter)]
+        for column in ("alpha", "cl", "cd"):
+            if column not in header:
+                raise ValueError(f"Polar file '{path}' is missing the '{column}' column. "
+                                 f"Available columns include alpha, Re, Mach, Cl and Cd.")
+
+        data = np.loadtxt(lines[1:], delimiter=delimiter, ndmin=2)
+        columns = {column: data[:, header.index(column)] if column in header else np.zeros(len(data))
+                   for column in COLUMNS}
+        columns["alpha"] = np.radians(columns["alpha"])
+
+        # scatter the rows onto the rectilinear grid of the tabulated values
+        axes, index = zip(*(np.unique(columns[column], return_inverse=True) for column in ("alpha", "re", "mach")))
+        table = np.full(tuple(len(axis) for axis in axes) + (2,), np.nan)
+        table[index] = np.stack([columns["cl"], columns["cd"]], axis=-1)
+        if np.isnan(table).any():
+            raise ValueError(f"Polar file '{path}' must tabulate every (alpha, Re, Mach) combination of its values.")
+
+        return cls(*axes, table, name=name or os.path.splitext(os.path.basename(path))[0])
+
+    @classmethod
+    def from_bailey(cls, alpha=np.radians(np.arange(-10, 20.5, 0.5)), Re=(1e4, 1e7), Mach=(0., 0.9), Cla=CLA,
+                    Cd_coeffs=CD_COEFFS):
+        """
+        This function tabulates the linear lift curve and Bailey's drag curve used by the loading models
+        (see compute_momentumTheory), which depend on neither Reynolds nor Mach number, e.g. as a sample
+        polar or a baseline to compare measured polars against.
+        """
+
+        alpha = np.asarray(alpha, dtype=float)
+        Cl = Cla * alpha
+        Cd = Cd_coeffs[0] + Cd_coeffs[1] * alpha + Cd_coeffs[2] * alpha**2
+        table = np.broadcast_to(np.stack([Cl, Cd], axis=-1)[:, None, None], (len(alpha), len(Re), len(Mach), 2))
+
+        return cls(alpha, Re, Mach, np.array(table), name="bailey")
+
+    def write_text(self, path):
+        """
+        This function writes the polar to a CSV polar file.
+        """
+
+        alpha, Re, Mach = np.meshgrid(*self.axes.values(), indexing="ij")
+        data = np.column_stack([np.degrees(alpha.ravel()), Re.ravel(), Mach.ravel(),
+                                self.table[..., 0].ravel(), self.table[..., 1].ravel()])
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savetxt(path, data, delimiter=",", header="alpha,Re,Mach,Cl,Cd", comments="", fmt="%.10g")
+        print(f"Successfully wrote '{path}'")
+
+    def query(self, alpha, Re, Mach=0.):
+        """
+        This function interpolates the lift and drag coefficients at broadcastable arrays of conditions.
+        Conditions outside the tabulated ranges are held at the nearest tabulated value, e.g. the angles
+        of attack probed by a collective trim beyond the end of the polar.
+
+        Inputs
+        -----
+        alpha       :   angle of attack [rad]
+        Re          :   Reynolds number [-]
+        Mach        :   Mach number [-]
+
+        Outputs
+        -----
+        coeffs      :   dictionary of "Cl" and "Cd" arrays with the broadcast shape of the inputs
+        """
+
+        points = [np.clip(x, axis[0], axis[-1]) for x, axis in zip((alpha, Re, Mach), self.axes.values())]
+        values = interpolate_multilinear(list(self.axes.values()), self.table, points)
+
+        return {"Cl": values[..., 0][()], "Cd": values[..., 1][()]}
+
+    def query_section(self, alpha, rho, U, chord, a, mu=MU):
+        """
+        This function interpolates the coefficients of blade sections from their flow conditions.
+
+        Inputs
+        -----
+        alpha       :   angle of attack [rad]
+        rho         :   air density [kg/m^3]
+        U           :   section velocity [m/s]
+        chord       :   section chord [m]
+        a           :   speed of sound [m/s]
+        mu          :   dynamic viscosity [kg/(m*s)]
+
+        Outputs
+        -----
+        coeffs      :   dictionary of "Cl" and "Cd" arrays (see query)
+        """
+
+        return self.query(alpha, rho * U * chord / mu, U / a)
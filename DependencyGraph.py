@@ -0,0 +1,212 @@
+"""
+This class is a lazily evaluated dependency graph of named quantities. Input nodes hold values; derived
+nodes hold a function of the values of the nodes they depend on. Editing an input only marks its
+downstream nodes stale, and a stale node is recomputed on the next get only if the value of one of its
+dependencies actually changed; a recomputed node whose value comes out unchanged stops the propagation
+(early cutoff), so everything it feeds is reused as is.
+
+Nodes must be added after the nodes they depend on, so insertion order is a topological order.
+
+Functions
+--------
+- add_input
+- add_node
+- set
+- get
+- downstream
+
+Usage
+--------
+graph = DependencyGraph()
+graph.add_input("x", 1.)
+graph.add_node("y", lambda x: 2 * x, deps=("x",))
+graph["x"] = 3.
+graph["y"]  # recomputes y only
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+from Profiler import PROFILER
+
+class _Node:
+
+    __slots__ = ("name", "func", "deps", "children", "index", "value", "version", "dep_versions", "dirty")
+
+    def __init__(self, name, func, deps, index):
+        self.name = name
+        self.func = func
+        self.deps = deps
+        self.children = []
+        self.index = index
+        self.value = None
+        self.version = 0
+        self.dep_versions = None
+        self.dirty = func is not None
+
+
+class DependencyGraph:
+
+    def __init__(self):
+        """
+        This function initializes an empty graph.
+
+        Outputs
+        -----
+        self.nodes          :   dictionary of node name -> node
+        self.evaluations    :   dictionary of node name -> number of times the node was computed
+        """
+
+        self.nodes = dict()
+        self.evaluations = dict()
+
+    def add_input(self, name, value):
+        """
+        This function adds an input node holding a value.
+        """
+
+        node = self._add(name, None, ())
+        node.value = value
+
+    def add_node(self, name, func, deps=()):
+        """
+        This function adds a derived node.
+
+        Inputs
+        -----
+        name        :   str specifying the node name
+        func        :   function called with the values of deps, in order, to compute the node
+        deps        :   sequence of names of already added nodes the node depends on
+        """
+
+        for dep in deps:
+            if dep not in self.nodes:
+                raise ValueError(f"Node '{name}' depends on unknown node '{dep}'; add its dependencies first.")
+
+        node = self._add(name, func, tuple(deps))
+        for dep in node.deps:
+            self.nodes[dep].children.append(node)
+
+    def set(self, name, value):
+        """
+        This function edits an input node and marks its downstream nodes stale. Setting an unchanged
+        value does nothing.
+        """
+
+        node = self._node(name)
+        if node.func is not None:
+            raise ValueError(f"Node '{name}' is derived; only input nodes can be set.")
+        if _equal(node.value, value):
+            return
+
+        node.value = value
+        node.version += 1
+
+        # a stale node's descendants are stale already
+        stack = list(node.children)
+        while stack:
+            child = stack.pop()
+            if not child.dirty:
+                child.dirty = True
+                stack.extend(child.children)
+
+    def get(self, name):
+        """
+        This function returns the value of a node, bringing it and its stale ancestors up to date.
+        """
+
+        node = self._node(name)
+        if not node.dirty:
+            return node.value
+
+        # stale ancestors; the ancestors of an up-to-date node are up to date
+        stale = {node.name: node}
+        stack = [node]
+        while stack:
+            for dep in stack.pop().deps:
+                dep = self.nodes[dep]
+                if dep.dirty and dep.name not in stale:
+                    stale[dep.name] = dep
+                    stack.append(dep)
+
+        for ancestor in sorted(stale.values(), key=lambda ancestor: ancestor.index):
+            self._update(ancestor)
+
+        return node.value
+
+    __getitem__ = get
+    __setitem__ = set
+
+    def __contains__(self, name):
+        return name in self.nodes
+
+    def downstream(self, name):
+        """
+        This function returns the names of every node depending (directly or not) on a node, in
+        topological order.
+        """
+
+        found = dict()
+        stack = list(self._node(name).children)
+        while stack:
+            node = stack.pop()
+            if node.name not in found:
+                found[node.name] = node
+                stack.extend(node.children)
+
+        return [node.name for node in sorted(found.values(), key=lambda node: node.index)]
+
+    def reset_counts(self):
+        self.evaluations = dict()
+
+    def _add(self, name, func, deps):
+        if name in self.nodes:
+            raise ValueError(f"Node '{name}' already exists.")
+
+        node = _Node(name, func, deps, len(self.nodes))
+        self.nodes[name] = node
+
+        return node
+
+    def _node(self, name):
+        if name not in self.nodes:
+            raise KeyError(f"Unknown node '{name}'.")
+
+        return self.nodes[name]
+
+    def _update(self, node):
+        """
+        This function recomputes a stale node if any of its dependencies changed since it was last computed.
+        """
+
+        dep_versions = tuple(self.nodes[dep].version for dep in node.deps)
+        if dep_versions != node.dep_versions:
+            value = node.func(*(self.nodes[dep].value for dep in node.deps))
+            self.evaluations[node.name] = self.evaluations.get(node.name, 0) + 1
+            PROFILER.count("graph_evaluations")
+
+            # early cutoff: an unchanged value leaves the version, and so every child, as is
+            if node.dep_versions is None or not _equal(node.value, value):
+                node.version += 1
+            node.value = value
+            node.dep_versions = dep_versions
+
+        node.dirty = False
+
+
+def _equal(a, b):
+    """
+    This function compares node values: mappings (dicts, Quantity) and sequences element-wise, arrays
+    and scalars by value and any other object by identity.
+    """
+
+    if a is b:
+        return True
+    if hasattr(a, "keys") and hasattr(b, "keys"):
+        return set(a.keys()) == set(b.keys()) and all(_equal(a[key], b[key]) for key in a.keys())
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, (np.ndarray, np.generic, int, float, str, bool)) and \
+            isinstance(b, (np.ndarray, np.generic, int, float, str, bool)):
+        return bool(np.array_equal(a, b))
+
+    return False
@@ -5,28 +5,44 @@ Attributes
 --------
 - mission profile
 
+Classes
+--------
+- Mission           :   one mission profile stored as packed segment arrays
+- MissionLibrary    :   many missions (e.g. a fleet's route library) stored as ragged, offset-indexed arrays
+
 
 Functions
 --------
+- from arrays
 - input segments
+- stream energy
+- simulate energy
 - plot trajectory
+- export trajectories
 
 
 Author: Matt Asper (matt.asper101@gmail.com)
-Last Revised: 23 December 2025
+Last Revised: 17 October 2026
 """
 
-from ambiance import Atmosphere
-from read_yml import read_yml
+import os
+from read_yml import read_yml, iter_yml, thaw
 from pathlib import Path
-import plotly.graph_objects as go
 import numpy as np
 from compute_distance import compute_distance
-from get_atmos import get_atmos
+from decimate_minmax import decimate_minmax
+from compute_missionPower import compute_missionPower
+from get_atmos import get_atmos_segments, query_atmos
+from add_dictEntry import add_dictEntry
+from Profiler import PROFILER
+
+# gravitational acceleration [m/s^2]
+G = 9.81
 
 class Mission:
 
-    def __init__(self, run_mode):
+    @PROFILER.profile("mission_build")
+    def __init__(self, run_mode, config_path="configs/group1_quad.yml", config_params=None):
         """
         This function initializes the mission profile by querying the user and saving mission attributes to self.
 
@@ -34,34 +50,90 @@ class Mission:
         Inputs
         -----
         run_mode            :   str specifying how to run the mission initialization; "manual" or "auto"
+        config_path         :   path to the .yml config file used in "auto" mode
+        config_params       :   already parsed config dictionary; overrides config_path in "auto" mode
         
         Outputs
         -----
+        self.names          :   list of segment names
+        self.durations      :   array of segment durations [s]
+        self.velocity       :   (segment x dimension) array of segment velocities [m/s]
+        self.displacement   :   (segment x dimension) array of segment displacements [m]
+        self.start, self.end:   (segment x dimension) arrays of segment start and end positions [m]
+        self.atmos          :   dictionary of arrays of segment-averaged atmospheric quantities
         self.segments       :   list of mission degments
-        self.segments[i]    :   dictionary of segment_i detailing mission attributes
+        self.segments[i]    :   dictionary of segment_i detailing mission attributes; array entries
+                                are views of the packed arrays above
         """
 
         if run_mode == "manual":
             #TODO: write code to query the user to input mission params.
             pass
         elif run_mode == "auto":
-            full_path = Path("configs/group1_quad.yml")  # path to .yml config file
-            config_params = read_yml(full_path)
-            self.segments = config_params["mission"]["segments"]
-            
-            # loop through segments to compute distances travelled
-            for i in range(len(self.segments)):
-                V = np.array(self.segments[i]["Velocity"])
-                self.segments[i]["Velocity"] = V  # convert Velocity to np array
-                dt = float(self.segments[i]["duration"])
-                self.segments[i]["Displacement"] = compute_distance(dt, V)  # compute distance traveled in segment
-            
+            if config_params is None:
+                full_path = Path(config_path)  # path to .yml config file
+                config_params = read_yml(full_path)
+            segments = config_params["mission"]["segments"]
+
+            # pack segments into arrays
+            self.names = [seg["name"] for seg in segments]
+            self.durations = np.array([float(seg["duration"]) for seg in segments])
+            self.velocity = np.array([seg["Velocity"] for seg in segments], dtype=float)
+
+            # compute distances travelled in every segment at once
+            self.displacement = compute_distance(self.durations[:, None], self.velocity)
+
             # find positions of segment end points
-            self.find_positions()  
-            
-            # get atmosphere quantities at each mission segment
-            for i in range(len(self.segments)):
-                self.segments[i]["atmos"] = get_atmos([self.segments[i]["Start"][1], self.segments[i]["End"][1]])
+            self.find_positions()
+
+            # get atmosphere quantities averaged over every mission segment
+            self.atmos = get_atmos_segments(self.start[:, 1], self.end[:, 1])
+
+            self.pack_segments(segments)
+
+    @classmethod
+    def from_arrays(cls, segments, durations, velocity, displacement, start, end, atmos):
+        """
+        This function assembles a mission from already computed segment arrays (e.g. the cached nodes of
+        a DependencyGraph) without recomputing displacements, positions or the atmosphere.
+
+        Inputs
+        -----
+        segments    :   list of segment config dictionaries
+        durations, velocity, displacement, start, end, atmos    :   packed segment arrays (see __init__)
+
+        Outputs
+        -----
+        mission     :   Mission
+        """
+
+        mission = cls.__new__(cls)
+        mission.names = [seg["name"] for seg in segments]
+        mission.durations = np.asarray(durations, dtype=float)
+        mission.velocity = np.asarray(velocity, dtype=float)
+        mission.displacement = np.asarray(displacement, dtype=float)
+        mission.start = np.asarray(start, dtype=float)
+        mission.end = np.asarray(end, dtype=float)
+        mission.atmos = {key: np.asarray(value, dtype=float) for key, value in atmos.items()}
+        mission.pack_segments(segments)
+
+        return mission
+
+    def pack_segments(self, segments):
+        """
+        This function builds the per-segment dictionaries, whose array entries view the packed arrays.
+        """
+
+        self.segments = []
+        for i, seg in enumerate(segments):
+            self.segments.append({
+                **thaw(seg),  # mutable copy; the shared config is read-only
+                "Velocity": self.velocity[i],
+                "Displacement": self.displacement[i],
+                "Start": self.start[i],
+                "End": self.end[i],
+                "atmos": {key: float(value[i]) for key, value in self.atmos.items()},
+            })
 
     def input_segments(self):
         """
@@ -74,49 +146,212 @@ class Mission:
     
     def find_positions(self):
         """
-        This function finds the global 'Start' and 'End' coordinates of each mission.
-        Coordinates are relative to 'Start' of the first segment.
+        This function finds the global 'Start' and 'End' coordinates of each mission segment with a
+        single cumulative sum. Coordinates are relative to 'Start' of the first segment.
+
+        Inputs
+        -----
+        self.displacement   :   (segment x dimension) array of segment displacements
 
         Outputs
         -----
-        self.segments[i]["Start"]   :   position of beginning of segment i
-        self.segments[i]["End"]     :   position of End of segment i
+        self.start          :   (segment x dimension) array of segment start positions
+        self.end            :   (segment x dimension) array of segment end positions
         """
-        
-        # initialize 'Start' and 'End' arrays
-        self.segments[0]["Start"] = np.zeros(self.segments[0]["Displacement"].shape)
-        self.segments[0]["End"] = np.zeros(self.segments[0]["Displacement"].shape)
+
+        self.end = np.cumsum(self.displacement, axis=0)
+        self.start = np.concatenate([np.zeros((1, self.displacement.shape[1])), self.end[:-1]])
+
+    def stream_energy(self, MTOW, prop, E_batt, dt=1., chunk_size=100000, envelope=None, **kwargs):
+        """
+        This function discretizes every mission segment at a time step 'dt' and integrates the battery
+        energy and state of charge. Steps are generated and evaluated in chunks, and each chunk is yielded
+        before the next one is built, so arbitrarily long or finely resolved missions run in bounded memory.
+
+        Inputs
+        -----
+        MTOW        :   vehicle mass [kg]
+        prop        :   dictionary of propeller parameters (see compute_missionPower)
+        E_batt      :   usable battery energy [J]
+        dt          :   time step [s]; the last step of each segment is shortened to fit its duration
+        chunk_size  :   number of time steps per yielded chunk
+        envelope    :   optional PowerEnvelope; power is interpolated from the map instead of computed
+        kwargs      :   additional keyword arguments passed to compute_missionPower
+
+        Outputs
+        -----
+        chunk               :   generator of dictionaries of numpy arrays, one entry per time step
+        chunk["t"]          :   time at the end of the step [s]
+        chunk["dt"]         :   step length [s]
+        chunk["segment"]    :   index of the mission segment [-]
+        chunk["x"]          :   horizontal position at the step midpoint [m]
+        chunk["alt"]        :   altitude at the step midpoint [m]
+        chunk["P"]          :   electrical power drawn from the battery [W]
+        chunk["E"]          :   cumulative energy drawn from the battery [J]
+        chunk["SOC"]        :   battery state of charge [-]
+        """
+
+        durations, V, start = self.durations, self.velocity, self.start
+
+        # every segment, from its start to its end altitude, must lie within the power map
+        if envelope is not None:
+            names = np.asarray([f"segment '{name}'" for name in self.names])[:, None]
+            envelope.check_range(V[:, 0, None], np.stack([start[:, 1], self.end[:, 1]], axis=1), MTOW * G,
+                                 Vz=V[:, 1, None], names=names)
+
+        # step counts and global step offsets of each segment
+        n_steps = np.ceil(durations / dt).astype(np.int64)
+        offsets = np.concatenate([[0], np.cumsum(n_steps)])
+        t_start = np.concatenate([[0], np.cumsum(durations)])
+
+        E = 0.
+        for k0 in range(0, offsets[-1], chunk_size):
+            k = np.arange(k0, min(k0 + chunk_size, offsets[-1]))
+
+            # locate each step in its segment
+            seg = np.searchsorted(offsets, k, side="right") - 1
+            t_local = (k - offsets[seg]) * dt
+            step = np.minimum(dt, durations[seg] - t_local)
+
+            # position and atmosphere at the step midpoints
+            x = start[seg, 0] + V[seg, 0] * (t_local + step / 2)
+            alt = start[seg, 1] + V[seg, 1] * (t_local + step / 2)
+            atmos = query_atmos(alt)
+
+            # power and energy
+            if envelope is not None:
+                P = envelope.query(V[seg, 0], alt, MTOW * G, Vz=V[seg, 1])
+            else:
+                P = compute_missionPower(MTOW * G, V[seg, 0], V[seg, 1], atmos["rho"], atmos["a"], prop, **kwargs)
+            PROFILER.count("mission_steps", len(k))
+            E_chunk = E + np.cumsum(P * step)
+            E = E_chunk[-1]
+
+            yield {
+                "t": t_start[seg] + t_local + step,
+                "dt": step,
+                "segment": seg,
+                "x": x,
+                "alt": alt,
+                "P": P,
+                "E": E_chunk,
+                "SOC": 1 - E_chunk / E_batt,
+            }
+
+    @PROFILER.profile("mission_energy")
+    def simulate_energy(self, MTOW, prop, E_batt, dt=1., chunk_size=100000, keep_history=True, envelope=None, **kwargs):
+        """
+        This function runs stream_energy over the whole mission and summarizes the energy use of each segment.
+
+        Inputs
+        -----
+        MTOW, prop, E_batt, dt, chunk_size, envelope, kwargs  :   see stream_energy
+        keep_history    :   bool; store the full time history under 'history'
+
+        Outputs
+        -----
+        self.segments[i]["energy"]  :   battery energy drawn in segment i [J]
+        self.energy                 :   dictionary of mission energy results
+        self.energy["E"]            :   total battery energy drawn [J]
+        self.energy["SOC"]          :   final battery state of charge [-]
+        self.energy["P_max"]        :   peak electrical power [W]
+        self.history                :   dictionary of time history arrays (see stream_energy), if keep_history
+        """
+
+        E_seg = np.zeros(len(self.segments))
+        P_max = 0.
+        E = 0.
+        history = []
+
+        for chunk in self.stream_energy(MTOW, prop, E_batt, dt=dt, chunk_size=chunk_size, envelope=envelope, **kwargs):
+            E_seg += np.bincount(chunk["segment"], weights=chunk["P"] * chunk["dt"], minlength=len(self.segments))
+            P_max = max(P_max, float(np.max(chunk["P"])))
+            E = float(chunk["E"][-1])
+            if keep_history:
+                history.append(chunk)
 
         for i in range(len(self.segments)):
-            if not i == 0: 
-                self.segments[i]["Start"] = self.segments[i-1]["End"]
-            self.segments[i]["End"] = self.segments[i]["Start"] + self.segments[i]["Displacement"]
+            self.segments[i]["energy"] = E_seg[i]
+
+        self.energy = dict()
+        self.energy["E"] = add_dictEntry("E", E, "J")
+        self.energy["SOC"] = add_dictEntry("SOC", 1 - E / E_batt, "-")
+        self.energy["P_max"] = add_dictEntry("P_max", P_max, "W")
+
+        if keep_history and history:
+            self.history = {key: np.concatenate([chunk[key] for chunk in history]) for key in history[0]}
+        elif keep_history:
+            # a mission without time steps (no segments, or only zero-duration ones) has an empty history
+            self.history = {key: np.zeros(0, dtype=np.int64 if key == "segment" else float)
+                            for key in ("t", "dt", "segment", "x", "alt", "P", "E", "SOC")}
 
-    def plot_trajectory(self):
+        return self
+
+    def plot_trajectory(self, mode="webgl", max_points=20000, show=True):
         """
         This function plots the trajectory of the aircraft mission.
+
+        Inputs
+        -----
+        mode        :   str specifying the plot type
+                            "webgl" one WebGL trace for the whole path, colored per point by segment
+                            "scatter" one SVG trace per segment
+        max_points  :   maximum number of points drawn in "webgl" mode; longer paths are min/max decimated
+        show        :   bool; open the figure
+
+        Outputs
+        -----
+        fig         :   plotly figure
         """
 
-        # AppEnd mission segment trajectories to dX array
-        dX = np.array([0, 0])
+        import plotly.graph_objects as go
 
-        for seg_i in self.segments:
-            dX = np.vstack([dX, dX[-1]+seg_i["Displacement"]])
-    
         # Create plotly figure
-        fig = go.Figure()   
-
-        # Loop through dX and plot trajectory
-        for i in range(len(dX)-1):
-            X = [self.segments[i]["Start"][0], self.segments[i]["End"][0]]
-            Y = [self.segments[i]["Start"][1], self.segments[i]["End"][1]]
-            fig.add_trace(go.Scatter(
-                x=X, 
-                y=Y, 
-                mode='lines', 
-                name=f'{self.segments[i]["name"]}' # Name for the legEnd
+        fig = go.Figure()
+
+        if mode == "webgl":
+            # use the simulated time history when available, otherwise the segment end points
+            if hasattr(self, "history"):
+                X, Y, seg = self.history["x"], self.history["alt"], self.history["segment"]
+            else:
+                X = np.concatenate([[self.start[0, 0]], self.end[:, 0]])
+                Y = np.concatenate([[self.start[0, 1]], self.end[:, 1]])
+                seg = np.concatenate([[0], np.arange(len(self.names))])
+
+            idx = decimate_minmax(Y, max_points)
+            names = np.asarray(self.names)
+
+            fig.add_trace(go.Scattergl(
+                x=X[idx],
+                y=Y[idx],
+                mode='lines+markers',
+                line=dict(color='lightgray'),
+                marker=dict(
+                    color=seg[idx],
+                    colorscale='Viridis',
+                    cmin=0,
+                    cmax=max(len(names) - 1, 1),
+                    colorbar=dict(title="Segment", tickvals=np.arange(len(names)), ticktext=names),
+                ),
+                hovertext=names[seg[idx]],
+                showlegend=False,
             ))
-            
+
+        elif mode == "scatter":
+            # Loop through segments and plot trajectory
+            for i in range(len(self.segments)):
+                X = [self.segments[i]["Start"][0], self.segments[i]["End"][0]]
+                Y = [self.segments[i]["Start"][1], self.segments[i]["End"][1]]
+                fig.add_trace(go.Scatter(
+                    x=X,
+                    y=Y,
+                    mode='lines',
+                    name=f'{self.segments[i]["name"]}' # Name for the legEnd
+                ))
+
+        else:
+            raise ValueError("Inappropriate plot mode selected. Available modes include 'webgl' and 'scatter'.")
+
         # Add labels
         fig.update_layout(
             xaxis_title="X Displacement [m]",
@@ -124,7 +359,210 @@ class Mission:
         )
 
         # Show plot
-        fig.show()
+        if show:
+            fig.show()
+
+        return fig
+
+
+def export_trajectories(missions, filepath, fmt="png", max_workers=None, **kwargs):
+    """
+    This function writes static trajectory plots of many missions in parallel (headless, via kaleido).
+
+    Inputs
+    -----
+    missions    :   dictionary of filename -> Mission
+    filepath    :   str specifying the output directory
+    fmt         :   image format; "png" or "svg"
+    max_workers :   number of worker processes; None uses every core
+    kwargs      :   additional keyword arguments passed to plot_trajectory
+
+    Outputs
+    -----
+    paths       :   list of the written file paths
+    """
+
+    if fmt not in ("png", "svg"):
+        raise ValueError("Inappropriate image format selected. Available formats include 'png' and 'svg'.")
+
+    os.makedirs(filepath, exist_ok=True)
+    jobs = [(mission, os.path.join(filepath, f"{name}.{fmt}"), kwargs) for name, mission in missions.items()]
+
+    if max_workers == 1:
+        return [_export_trajectory(job) for job in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_export_trajectory, jobs))
+
+
+def _export_trajectory(job):
+    """
+    This function writes the trajectory plot of one mission to an image file.
+    """
+
+    mission, path, kwargs = job
+    fig = mission.plot_trajectory(show=False, **kwargs)
+    fig.write_image(path)
+
+    return path
+
+
+class MissionLibrary:
+
+    def __init__(self, durations, velocity, offsets, names=None):
+        """
+        This function initializes a library of many missions stored as ragged, offset-indexed arrays;
+        the segments of mission m are rows offsets[m]:offsets[m+1] of the packed segment arrays.
+
+        Inputs
+        -----
+        durations           :   array of segment durations of every mission, concatenated [s]
+        velocity            :   (segment x dimension) array of segment velocities [m/s]
+        offsets             :   array of length n_missions + 1 of segment offsets of each mission
+        names               :   optional list of mission names
+
+        Outputs
+        -----
+        self.mission        :   array of the mission index of every segment
+        self.displacement   :   (segment x dimension) array of segment displacements [m]
+        self.start, self.end:   (segment x dimension) arrays of segment start and end positions [m],
+                                relative to the start of each mission
+        self.atmos          :   dictionary of arrays of segment-averaged atmospheric quantities
+        """
+
+        self.durations = np.asarray(durations, dtype=float)
+        self.velocity = np.asarray(velocity, dtype=float)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.names = names if names is not None else [f"mission_{m}" for m in range(len(self.offsets) - 1)]
+
+        counts = np.diff(self.offsets)
+        if np.any(counts < 1):
+            raise ValueError("Every mission in the library must have at least one segment.")
+
+        self.mission = np.repeat(np.arange(len(counts)), counts)
+        self.displacement = compute_distance(self.durations[:, None], self.velocity)
+
+        self.find_positions()
+
+        # segment-averaged atmosphere, in chunks to bound the interpolation memory
+        chunk = 10000
+        atmos = [get_atmos_segments(self.start[i:i+chunk, 1], self.end[i:i+chunk, 1])
+                 for i in range(0, len(self.durations), chunk)]
+        self.atmos = {key: np.concatenate([a[key] for a in atmos]) for key in atmos[0]}
+
+    @classmethod
+    def from_segments(cls, missions, names=None):
+        """
+        This function builds a library from a list of missions, each a list of segment dictionaries
+        with "duration" and "Velocity" (as in the .yml mission config).
+        """
+
+        segments = [seg for mission in missions for seg in mission]
+        durations = [float(seg["duration"]) for seg in segments]
+        velocity = [seg["Velocity"] for seg in segments]
+        offsets = np.concatenate([[0], np.cumsum([len(mission) for mission in missions])])
+
+        return cls(durations, velocity, offsets, names=names)
+
+    @classmethod
+    def from_configs(cls, paths):
+        """
+        This function builds a library from .yml config files; every document of a multi-document
+        file holding a "mission" section adds one mission.
+        """
+
+        missions = []
+        names = []
+        for path in paths:
+            for i, config_params in enumerate(iter_yml(path, validate=False)):
+                if "mission" in config_params:
+                    missions.append(config_params["mission"]["segments"])
+                    names.append(f"{Path(path).stem}[{i}]")
+
+        return cls.from_segments(missions, names=names)
+
+    @property
+    def n_missions(self):
+        return len(self.offsets) - 1
+
+    def find_positions(self):
+        """
+        This function finds the 'Start' and 'End' coordinates of every segment of every mission with one
+        cumulative sum over the whole library, re-based to the start of each mission.
+        """
+
+        cumulative = np.cumsum(self.displacement, axis=0)
+        base = cumulative[self.offsets[:-1]] - self.displacement[self.offsets[:-1]]
+
+        self.end = cumulative - base[self.mission]
+        self.start = self.end - self.displacement
+
+    def summarize(self):
+        """
+        This function reduces the segment arrays to one value per mission.
+
+        Outputs
+        -----
+        summary             :   dictionary of arrays with one entry per mission
+        summary["duration"] :   total mission duration [s]
+        summary["distance"] :   total distance flown [m]
+        summary["alt_max"]  :   maximum altitude relative to the mission start [m]
+        """
+
+        starts = self.offsets[:-1]
+
+        summary = dict()
+        summary["duration"] = np.add.reduceat(self.durations, starts)
+        summary["distance"] = np.add.reduceat(np.linalg.norm(self.displacement, axis=1), starts)
+        summary["alt_max"] = np.maximum.reduceat(np.maximum(self.start[:, 1], self.end[:, 1]), starts)
+
+        return summary
+
+    def evaluate(self, MTOW, prop, E_batt, envelope=None, **kwargs):
+        """
+        This function evaluates the battery energy of every candidate vehicle on every mission at once.
+        Power is evaluated at the segment-averaged atmosphere and is constant over each segment.
+
+        Inputs
+        -----
+        MTOW        :   scalar or array of candidate vehicle masses [kg]
+        prop        :   dictionary of propeller parameters (see compute_missionPower)
+        E_batt      :   scalar or array (matching MTOW) of usable battery energies [J]
+        envelope    :   optional PowerEnvelope; power is interpolated from the map instead of computed
+        kwargs      :   additional keyword arguments passed to compute_missionPower
+
+        Outputs
+        -----
+        results             :   dictionary of (vehicle x mission) arrays (mission arrays for scalar MTOW)
+        results["E"]        :   battery energy drawn over the mission [J]
+        results["SOC"]      :   final battery state of charge [-]
+        results["P_max"]    :   peak electrical power [W]
+        results["feasible"] :   bool; the mission is flown within the usable battery energy
+        """
+
+        W = np.asarray(MTOW, dtype=float)[..., None] * G
+        E_batt = np.asarray(E_batt, dtype=float)[..., None]
+
+        if envelope is not None:
+            # segment mid altitudes stand in for the segment-averaged atmosphere
+            alt = 0.5 * (self.start[:, 1] + self.end[:, 1])
+            P = envelope.query(self.velocity[:, 0], alt, W, Vz=self.velocity[:, 1])
+        else:
+            P = compute_missionPower(W, self.velocity[:, 0], self.velocity[:, 1],
+                                     self.atmos["rho"], self.atmos["a"], prop, **kwargs)
+
+        starts = self.offsets[:-1]
+        E = np.add.reduceat(P * self.durations, starts, axis=-1)
+
+        results = dict()
+        results["E"] = E
+        results["SOC"] = 1 - E / E_batt
+        results["P_max"] = np.maximum.reduceat(P, starts, axis=-1)
+        results["feasible"] = E <= E_batt
+
+        return results
 
 if __name__=="__main__":
     mission = Mission(run_mode="auto")
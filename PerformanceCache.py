@@ -0,0 +1,257 @@
+"""
+This class is a persistent, content-addressed cache of propeller performance results
+(Propeller.run_propLoading). Each entry is keyed by a SHA-256 hash of
+- the loading model name and its keyword arguments
+- the propeller params (name, value and units of every entry) and blade geometry
+- the operating condition (T, rho, a)
+- the code version, a hash of the source of the propeller loading models
+
+so any change of inputs or model code produces a new key and bypasses stale entries automatically.
+
+Entries are stored in one sqlite database, which may be shared by many processes: the database runs in
+WAL mode with a busy timeout, every write is a single transaction and entries are immutable once
+written. The cache size is bounded by 'max_bytes'; least recently used entries are evicted first. The
+total size is kept in a one-row meta table, updated in the same transaction as every insert and eviction.
+Hits only write an entry's access time once it is older than 'access_interval', so workers that mostly
+read do not serialize on the database write lock.
+
+Functions
+--------
+- open
+- make_key
+- get
+- put
+- clear
+- stats
+
+Last Revised: 17 October 2026
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from functools import lru_cache
+import numpy as np
+from AirfoilPolar import AirfoilPolar
+
+# modules whose source defines the propeller performance results
+CODE_MODULES = ("Propeller.py", "compute_momentumTheory.py", "compute_BET.py", "compute_BEMT.py", "AirfoilPolar.py",
+                "interpolate_multilinear.py")
+
+class PerformanceCache:
+
+    def __init__(self, path, max_bytes=2**30, timeout=30., access_interval=60.):
+        """
+        This function opens (or creates) the cache database.
+
+        Inputs
+        -----
+        path        :   str specifying the sqlite database file
+        max_bytes   :   maximum total size of the cached results [bytes]
+        timeout     :   time to wait for a lock held by another process [s]
+        access_interval :   resolution of the least recently used order; a hit updates the access time
+                            of an entry only when it is older than this [s]
+        """
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.access_interval = access_interval
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS results ("
+                               "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                               "created REAL NOT NULL, accessed REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta ("
+                               "id INTEGER PRIMARY KEY CHECK (id = 0), total_bytes INTEGER NOT NULL)")
+            connection.execute("INSERT OR IGNORE INTO meta (id, total_bytes) "
+                               "SELECT 0, COALESCE(SUM(size), 0) FROM results")
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def open(path, max_bytes=2**30):
+        """
+        This function returns one shared cache per database path and process (e.g. inside pool workers).
+        """
+
+        return PerformanceCache(path, max_bytes=max_bytes)
+
+    def make_key(self, model, params, T, rho, a, blade=None, **kwargs):
+        """
+        This function hashes a propeller loading evaluation into a cache key.
+
+        Inputs
+        -----
+        model       :   str specifying the loading model
+        params      :   dictionary of propeller parameters
+        T, rho, a   :   operating condition
+        blade       :   optional blade geometry dictionary (BET/BEMT)
+        kwargs      :   keyword arguments of the loading model
+
+        Outputs
+        -----
+        key         :   hex digest
+        """
+
+        digest = hashlib.sha256()
+        digest.update(get_codeVersion().encode())
+        _update_hash(digest, {"model": model, "params": params, "T": T, "rho": rho, "a": a,
+                              "blade": blade, "kwargs": kwargs})
+
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        This function returns the cached result of 'key', or None on a miss.
+        """
+
+        connection = self._connect()
+        row = connection.execute("SELECT value, accessed FROM results WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        now = time.time()
+        if now - row[1] > self.access_interval:
+            with connection:
+                connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+
+        return pickle.loads(row[0])
+
+    def put(self, key, value):
+        """
+        This function stores 'value' under 'key' and evicts least recently used entries beyond max_bytes.
+        """
+
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+
+        connection = self._connect()
+        with connection:
+            inserted = connection.execute("INSERT OR IGNORE INTO results (key, value, size, created, accessed) "
+                                          "VALUES (?, ?, ?, ?, ?)", (key, blob, len(blob), now, now)).rowcount
+            if not inserted:
+                return
+
+            connection.execute("UPDATE meta SET total_bytes = total_bytes + ? WHERE id = 0", (len(blob),))
+            total = connection.execute("SELECT total_bytes FROM meta WHERE id = 0").fetchone()[0]
+            if total > self.max_bytes:
+                self._evict(connection, total - self.max_bytes)
+
+    def clear(self):
+        """
+        This function removes every cached entry.
+        """
+
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results")
+            connection.execute("UPDATE meta SET total_bytes = 0 WHERE id = 0")
+
+    def stats(self):
+        """
+        This function returns the number of entries, their total size [bytes] and this process's hits/misses.
+        """
+
+        connection = self._connect()
+        n = connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        size = connection.execute("SELECT total_bytes FROM meta WHERE id = 0").fetchone()[0]
+
+        return {"entries": n, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+    def _evict(self, connection, n_bytes):
+        """
+        This function deletes the least recently used entries totalling at least 'n_bytes' and updates the
+        total size, inside the caller's transaction.
+        """
+
+        freed = 0
+        keys = []
+        for key, size in connection.execute("SELECT key, size FROM results ORDER BY accessed"):
+            if freed >= n_bytes:
+                break
+            keys.append((key,))
+            freed += size
+
+        connection.executemany("DELETE FROM results WHERE key = ?", keys)
+        connection.execute("UPDATE meta SET total_bytes = total_bytes - ? WHERE id = 0", (freed,))
+
+    def _connect(self):
+        """
+        This function returns the connection of the current process, reconnecting after a fork.
+        """
+
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+
+        return self._connection
+
+    def __getstate__(self):
+        # connections are per process; reopen after unpickling
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_pid"] = None
+        return state
+
+
+@lru_cache(maxsize=1)
+def get_codeVersion():
+    """
+    This function hashes the source of the propeller loading models, once per process.
+    """
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in CODE_MODULES:
+        with open(os.path.join(root, name), "rb") as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+def _update_hash(digest, value):
+    """
+    This function feeds a canonical encoding of a (nested) value into a hash. Numbers and arrays are
+    hashed by their float64 bytes and shape, so 4, 4.0 and np.float64(4) give the same key.
+    """
+
+    if value is None or isinstance(value, (str, bytes)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+    elif isinstance(value, (bool, int, float, np.bool_, np.number, np.ndarray)):
+        array = np.ascontiguousarray(value, dtype=float)
+        digest.update(f"array{array.shape}:".encode())
+        digest.update(array.tobytes())
+
+    elif isinstance(value, AirfoilPolar):
+        # polars are hashed by their tabulated data, not by the file they were loaded from
+        _update_hash(digest, {"polar": value.name, **value.axes, "table": np.asarray(value.table)})
+
+    elif hasattr(value, "items"):
+        digest.update(b"{")
+        for key, item in sorted(value.items(), key=lambda item: str(item[0])):
+            _update_hash(digest, str(key))
+            _update_hash(digest, item)
+        digest.update(b"}")
+
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _update_hash(digest, item)
+        digest.update(b"]")
+
+    else:
+        raise TypeError(f"Cannot hash value of type {type(value).__name__} for the performance cache.")
@@ -0,0 +1,221 @@
+"""
+This class precomputes the electrical power required (and rotor speed) of a multirotor over a grid of
+airspeed x climb rate x altitude x gross weight once, and answers power queries afterwards by vectorized
+multilinear interpolation (see interpolate_multilinear) instead of re-running the loading model.
+
+Maps are stored compactly as float32 tables in one .npz file together with their axes and the model
+settings they were built with.
+
+Functions
+--------
+- build
+- from_aircraft
+- query
+- check_range
+- save
+- load
+
+Usage
+--------
+envelope = PowerEnvelope.from_aircraft(aircraft, mission=mission, prop=prop)  # axes spanning the mission
+mission.simulate_energy(MTOW, prop_params, E_batt, envelope=envelope)
+
+envelope = PowerEnvelope.from_aircraft(aircraft, V=np.linspace(0, 40, 41), alt=np.linspace(0, 3000, 31))
+P = envelope.query(V=25., Vz=0., alt=1000., W=aircraft.reqs["MTOW"]["value"] * 9.81)
+
+Last Revised: 17 October 2026
+"""
+import json
+import numpy as np
+from compute_missionPower import compute_missionPower
+from compute_momentumTheory import compute_momentumTheory
+from compute_subsystemMasses import PROP_DEFAULTS, SUBSYSTEM_DEFAULTS
+from get_atmos import query_atmos
+from interpolate_multilinear import interpolate_multilinear
+from Propeller import Propeller
+
+# gravitational acceleration [m/s^2]
+G = 9.81
+
+# axes of the map, in table order, and their units
+AXES = {"V": "m/s", "Vz": "m/s", "alt": "m", "W": "N"}
+
+# default climb rates, spanning the climb and descent rates of typical missions [m/s]
+VZ = np.linspace(-2., 2., 9)
+
+class PowerEnvelope:
+
+    def __init__(self, axes, tables, settings=None):
+        """
+        This function initializes a map from its axes and tables.
+
+        Inputs
+        -----
+        axes        :   dictionary of axis name ("V", "Vz", "alt", "W") -> strictly increasing 1-D array
+        tables      :   dictionary of field name ("P", "RPM") -> array over the grid of axes
+        settings    :   dictionary of the model settings the map was built with
+        """
+
+        self.axes = {key: np.asarray(axes[key], dtype=float) for key in AXES}
+        self.tables = {key: np.asarray(value) for key, value in tables.items()}
+        self.settings = settings or dict()
+
+    @classmethod
+    def build(cls, prop, V, alt, W, Vz=VZ, f_e=0.02, kappa=1.15, eta=0.85):
+        """
+        This function evaluates the power model over the full grid in one vectorized call.
+
+        Inputs
+        -----
+        prop        :   dictionary of propeller parameters (see compute_missionPower); the disk area "A" of
+                        a sized propeller is held fixed across the W axis, so power and RPM at every weight
+                        are those of the same rotor
+        V           :   horizontal airspeeds [m/s]
+        alt         :   altitudes [m]
+        W           :   gross weights [N]
+        Vz          :   climb rates [m/s]; defaults to VZ, -2 to 2 m/s
+        f_e, kappa, eta :   power model settings (see compute_missionPower)
+
+        Outputs
+        -----
+        envelope    :   PowerEnvelope
+        """
+
+        axes = {"V": V, "Vz": Vz, "alt": alt, "W": W}
+        axes = {key: np.atleast_1d(np.asarray(value, dtype=float)) for key, value in axes.items()}
+        for key, axis in axes.items():
+            if np.any(np.diff(axis) <= 0):
+                raise ValueError(f"Axis '{key}' of the power envelope must be strictly increasing.")
+
+        # grid with axes in table order
+        V, Vz, alt, W = np.meshgrid(*axes.values(), indexing="ij", sparse=True)
+        atmos = query_atmos(alt)
+
+        P = compute_missionPower(W, V, Vz, atmos["rho"], atmos["a"], prop, f_e=f_e, kappa=kappa, eta=eta)
+
+        # rotor speed at the tip Mach number of prop, on the fixed disk when given
+        params = {key: prop.get(key, default)["value"] for key, default in PROP_DEFAULTS.items()}
+        if "A" in prop:
+            params["A"] = prop["A"]["value"]
+        DL = W / params["A"] if "A" in params else params["DL"]
+        hover = compute_momentumTheory(W, atmos["rho"], atmos["a"], DL, params["sigma"],
+                                       params["Mtip"], params["Np"], kappa=kappa)
+        RPM = np.broadcast_to(hover["RPM"], P.shape)
+
+        tables = {"P": P.astype(np.float32), "RPM": RPM.astype(np.float32)}
+        settings = {"f_e": f_e, "kappa": kappa, "eta": eta,
+                    "prop": {key: float(value) for key, value in params.items()}}
+
+        return cls(axes, tables, settings)
+
+    @classmethod
+    def from_aircraft(cls, aircraft, V=None, alt=None, W=None, Vz=None, mission=None, prop=None, n_alt=21, **kwargs):
+        """
+        This function builds the map of a sized Aircraft with its propeller and subsystem parameters. The
+        rotor is the sized Propeller when given, otherwise the propeller sized by momentum theory for
+        hover at MTOW; its disk is held fixed across the W axis.
+        Axes that are not given are derived from a mission: V and Vz hold every airspeed and climb
+        rate of its segments (and 0), so segment queries fall on the grid, and alt spans its altitudes.
+
+        Inputs
+        -----
+        aircraft    :   Aircraft after compute_MTOW
+        V, alt, Vz  :   axes as in build; V and alt are required without a mission, Vz defaults to VZ
+        W           :   gross weights [N]; defaults to 21 weights from 80% to 120% of MTOW
+        mission     :   optional Mission the map must cover
+        prop        :   optional Propeller sized with momentum theory (see run_pipeline)
+        n_alt       :   number of altitudes of the alt axis derived from the mission [-]
+        kwargs      :   additional keyword arguments passed to build (f_e, kappa)
+        """
+
+        if mission is not None:
+            alts = np.concatenate([mission.start[:, 1], mission.end[:, 1]])
+            if V is None:
+                V = np.unique(np.concatenate([[0.], np.abs(mission.velocity[:, 0])]))
+            if Vz is None:
+                Vz = np.unique(np.concatenate([[0.], mission.velocity[:, 1]]))
+            if alt is None:
+                alt = np.linspace(alts.min(), alts.max(), n_alt) if alts.max() > alts.min() else alts[:1]
+        if V is None or alt is None:
+            raise ValueError("Specify the V and alt axes of the power envelope, or a mission to derive them from.")
+
+        MTOW = float(aircraft.reqs["MTOW"]["value"])
+        if W is None:
+            W = np.linspace(0.8, 1.2, 21) * MTOW * G
+        eta = aircraft.subsystem_params.get("eta", SUBSYSTEM_DEFAULTS["eta"])["value"]
+
+        if prop is None:
+            # the disk area from momentum theory depends only on the thrust and disk loading
+            atmos = query_atmos(0.)
+            prop = Propeller(**{**PROP_DEFAULTS, **aircraft.prop_params})
+            prop.run_momentumTheory(MTOW * G, atmos["rho"], atmos["a"])
+
+        return cls.build(prop.params, V, alt, W, Vz=VZ if Vz is None else Vz, eta=eta, **kwargs)
+
+    def query(self, V, alt, W, Vz=0., field="P"):
+        """
+        This function interpolates a field of the map at arbitrary (broadcastable) query points.
+
+        Inputs
+        -----
+        V           :   horizontal airspeed [m/s]; the magnitude is used
+        alt         :   altitude [m]
+        W           :   gross weight [N]
+        Vz          :   climb rate [m/s]
+        field       :   str specifying the field; "P" [W] or "RPM" [rev/min]
+
+        Outputs
+        -----
+        value       :   interpolated field with the broadcast shape of the query points
+        """
+
+        if field not in self.tables:
+            raise ValueError(f"Inappropriate field selected. Available fields include {', '.join(self.tables)}.")
+
+        self.check_range(V, alt, W, Vz=Vz)
+
+        return interpolate_multilinear(list(self.axes.values()), self.tables[field], (np.abs(V), Vz, alt, W))
+
+    def check_range(self, V, alt, W, Vz=0., names=None):
+        """
+        This function raises a ValueError naming the first axis, and optionally the query point, that
+        falls outside the map.
+
+        Inputs
+        -----
+        V, alt, W, Vz   :   query points, as in query
+        names           :   optional array of names of the query points (e.g. mission segments)
+        """
+
+        points = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (np.abs(V), Vz, alt, W)))
+        for (key, axis), x in zip(self.axes.items(), points):
+            outside = (x < axis[0]) | (x > axis[-1])
+            if np.any(outside):
+                i = np.flatnonzero(outside)[0]
+                where = f" of {np.broadcast_to(names, x.shape).flat[i]}" if names is not None else ""
+                raise ValueError(f"Query {key} = {x.flat[i]:g} {AXES[key]}{where} is outside the power envelope "
+                                 f"axis '{key}' [{axis[0]:g}, {axis[-1]:g}] {AXES[key]}. Rebuild the envelope with a "
+                                 f"wider '{key}' axis, e.g. from_aircraft(..., mission=mission).")
+
+    def save(self, path):
+        """
+        This function writes the map to a compressed .npz file.
+        """
+
+        np.savez_compressed(path, **{f"axis_{key}": value for key, value in self.axes.items()},
+                            **{f"table_{key}": value for key, value in self.tables.items()},
+                            settings=json.dumps(self.settings))
+        print(f"Successfully wrote '{path}'")
+
+    @classmethod
+    def load(cls, path):
+        """
+        This function reads a map written by save.
+        """
+
+        with np.load(path) as data:
+            axes = {key[5:]: data[key] for key in data.files if key.startswith("axis_")}
+            tables = {key[6:]: data[key] for key in data.files if key.startswith("table_")}
+            settings = json.loads(str(data["settings"]))
+
+        return cls(axes, tables, settings)
@@ -0,0 +1,248 @@
+"""
+This class is an opt-in instrumentation layer for the design pipeline. It records the wall time and
+call count of each pipeline stage (config load, atmosphere lookup, mission build, propeller loading
+model, MTOW iteration, ...) together with counters such as atmosphere evaluations and solver iterations,
+and exports them as a Chrome trace (open in chrome://tracing or https://ui.perfetto.dev).
+
+The pipeline modules share the module-level instance PROFILER. It is disabled by default; while
+disabled, stage() returns a shared no-op context manager and count() returns immediately, so the hooks
+cost one attribute check per call.
+
+Functions
+--------
+- enable
+- disable
+- reset
+- stage
+- profile
+- count
+- summary
+- report
+- export_trace
+
+Usage
+--------
+from Profiler import PROFILER
+PROFILER.enable()
+aircraft = Aircraft(run_mode="auto")
+PROFILER.report()
+PROFILER.export_trace("output/trace.json")
+
+Stage times are inclusive: a stage nested in another (e.g. atmosphere lookups inside the MTOW
+iteration) is counted in both. The profiler records the current process only.
+
+Last Revised: 17 October 2026
+"""
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+class Profiler:
+
+    def __init__(self, max_events=1000000):
+        """
+        This function initializes a disabled profiler.
+
+        Inputs
+        -----
+        max_events  :   maximum number of trace events kept; stage and counter totals are always kept
+
+        Outputs
+        -----
+        self.stages     :   dictionary of stage name -> [calls, total wall time [s]]
+        self.counters   :   dictionary of counter name -> count
+        self.events     :   list of Chrome trace events
+        """
+
+        self.enabled = False
+        self.max_events = max_events
+        self.reset()
+
+    def enable(self, reset=True):
+        """
+        This function starts recording, by default discarding anything recorded before.
+        """
+
+        if reset:
+            self.reset()
+        self.enabled = True
+
+        return self
+
+    def disable(self):
+        """
+        This function stops recording; recorded stages, counters and events are kept.
+        """
+
+        self.enabled = False
+
+        return self
+
+    def reset(self):
+        """
+        This function discards all recorded stages, counters and events.
+        """
+
+        self.stages = dict()
+        self.counters = dict()
+        self.events = []
+        self.t_start = time.perf_counter()
+
+    def stage(self, name, **args):
+        """
+        This function returns a context manager timing one call of a pipeline stage.
+
+        Inputs
+        -----
+        name        :   stage name
+        args        :   optional values stored with the trace event (e.g. model="MT")
+        """
+
+        if not self.enabled:
+            return _NULL_STAGE
+
+        return _Stage(self, name, args)
+
+    def profile(self, name):
+        """
+        This function returns a decorator timing every call of the decorated function as stage 'name'.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Stage(self, name, None):
+                    return func(*args, **kwargs)
+            return wrapper
+
+        return decorator
+
+    def count(self, name, n=1):
+        """
+        This function increments counter 'name' by 'n'.
+        """
+
+        if not self.enabled:
+            return
+
+        value = self.counters.get(name, 0) + n
+        self.counters[name] = value
+        if len(self.events) < self.max_events:
+            self.events.append({"name": name, "ph": "C", "ts": self._timestamp(time.perf_counter()),
+                                "pid": os.getpid(), "args": {name: value}})
+
+    def summary(self):
+        """
+        This function summarizes the recorded stages and counters.
+
+        Outputs
+        -----
+        summary                 :   dictionary of recorded data
+        summary["stages"]       :   dictionary of stage name -> {"calls", "total_s", "mean_s"}
+        summary["counters"]     :   dictionary of counter name -> count
+        summary["wall_s"]       :   wall time since the profiler was reset [s]
+        """
+
+        stages = {name: {"calls": calls, "total_s": total, "mean_s": total / calls}
+                  for name, (calls, total) in self.stages.items()}
+
+        return {"stages": stages, "counters": dict(self.counters), "wall_s": time.perf_counter() - self.t_start}
+
+    def report(self):
+        """
+        This function prints the recorded stages (slowest first) and counters to the console.
+        """
+
+        summary = self.summary()
+
+        print(f"\nDisplaying profile ({summary['wall_s']:.3f} s wall time)...")
+        print(f"-------------------------------\n")
+
+        print(f"{'stage':24} {'calls':>10} {'total [s]':>12} {'mean [ms]':>12}")
+        for name, stage in sorted(summary["stages"].items(), key=lambda item: -item[1]["total_s"]):
+            print(f"{name:24} {stage['calls']:10d} {stage['total_s']:12.4f} {stage['mean_s'] * 1e3:12.4f}")
+
+        if summary["counters"]:
+            print(f"\n{'counter':24} {'count':>10}")
+            for name, value in summary["counters"].items():
+                print(f"{name:24} {value:10d}")
+
+    def export_trace(self, path):
+        """
+        This function writes the recorded events as a Chrome trace JSON file. The stage and counter
+        totals are stored under "otherData".
+
+        Inputs
+        -----
+        path        :   str specifying the .json file to write
+        """
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        trace = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": self.summary(),
+        }
+        with open(path, "w") as file:
+            json.dump(trace, file)
+
+        print(f"Successfully wrote '{path}'")
+
+    def _record(self, name, t0, t1, args):
+        """
+        This function adds one timed stage call to the totals and the trace.
+        """
+
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = [0, 0.]
+        stage[0] += 1
+        stage[1] += t1 - t0
+
+        if len(self.events) < self.max_events:
+            event = {"name": name, "ph": "X", "ts": self._timestamp(t0), "dur": (t1 - t0) * 1e6,
+                     "pid": os.getpid(), "tid": threading.get_ident()}
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def _timestamp(self, t):
+        """
+        This function converts a perf_counter time to trace microseconds since the last reset.
+        """
+
+        return (t - self.t_start) * 1e6
+
+
+class _Stage:
+    """
+    This class times one stage call for Profiler.stage.
+    """
+
+    __slots__ = ("profiler", "name", "args", "t0")
+
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.name, self.t0, time.perf_counter(), self.args)
+
+
+# shared no-op stage returned while profiling is disabled
+_NULL_STAGE = contextlib.nullcontext()
+
+# profiler shared by the pipeline modules
+PROFILER = Profiler()
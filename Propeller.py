@@ -5,12 +5,22 @@ This module creates a propeller(s) object to
 
 
 Author: Matt Asper (matt.asper101@gmail.com)
-Last Revised: 24 December 2025
+Last Revised: 17 October 2026
 """
 import numpy as np
 from add_dictEntry import add_dictEntry
-from ambiance import Atmosphere
-import plotly.graph_objects as go
+from format_value import format_value
+from compute_momentumTheory import compute_momentumTheory, CD_COEFFS
+from compute_BEMT import compute_BEMT, trim_collective, CLA
+from compute_BET import compute_BET
+from Profiler import PROFILER
+
+# propeller loading models, from lowest to highest fidelity: model name -> Propeller method
+LOADING_MODELS = {
+    "MT": "run_momentumTheory",
+    "BET": "run_bladeElementTheory",
+    "BEMT": "run_bladeElementMomentumTheory",
+}
 
 class Propeller:
 
@@ -34,37 +44,99 @@ class Propeller:
             self.params[key] = value
 
 
-    def run_propLoading(self, model, T, rho, a):
+    def set_bladeGeometry(self, Nb, twist=0., taper=1., r_root=0.15, Nr=50):
+        """
+        This function discretizes the propeller blade into radial stations and stores the geometry
+        in contiguous numpy arrays under 'blade'. The geometry is nondimensional (r/R), so the same
+        blade can be evaluated at any radius. Local solidity is scaled so that the thrust-weighted
+        solidity matches self.params["sigma"]; an array of solidities gives a batch of blades with
+        local solidity of shape sigma.shape + (Nr,).
+
+        Inputs
+        -----
+        Nb                  :   number of blades [-]
+        twist               :   linear blade twist from root to tip [rad]
+        taper               :   ratio of tip chord to root chord [-]
+        r_root              :   nondimensional root cutout r/R [-]
+        Nr                  :   number of radial stations [-]
+        self.params["sigma"]:   propeller solidity [-]
+
+        Outputs
+        -----
+        self.blade          :   dictionary of blade geometry arrays
+        self.blade["r"]     :   nondimensional radial station midpoints r/R [-]
+        self.blade["dr"]    :   nondimensional station widths [-]
+        self.blade["sigma"] :   local solidity at each station [-]; shape (..., Nr)
+        self.blade["twist"] :   local twist relative to the 3/4 radius pitch [rad]
+        """
+
+        # equal-width annuli; stations at the midpoints avoid the singular tip
+        edges = np.linspace(r_root, 1, Nr + 1)
+        r = 0.5 * (edges[1:] + edges[:-1])
+        dr = np.diff(edges)
+
+        # linear taper, scaled to the thrust-weighted solidity
+        chord = 1 - (1 - taper) * (r - r_root) / (1 - r_root)
+        sigma = np.asarray(self.params["sigma"]["value"], dtype=float)[..., None] * chord / (3 * np.sum(chord * r**2 * dr))
+
+        self.blade = {
+            "Nb": int(Nb),
+            "r": np.ascontiguousarray(r),
+            "dr": np.ascontiguousarray(dr),
+            "sigma": np.ascontiguousarray(sigma),
+            "twist": np.ascontiguousarray(twist * (r - 0.75)),
+        }
+
+        return self
+
+    def run_propLoading(self, model, T, rho, a, cache=None, **kwargs):
         """
         This exercises user-specified propeller loading models to estimate performance.
 
         Inputs
         -----
-        model       : str specifying the loading model 
+        model       : str specifying the loading model (see LOADING_MODELS)
                         "MT" momentum theory
                         "BET" blade element theory
                         "BEMT" blade element momentum theory
+        cache       : optional PerformanceCache; results of an identical model, params, blade geometry
+                      and operating condition are read from it instead of being recomputed
+        kwargs      : additional keyword arguments passed to the loading model
         
         Ouputs
         -----
         self.perf   : dictionary of propeller performance data
         """
 
-        # select propeller model
-        if model == "MT":
-            self.run_momentumTheory(T, rho, a)
-        elif model == "BET":
-            self.run_bladeElementTheory()
-        elif model == "BET":
-            self.run_bladeElementMomentumTheory()
-        else:
+        if model not in LOADING_MODELS:
             raise ValueError("Inappropriate propeller model selected. " \
-            "Available models include 'MT', 'BET', and 'BEMT'.")
+            f"Available models include {', '.join(repr(name) for name in LOADING_MODELS)}.")
+
+        PROFILER.count("prop_loading_points", np.size(T))
+
+        if cache is not None:
+            key = cache.make_key(model, self.params, T, rho, a, blade=getattr(self, "blade", None), **kwargs)
+            result = cache.get(key)
+            if result is not None:
+                PROFILER.count("prop_cache_hits")
+                self.params, self.perf = result
+                return
+            PROFILER.count("prop_cache_misses")
+
+        # run the selected propeller model
+        with PROFILER.stage("prop_loading", model=model):
+            getattr(self, LOADING_MODELS[model])(T, rho, a, **kwargs)
+
+        if cache is not None:
+            cache.put(key, (self.params, self.perf))
 
     
-    def run_momentumTheory(self, T, rho, a, kappa=1.15):  #TODO:Validate trends
+    def run_momentumTheory(self, T, rho, a, kappa=1.15, Cla=CLA, Cd_coeffs=CD_COEFFS, polar=None):  #TODO:Validate trends
         """
         This function applies momentum theory to determine propeller performance.
+        Any of T, rho, a or the "DL", "sigma", "Mtip" and "Np" param values may be numpy arrays; they
+        are broadcast against each other so a whole design space is evaluated in one call and every
+        output below holds an array of the broadcast shape.
 
         Inputs
         -----
@@ -75,6 +147,10 @@ class Propeller:
         a                   :   ambient speed of sound [m/s]
         self.params["sigma"]:   propeller solidity [-]
         kappa               :   indcued power factor [-]
+        Cla                 :   blade section lift curve slope [/rad]
+        Cd_coeffs           :   coefficients of Bailey's drag curve (see compute_momentumTheory) [-]
+        polar               :   optional AirfoilPolar replacing Bailey's drag curve (see compute_momentumTheory);
+                                the chord uses self.blade["Nb"] when the blade geometry is set, 3 blades otherwise
         
         Outputs
         -----
@@ -86,73 +162,228 @@ class Propeller:
         self.perf["P"]      :   total propeller power required [W]
         self.perf["Pp"]     :   individual propeller power required [W]
         self.perf["Tp"]     :   individual propeller thrust [N]
+        self.perf["CT"]     :   propeller thrust coefficient [-]
         self.perf["FM"]     :   propeller figure of merit [-]
         """
 
-        # compute propeller geometry
-        A = T / self.params["DL"]["value"]
-        Ap = A / self.params["Np"]["value"]
-        R = np.sqrt(Ap / np.pi)
+        # evaluate momentum theory; params may hold scalars or broadcastable arrays (batched mode)
+        perf = compute_momentumTheory(T, rho, a,
+                                      DL=self.params["DL"]["value"],
+                                      sigma=self.params["sigma"]["value"],
+                                      Mtip=self.params["Mtip"]["value"],
+                                      Np=self.params["Np"]["value"],
+                                      kappa=kappa, Cla=Cla, Cd_coeffs=Cd_coeffs, polar=polar,
+                                      Nb=self.blade["Nb"] if hasattr(self, "blade") else 3)
 
-        # required propeller thrust
-        Tp = T / self.params["Np"]["value"]
+        # update propeller params
+        self.params["A"] = add_dictEntry("A", perf["A"], "m^2")
+        self.params["Ap"] = add_dictEntry("Ap", perf["Ap"], "m^2")
+        self.params["R"] = add_dictEntry("R", perf["R"], "m")
 
-        # propeller speed
-        Vtip = self.params["Mtip"]["value"] * a
-        RPM = Vtip / R * 60 / (2 * np.pi)
+        # combine performance data into self.perf dictionary
+        self.perf = dict()
+        self.perf["T"] = add_dictEntry("T", T, "N")
+        self.perf["Tp"] = add_dictEntry("Tp", perf["Tp"], "N")
+        self.perf["P"] = add_dictEntry("P", perf["P"], "W")
+        self.perf["Pp"] = add_dictEntry("Pp", perf["Pp"], "W")
+        self.perf["RPM"] = add_dictEntry("RPM", perf["RPM"], "rev/min")
+        self.perf["CT"] = add_dictEntry("CT", perf["CT"], "-")
+        self.perf["FM"] = add_dictEntry("FM", perf["FM"], "-")
+
+        return self
+
+    def optimize_momentumTheory(self, T, rho, a, objective="P", kappa=1.15, **kwargs):
+        """
+        This function finds the disk loading, solidity and tip Mach number that minimize hover power
+        (or maximize figure of merit) under tip Mach, blade loading and radius constraints (see
+        optimize_rotor), stores them in 'params' and evaluates the optimal rotor with momentum theory.
+        T, rho and a may be arrays of independent conditions; one rotor is optimized per condition.
+
+        Inputs
+        -----
+        T                   :   required total propeller thrust [N]
+        rho                 :   ambient air density [kg/m^3]
+        a                   :   ambient speed of sound [m/s]
+        objective           :   str specifying the objective; "P" or "FM"
+        kappa               :   induced power factor [-]
+        kwargs              :   additional keyword arguments passed to optimize_rotor
+                                (Mtip_max, BL_max, R_max, bounds, ...)
+        self.params["Np"]   :   number of propellers [-]
 
-        # thrust coefficient
-        CT = self.params["DL"]["value"] / rho / Vtip**2
+        Outputs
+        -----
+        self.params["DL"], self.params["sigma"], self.params["Mtip"]    :   optimal design
+        self.perf           :   dictionary of propeller performance data (see run_momentumTheory)
+        self.optimum        :   dictionary of optimizer results (see optimize_rotor)
+        """
 
-        # blade loading
-        BL = CT / self.params["sigma"]["value"]
+        from optimize_rotor import optimize_rotor
 
-        # average lift coefficient across propeller blade
-        Cl_bar = 6 * BL
+        # start from the current design when it is a single rotor
+        x0 = None
+        if all(key in self.params and np.ndim(self.params[key]["value"]) == 0 for key in ("DL", "sigma", "Mtip")):
+            x0 = [self.params[key]["value"] for key in ("DL", "sigma", "Mtip")]
 
-        # lift curve slope (/rad)
-        Cla = 5.73
+        self.optimum = optimize_rotor(T, rho, a, self.params["Np"]["value"], objective=objective, x0=x0,
+                                      kappa=kappa, **kwargs)
 
-        # average angle of attack (rad)
-        alpha_bar = Cl_bar / Cla
+        self.params["DL"] = add_dictEntry("DL", self.optimum["DL"], "Pa")
+        self.params["sigma"] = add_dictEntry("sigma", self.optimum["sigma"], "-")
+        self.params["Mtip"] = add_dictEntry("Mtip", self.optimum["Mtip"], "-")
 
-        # mean drag coefficient based on Bailey's Drag Curve
-        Cd_bar  = 0.0087 - 0.035 * alpha_bar + 0.4 * alpha_bar**2
+        return self.run_momentumTheory(T, rho, a, kappa=kappa)
 
-        # propeller powers
-        P0 = 1/8 * rho * Cd_bar * self.params["sigma"]["value"] * A * Vtip**3  # total profile
-        Ph = T * np.sqrt(self.params["DL"]["value"] / 2 / rho)  # ideal hover power
-        Pi = kappa * Ph  # actual induced power
-        P = Pi + P0  # total propeller power
-        Pp = P / self.params["Np"]["value"]  # individual propeller power 
+    def run_bladeElementTheory(self, T, rho, a, Vc=0., kappa=1.15, polar=None):
+        """
+        This function applies blade element theory with a uniform momentum theory inflow to determine
+        propeller performance. The collective pitch of every operating point is trimmed to produce
+        the required thrust at the tip speed set by self.params["Mtip"]. T, rho, a and Vc may be
+        broadcastable arrays, as may the rotor parameters (see _run_bladeModel).
 
-        # figure of merit
-        FM = T * np.sqrt(self.params["DL"]["value"] / 2 / rho) / P
+        Inputs
+        -----
+        T                   :   required total propeller thrust [N]
+        rho                 :   ambient air density [kg/m^3]
+        a                   :   ambient speed of sound [m/s]
+        Vc                  :   axial climb velocity [m/s]
+        kappa               :   induced power factor [-]
+        polar               :   optional AirfoilPolar replacing Bailey's drag curve at every station (see compute_BET)
+        self.params["Np"]   :   number of propellers [-]
+        self.params["Mtip"] :   propeller tip Mach number [-]
+        self.params["R"]    :   individual propeller radius [m] (e.g. sized by momentum theory)
+        self.blade          :   blade geometry arrays (see set_bladeGeometry)
 
-        # update propeller params
-        self.params["A"] = add_dictEntry("A", A, "m^2")
-        self.params["Ap"] = add_dictEntry("Ap", Ap, "m^2")
-        self.params["R"] = add_dictEntry("R", R, "m")
+        Outputs
+        -----
+        self.perf           :   dictionary of propeller performance data (as run_bladeElementMomentumTheory)
+        """
 
-        # combine performance data into self.perf dictionary
-        self.perf = dict()
-        self.perf["T"] = add_dictEntry("T", T, "N")
-        self.perf["Tp"] = add_dictEntry("Tp", Tp, "N")
-        self.perf["P"] = add_dictEntry("P", P, "W")
-        self.perf["Pp"] = add_dictEntry("Pp", Pp, "W")
-        self.perf["RPM"] = add_dictEntry("RPM", RPM, "rev/min")
-        self.perf["FM"] = add_dictEntry("FM", FM, "-")
+        def compute(R, RPM, theta0, Vc, rho):
+            return compute_BET(self.blade, R, RPM, theta0, Vc, rho, kappa=kappa, polar=polar, a=a)
+
+        self._run_bladeModel(compute, T, rho, a, Vc)
 
         return self
 
-    def run_bladeElementTheory(self, T, rho):
-        #TODO: finish this function
-        raise NotImplementedError("This function hasn't been written yet.")
+    def map_bladeElementTheory(self, RPM, theta0, rho, Vc=0., kappa=1.15):
+        """
+        This function evaluates blade element theory over a batch of RPM and collective settings
+        without trimming, e.g. map_bladeElementTheory(RPM[:, None], theta0[None, :], rho) for a
+        thrust-power map of the rotor.
+
+        Inputs
+        -----
+        RPM                 :   propeller speed [rev/min]
+        theta0              :   collective pitch at 3/4 radius [rad]
+        rho                 :   ambient air density [kg/m^3]
+        Vc                  :   axial climb velocity [m/s]
+        kappa               :   induced power factor [-]
 
-    def run_bladeElementMomentumTheory(self, T, rho):
-        #TODO: finish this function
-        raise NotImplementedError("This function hasn't been written yet.")
+        Outputs
+        -----
+        perf                :   dictionary of performance arrays (see compute_BET)
+        """
+
+        self._check_bladeModel()
+
+        return compute_BET(self.blade, self.params["R"]["value"], RPM, theta0, Vc, rho, kappa=kappa)
+
+    def run_bladeElementMomentumTheory(self, T, rho, a, Vc=0.):
+        """
+        This function applies blade element momentum theory to determine propeller performance.
+        The collective pitch of every operating point is trimmed to produce the required thrust at
+        the tip speed set by self.params["Mtip"]. T, rho, a and Vc may be broadcastable arrays.
+
+        Inputs
+        -----
+        T                   :   required total propeller thrust [N]
+        rho                 :   ambient air density [kg/m^3]
+        a                   :   ambient speed of sound [m/s]
+        Vc                  :   axial climb velocity [m/s]
+        self.params["Np"]   :   number of propellers [-]
+        self.params["Mtip"] :   propeller tip Mach number [-]
+        self.params["R"]    :   individual propeller radius [m] (e.g. sized by momentum theory)
+        self.blade          :   blade geometry arrays (see set_bladeGeometry)
+
+        Outputs
+        -----
+        self.perf           :   dictionary of propeller performance data
+        self.perf["RPM"]    :   propeller speed [rev/min]
+        self.perf["theta0"] :   trimmed collective pitch at 3/4 radius [rad]
+        self.perf["P"]      :   total propeller power required [W]
+        self.perf["Pp"]     :   individual propeller power required [W]
+        self.perf["Tp"]     :   individual propeller thrust [N]
+        self.perf["CT"]     :   propeller thrust coefficient [-]
+        self.perf["FM"]     :   propeller figure of merit [-]
+        """
+
+        def compute(R, RPM, theta0, Vc, rho):
+            return compute_BEMT(self.blade, R, RPM, theta0, Vc, rho)
+
+        self._run_bladeModel(compute, T, rho, a, Vc)
+
+        return self
     
+    def _check_bladeModel(self):
+        """
+        This function checks that the inputs required by the blade element models are defined.
+        """
+
+        if not hasattr(self, "blade"):
+            raise ValueError("Blade geometry is undefined. Call set_bladeGeometry() before running BET or BEMT.")
+        if "R" not in self.params:
+            raise ValueError("Propeller radius 'R' is undefined. Specify it or size the propeller with 'MT' first.")
+
+        # a batch of rotors needs one radius per blade geometry, broadcastably
+        try:
+            np.broadcast_shapes(np.shape(self.params["R"]["value"]), self.blade["sigma"].shape[:-1])
+        except ValueError:
+            raise ValueError(f"Propeller radius 'R' of shape {np.shape(self.params['R']['value'])} does not match the "
+                             f"batch of blade geometries of shape {self.blade['sigma'].shape[:-1]}. Call "
+                             f"set_bladeGeometry() after sizing the propellers.") from None
+
+    def _run_bladeModel(self, compute, T, rho, a, Vc):
+        """
+        This function trims a blade element model to the required thrust and stores the results
+        under 'perf'. The rotor parameters R, sigma, Mtip and Np may be arrays describing a batch of
+        rotors (e.g. sized by a batched MT run), one per element, broadcast against the operating points.
+
+        Inputs
+        -----
+        compute     :   function (R, RPM, theta0, Vc, rho) returning a performance dictionary
+        T, rho, a, Vc : operating point(s), as in run_bladeElementMomentumTheory
+        """
+
+        self._check_bladeModel()
+
+        R = np.asarray(self.params["R"]["value"], dtype=float)
+        Np = self.params["Np"]["value"]
+
+        # operating points
+        T, rho, a, Vc = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (T, rho, a, Vc)))
+        Tp = T / Np
+        Vtip = self.params["Mtip"]["value"] * a
+        RPM = Vtip / R * 60 / (2 * np.pi)
+        CT_req = Tp / (rho * np.pi * R**2 * Vtip**2)
+
+        # trim collective from a blade element theory initial guess
+        sigma = np.asarray(self.params["sigma"]["value"], dtype=float)
+        theta0 = 6 * CT_req / (sigma * CLA) + 1.5 * np.sqrt(CT_req / 2) + 1.5 * Vc / Vtip
+        theta0 = trim_collective(lambda th: compute(R, RPM, th, Vc, rho)["CT"], CT_req, theta0)
+
+        perf = compute(R, RPM, theta0, Vc, rho)
+
+        # combine performance data into self.perf dictionary
+        self.perf = dict()
+        self.perf["T"] = add_dictEntry("T", T[()], "N")
+        self.perf["Tp"] = add_dictEntry("Tp", perf["Tp"], "N")
+        self.perf["P"] = add_dictEntry("P", perf["Pp"] * Np, "W")
+        self.perf["Pp"] = add_dictEntry("Pp", perf["Pp"], "W")
+        self.perf["RPM"] = add_dictEntry("RPM", RPM[()], "rev/min")
+        self.perf["theta0"] = add_dictEntry("theta0", theta0[()], "rad")
+        self.perf["CT"] = add_dictEntry("CT", perf["CT"], "-")
+        self.perf["FM"] = add_dictEntry("FM", perf["FM"], "-")
+
     def display_params(self):
         """
         This function prints the propeller parameters in 'self.params' to the console.
@@ -166,18 +397,20 @@ class Propeller:
         print(f"---------------\n")
 
         for param, values in self.params.items():
-            print(f"{param:15}\t:\t{values["value"]:10} [{values["units"]}]\n")
+            print(f"{param:15}\t:\t{format_value(values['value']):10} [{values['units']}]\n")
 
         print(f"\nDisplaying propeller performance parameters...\n")
         print(f"---------------\n")
 
         for param, values in self.perf.items():
-            print(f"{param:15}\t:\t{values["value"]:10} [{values["units"]}]\n")
+            print(f"{param:15}\t:\t{format_value(values['value']):10} [{values['units']}]\n")
 
 
 
 if __name__=="__main__":
-    
+    from ambiance import Atmosphere
+    import plotly.graph_objects as go
+
     # initialize propeller
     Np      = {"name": "Np",    "value": 4,         "units": "-"}  # number of propellers
     Mtip    = {"name": "Mtip",  "value": 0.4,       "units": "-"}  # tip mach
@@ -203,32 +436,19 @@ if __name__=="__main__":
     prop.display_params()
 
 
-    # sweep DLs and store FM
+    # sweep DLs and store FM in a single batched call
     DLsweep = np.linspace(100, 700)
-    FM = np.zeros(DLsweep.shape)
-    CT = np.zeros(DLsweep.shape)
-    for i in range(len(DLsweep)):
-        DL      = {"name": "DL",    "value": DLsweep[i],       "units": "Pa"}  # disk loading [Pa]
-
-        prop_specs = {
-            "Np"        :   Np,  
-            "Mtip"      :   Mtip,  
-            "sigma"     :   sigma,  
-            "DL"        :   DL,   
-        }
-
-        prop = Propeller(**prop_specs)
+    prop_specs["DL"] = {"name": "DL",    "value": DLsweep,       "units": "Pa"}  # disk loading [Pa]
+    prop = Propeller(**prop_specs)
+    prop.run_propLoading("MT", T, rho, a)
 
-        # run condition
-        alt = 10  # hover alt [m]
-        atmos = Atmosphere(alt)  # atmospheric data
-        rho = float(atmos.density)  # air density
-        T = 1 / 0.15 * 9.81  # required total propeller thrust [N]
-        a = float(atmos.speed_of_sound)  # speed of sound in air [m/s]
-        prop.run_propLoading("MT", T, rho, a)
+    FM = prop.perf["FM"]["value"]
+    CT = prop.perf["CT"]["value"]
 
-        FM[i] = prop.perf["FM"]["value"] 
-        CT[i] = DLsweep[i] / (rho * (prop.perf["RPM"]["value"] * np.pi / 30 * prop.params["R"]["value"])**2)     
+    # optimal rotor for the same condition, found from analytic gradients instead of a grid
+    prop_opt = Propeller(**{**prop_specs, "DL": DL})
+    prop_opt.optimize_momentumTheory(T, rho, a, objective="FM", R_max=0.3)
+    prop_opt.display_params()
 
     # Create plotly figure
     fig = go.Figure()   
@@ -237,6 +457,13 @@ if __name__=="__main__":
         x=CT, 
         y=FM, 
         mode='lines', 
+        name="DL sweep",
+    ))
+    fig.add_trace(go.Scatter(
+        x=[prop_opt.perf["CT"]["value"]],
+        y=[prop_opt.perf["FM"]["value"]],
+        mode='markers',
+        name="optimum",
     ))
 
     # Add labels
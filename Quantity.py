@@ -0,0 +1,74 @@
+"""
+This module defines a compact container for named quantities with units.
+
+Classes
+--------
+- Quantity          :   one named value with units; slotted, with dict-style access
+
+Quantity keeps the existing {'name', 'value', 'units'} dictionary access working, e.g. quantity["value"].
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+
+class Quantity:
+
+    __slots__ = ("name", "value", "units")
+
+    def __init__(self, name, value, units):
+        """
+        This function initializes a quantity.
+
+        Inputs
+        -----
+        name    :   str specifying the variable name of the quantity
+        value   :   any specifying the value of the variable
+        units   :   str specifying the unit of the variable
+        """
+
+        self.name = name
+        self.value = value
+        self.units = units
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def keys(self):
+        return self.__slots__
+
+    def values(self):
+        return tuple(getattr(self, key) for key in self.__slots__)
+
+    def items(self):
+        return tuple((key, getattr(self, key)) for key in self.__slots__)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __eq__(self, other):
+        if isinstance(other, (Quantity, dict)):
+            return all(np.array_equal(self[key], other.get(key)) for key in self.__slots__)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Quantity(name={self.name!r}, value={self.value!r}, units={self.units!r})"
+
@@ -0,0 +1,199 @@
+"""
+This class collects design records (requirements, propeller params/perf, mission energy) from many runs
+and writes them in a few bulk writes instead of one file per design.
+
+Records are buffered in memory and flushed every 'buffer_size' records as either
+- "npz"     :   one compressed columnar chunk file per flush, <name>_<chunk>.npz
+- "jsonl"   :   one orjson-encoded line per record appended to <name>.jsonl in a single write
+
+The units of every column are stored once in <name>_units.json, merged with the units of any earlier
+session writing to the same store. With mode="w" an existing store of the same name is removed first.
+
+Functions
+--------
+- append
+- append_design
+- flush
+- close
+- load
+
+Last Revised: 17 October 2026
+"""
+import glob
+import json
+import os
+import numpy as np
+from Quantity import Quantity
+
+class ResultsStore:
+
+    def __init__(self, filepath, name="results", fmt="npz", buffer_size=10000, mode="a"):
+        """
+        This function initializes the results store.
+
+        Inputs
+        -----
+        filepath    :   str specifying the directory to write to (created if missing)
+        name        :   base filename of the store
+        fmt         :   str specifying the store format; "npz" or "jsonl"
+        buffer_size :   number of records buffered before each bulk write
+        mode        :   str specifying how an existing store is treated; "a" appends to it, "w" removes
+                        it and starts a new one
+
+        Outputs
+        -----
+        self.units  :   dictionary of column name -> units str
+        """
+
+        if fmt not in ("npz", "jsonl"):
+            raise ValueError("Inappropriate store format selected. Available formats include 'npz' and 'jsonl'.")
+        if mode not in ("a", "w"):
+            raise ValueError("Inappropriate store mode selected. Available modes include 'a' and 'w'.")
+
+        self.filepath = filepath
+        self.name = name
+        self.fmt = fmt
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.units = dict()
+        self.n_written = 0
+
+        chunks = glob.glob(os.path.join(filepath, f"{name}_[0-9]*.npz"))
+        jsonl = os.path.join(filepath, f"{name}.jsonl")
+        units = os.path.join(filepath, f"{name}_units.json")
+        if mode == "w":
+            for path in chunks + [jsonl, units]:
+                if os.path.exists(path):
+                    os.remove(path)
+            chunks = []
+
+        # continue numbering after any existing chunks and keep the units of the earlier records
+        self.chunk = len(chunks)
+        if os.path.exists(units):
+            with open(units) as file:
+                self.units.update(json.load(file))
+
+        os.makedirs(filepath, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, record):
+        """
+        This function buffers one flat record.
+
+        Inputs
+        -----
+        record      :   dictionary of column name -> bare value or Quantity/{'value', 'units'} entry
+        """
+
+        row = dict()
+        for key, entry in record.items():
+            if isinstance(entry, (Quantity, dict)):
+                self.units.setdefault(key, entry["units"])
+                entry = entry["value"]
+            row[key] = entry.item() if isinstance(entry, np.generic) else entry
+
+        self.buffer.append(row)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def append_design(self, aircraft=None, prop=None, mission=None, **extra):
+        """
+        This function flattens one design into a record and buffers it. Columns are prefixed by their
+        source: "reqs.", "subsystem.", "prop.", "perf." and "mission.".
+
+        Inputs
+        -----
+        aircraft    :   Aircraft with reqs (and subsystem masses after compute_MTOW)
+        prop        :   Propeller with params and perf
+        mission     :   Mission with energy (after simulate_energy)
+        extra       :   additional columns
+        """
+
+        record = dict()
+        sources = (
+            ("reqs", aircraft, "reqs"),
+            ("subsystem", aircraft, "subsystem"),
+            ("prop", prop, "params"),
+            ("perf", prop, "perf"),
+            ("mission", mission, "energy"),
+        )
+        for prefix, obj, attr in sources:
+            for key, entry in getattr(obj, attr, dict()).items():
+                record[f"{prefix}.{key}"] = entry
+
+        record.update(extra)
+        self.append(record)
+
+    def flush(self):
+        """
+        This function writes the buffered records in one bulk write.
+        """
+
+        if len(self.buffer) == 0:
+            return
+
+        if self.fmt == "npz":
+            keys = list(dict.fromkeys(key for row in self.buffer for key in row))
+            columns = {key: np.asarray([row.get(key, np.nan) for row in self.buffer]) for key in keys}
+            np.savez_compressed(os.path.join(self.filepath, f"{self.name}_{self.chunk:05d}.npz"), **columns)
+            self.chunk += 1
+
+        else:
+            import orjson
+
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            with open(os.path.join(self.filepath, f"{self.name}.jsonl"), "ab") as file:
+                file.write(b"".join(orjson.dumps(row, option=option) for row in self.buffer))
+
+        with open(os.path.join(self.filepath, f"{self.name}_units.json"), "w") as file:
+            json.dump(self.units, file, indent=1)
+
+        self.n_written += len(self.buffer)
+        self.buffer = []
+
+    def close(self):
+        """
+        This function flushes any remaining buffered records.
+        """
+
+        self.flush()
+
+    @staticmethod
+    def load(filepath, name="results"):
+        """
+        This function reads a store back into a pandas DataFrame.
+
+        Inputs
+        -----
+        filepath    :   str specifying the store directory
+        name        :   base filename of the store
+
+        Outputs
+        -----
+        results     :   pandas DataFrame with one row per record; results.attrs["units"] holds the column units
+        """
+
+        import pandas as pd
+
+        jsonl = os.path.join(filepath, f"{name}.jsonl")
+        if os.path.exists(jsonl):
+            results = pd.read_json(jsonl, lines=True)
+        else:
+            chunks = sorted(glob.glob(os.path.join(filepath, f"{name}_[0-9]*.npz")))
+            frames = []
+            for chunk in chunks:
+                with np.load(chunk) as data:
+                    frames.append(pd.DataFrame({key: data[key] for key in data.files}))
+            results = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+        units = os.path.join(filepath, f"{name}_units.json")
+        if os.path.exists(units):
+            with open(units) as file:
+                results.attrs["units"] = json.load(file)
+
+        return results
@@ -0,0 +1,114 @@
+"""
+This class is a thin client of the local sizing service (see SizingService). It only imports the standard
+library, so front ends and scripts start instantly and leave all sizing work to the service's warm workers.
+
+Functions
+--------
+- size
+- ping
+- stats
+- shutdown
+
+Usage
+--------
+with SizingClient(port=8765) as client:
+    records = client.size([{"config": "configs/group1_quad.yml", "overrides": {"reqs.payload.value": 2}}])
+
+python SizingClient.py --config configs/group1_quad.yml --set reqs.payload.value=2
+
+Last Revised: 17 October 2026
+"""
+import argparse
+import itertools
+import json
+import socket
+
+class SizingClient:
+
+    def __init__(self, host="127.0.0.1", port=8765, timeout=None):
+        """
+        This function connects to the service.
+
+        Inputs
+        -----
+        host, port  :   address of the service
+        timeout     :   socket timeout [s]; None waits indefinitely
+        """
+
+        self.socket = socket.create_connection((host, port), timeout=timeout)
+        self.file = self.socket.makefile("rb")
+        self.ids = itertools.count()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+    def request(self, op, **kwargs):
+        """
+        This function sends one request and returns the decoded response; service errors raise a ValueError.
+        """
+
+        request_id = next(self.ids)
+        self.socket.sendall(json.dumps({"op": op, "id": request_id, **kwargs}).encode() + b"\n")
+
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("The sizing service closed the connection.")
+        response = json.loads(line)
+
+        if "error" in response:
+            raise ValueError(f"Sizing service error: {response['error']}")
+
+        return response
+
+    def size(self, cases):
+        """
+        This function sizes a batch of cases.
+
+        Inputs
+        -----
+        cases       :   list of {"config": path, "overrides": {dotted key: value}} dictionaries; the config
+                        path is resolved by the service
+
+        Outputs
+        -----
+        records     :   list of result records (see run_batch.run_case), in the order of cases
+        """
+
+        return self.request("size", cases=cases)["records"]
+
+    def ping(self):
+        return self.request("ping")["ok"]
+
+    def stats(self):
+        return self.request("stats")["stats"]
+
+    def shutdown(self):
+        return self.request("shutdown")["ok"]
+
+
+if __name__=="__main__":
+    parser = argparse.ArgumentParser(description="Query the local eVTOL sizing service.")
+    parser.add_argument("--host", default="127.0.0.1", help="service host")
+    parser.add_argument("--port", type=int, default=8765, help="service port")
+    parser.add_argument("--config", default="configs/group1_quad.yml", help="path to the .yml config")
+    parser.add_argument("--set", action="append", help="override as key=value; may be repeated")
+    args = parser.parse_args()
+
+    overrides = dict()
+    for item in args.set or []:
+        key, value = item.split("=", 1)
+        try:
+            overrides[key] = json.loads(value)
+        except ValueError:
+            overrides[key] = value
+
+    with SizingClient(args.host, args.port) as client:
+        for key, value in client.size([{"config": args.config, "overrides": overrides}])[0].items():
+            print(f"{key:15}: \t{value}")
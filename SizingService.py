@@ -0,0 +1,200 @@
+"""
+This class is a long-lived local sizing service. An asyncio server on a local TCP port accepts batched
+sizing requests from many clients concurrently and dispatches every case to a process pool running the
+Aircraft -> Mission -> Propeller pipeline (see run_batch.run_case). The workers are started and warmed
+once: pipeline modules imported, atmosphere table built, configs parsed (and cached by read_yml) and the
+BEMT kernel compiled, so a request only pays for its own sizing instead of process startup.
+
+Protocol
+--------
+One JSON object per line in each direction over a persistent connection. Requests carry an optional
+"id" that is echoed in the response.
+{"op": "size", "cases": [{"config": path, "overrides": {dotted key: value}}, ...]}
+    ->  {"records": [record, ...]}, one run_case record per case, in order
+{"op": "ping"}      ->  {"ok": true}
+{"op": "stats"}     ->  {"stats": {...}}; request counts, latencies and uptime
+{"op": "shutdown"}  ->  {"ok": true}; stops the service
+Malformed requests are answered with {"error": message}.
+
+Functions
+--------
+- start
+- serve_forever
+- handle_request
+- stats
+
+Usage
+--------
+python evtol.py serve --port 8765 --workers 4
+client = SizingClient(port=8765)  # see SizingClient
+client.size([{"config": "configs/group1_quad.yml", "overrides": {"reqs.payload.value": 2}}])
+
+Last Revised: 17 October 2026
+"""
+import asyncio
+import functools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from run_batch import run_case
+
+# requests are read line by line; a batch of cases may hold many overrides
+MAX_LINE = 2**26
+
+class SizingService:
+
+    def __init__(self, host="127.0.0.1", port=8765, max_workers=None, cache=None, warm_config="configs/group1_quad.yml"):
+        """
+        This function initializes the service.
+
+        Inputs
+        -----
+        host            :   str specifying the interface to listen on; local only by default
+        port            :   TCP port to listen on; 0 picks a free port (see self.port after start)
+        max_workers     :   number of worker processes; None uses every core
+        cache           :   optional sqlite file of a PerformanceCache shared by all workers
+        warm_config     :   optional config sized once in every worker at startup to warm its caches
+        """
+
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = cache
+        self.warm_config = warm_config
+        self.counts = {"requests": 0, "cases": 0, "errors": 0}
+        self.latency = 0.  # total request latency [s]
+        self.started = None
+        self.connections = dict()  # handler task -> stream writer of every open connection
+
+    async def start(self):
+        """
+        This function starts and warms the worker pool and starts listening.
+        """
+
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_warm_worker,
+                                            initargs=(self.warm_config,))
+        self.run = functools.partial(run_case, cache_path=self.cache)
+
+        # start every worker now, not on the first request
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, os.getpid) for _ in range(self.max_workers)))
+
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port, limit=MAX_LINE)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.stopped = asyncio.Event()
+        self.started = time.time()
+
+        print(f"Sizing service listening on {self.host}:{self.port} with {self.max_workers} warm worker(s).")
+
+    async def serve_forever(self):
+        """
+        This function starts the service and serves requests until a shutdown request.
+        """
+
+        await self.start()
+        try:
+            await self.stopped.wait()
+        finally:
+            self.server.close()
+            await self.server.wait_closed()
+
+            # end the open connections; their handlers see end of stream and return
+            for writer in self.connections.values():
+                writer.close()
+            await asyncio.gather(*self.connections, return_exceptions=True)
+
+            self.executor.shutdown(cancel_futures=True)
+            print("Sizing service stopped.")
+
+    async def handle_request(self, request):
+        """
+        This function answers one decoded request (see module docstring).
+        """
+
+        op = request.get("op", "size")
+
+        if op == "size":
+            cases = request.get("cases")
+            if not isinstance(cases, list):
+                raise ValueError("A size request requires a list of 'cases'.")
+
+            loop = asyncio.get_running_loop()
+            records = await asyncio.gather(*(
+                loop.run_in_executor(self.executor, self.run, (case["config"], case.get("overrides") or dict()))
+                for case in cases))
+
+            self.counts["cases"] += len(cases)
+            return {"records": records}
+        elif op == "ping":
+            return {"ok": True}
+        elif op == "stats":
+            return {"stats": self.stats()}
+        elif op == "shutdown":
+            self.stopped.set()
+            return {"ok": True}
+        else:
+            raise ValueError("Inappropriate operation selected. Available operations include size, ping, stats and shutdown.")
+
+    def stats(self):
+        """
+        This function returns the service statistics.
+        """
+
+        return {
+            **self.counts,
+            "workers": self.max_workers,
+            "mean_latency": self.latency / max(self.counts["requests"], 1),
+            "uptime": time.time() - self.started,
+        }
+
+    async def _handle_connection(self, reader, writer):
+        """
+        This function serves the requests of one client connection, one line at a time; requests of
+        different connections are served concurrently.
+        """
+
+        task = asyncio.current_task()
+        self.connections[task] = writer
+
+        try:
+            while line := await reader.readline():
+                t0 = time.perf_counter()
+                request = dict()
+                try:
+                    request = json.loads(line)
+                    response = await self.handle_request(request)
+                except Exception as exc:
+                    self.counts["errors"] += 1
+                    response = {"error": f"{type(exc).__name__}: {exc}"}
+
+                if isinstance(request, dict) and "id" in request:
+                    response["id"] = request["id"]
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+                self.counts["requests"] += 1
+                self.latency += time.perf_counter() - t0
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # client went away, or sent a line longer than MAX_LINE
+        finally:
+            self.connections.pop(task, None)
+            writer.close()
+
+
+def _warm_worker(config_path):
+    """
+    This function warms a worker process: the pipeline modules are imported, the atmosphere table is
+    built, the config is parsed and sized once and the BEMT kernel is compiled (or loaded from numba's
+    disk cache) by a BEMT evaluation of a two-station blade, with the argument types of the pipeline's.
+    """
+
+    import numpy as np
+    from compute_BEMT import compute_BEMT
+
+    if config_path is not None and os.path.exists(config_path):
+        run_case((config_path, dict()))
+
+    blade = {"Nb": 2, "r": np.array([0.5, 0.9]), "dr": np.array([0.4, 0.2]), "sigma": np.array([0.08, 0.08]),
+             "twist": np.zeros(2)}
+    compute_BEMT(blade, 0.1, 5000., 0.1, 0., 1.2)
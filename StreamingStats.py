@@ -0,0 +1,167 @@
+"""
+This module accumulates statistics of a quantity over a stream of sample chunks in bounded memory,
+e.g. the MTOW of millions of Monte Carlo samples pushed through the sizing chain chunk by chunk.
+
+Classes
+--------
+- StreamingStats    :   count, mean and variance (chunked Welford/Chan update), min/max, exceedance
+                        probabilities of fixed thresholds and quantiles from a QuantileSketch
+- QuantileSketch    :   mergeable compactor (KLL-style) quantile sketch; keeps O(k log(n/k)) items and
+                        estimates any quantile to a rank error of roughly 1/k
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+
+class StreamingStats:
+
+    def __init__(self, name, units="-", thresholds=(), k=2048, seed=0):
+        """
+        This function initializes empty statistics.
+
+        Inputs
+        -----
+        name        :   str specifying the name of the quantity
+        units       :   str specifying the units of the quantity
+        thresholds  :   sequence of values whose exceedance probabilities P(x > threshold) are counted
+        k           :   quantile sketch capacity per level (see QuantileSketch)
+        seed        :   seed of the quantile sketch's random compaction
+        """
+
+        self.name = name
+        self.units = units
+        self.thresholds = np.asarray(thresholds, dtype=float)
+        self.n = 0
+        self.mean = 0.
+        self.M2 = 0.
+        self.min = np.inf
+        self.max = -np.inf
+        self.n_exceed = np.zeros(len(self.thresholds), dtype=np.int64)
+        self.sketch = QuantileSketch(k=k, seed=seed)
+
+    def update(self, x):
+        """
+        This function adds a chunk of samples; non-finite samples are ignored.
+        """
+
+        x = np.asarray(x, dtype=float).ravel()
+        x = x[np.isfinite(x)]
+        n = len(x)
+        if n == 0:
+            return
+
+        # merge the chunk's mean and sum of squared deviations (Chan et al.)
+        mean = float(np.mean(x))
+        M2 = float(np.sum((x - mean)**2))
+        n_total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / n_total
+        self.M2 += M2 + delta**2 * self.n * n / n_total
+        self.n = n_total
+
+        self.min = min(self.min, float(np.min(x)))
+        self.max = max(self.max, float(np.max(x)))
+        self.n_exceed += np.count_nonzero(x[:, None] > self.thresholds, axis=0)
+        self.sketch.update(x)
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.M2 / (self.n - 1))) if self.n > 1 else np.nan
+
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+
+    def exceedance(self):
+        """
+        This function returns the dictionary of threshold -> estimated P(x > threshold).
+        """
+
+        return {float(t): float(n) / max(self.n, 1) for t, n in zip(self.thresholds, self.n_exceed)}
+
+    def summary(self, quantiles=(0.05, 0.5, 0.95)):
+        """
+        This function summarizes the statistics in a dictionary.
+        """
+
+        return {
+            "n": self.n,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "quantiles": dict(zip(quantiles, np.atleast_1d(self.quantile(quantiles)).tolist())),
+            "exceedance": self.exceedance(),
+        }
+
+
+class QuantileSketch:
+
+    def __init__(self, k=2048, seed=0):
+        """
+        This function initializes an empty sketch.
+
+        Inputs
+        -----
+        k           :   capacity of each level; larger k is more accurate [-]
+        seed        :   seed of the random choice of which half survives a compaction
+        """
+
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, x):
+        """
+        This function adds a chunk of samples at weight 1.
+        """
+
+        self.levels[0] = np.concatenate([self.levels[0], np.asarray(x, dtype=float).ravel()])
+        self._compact()
+
+    def merge(self, other):
+        """
+        This function adds the items of another sketch (e.g. from another worker).
+        """
+
+        for h, items in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self._compact()
+
+        return self
+
+    def quantile(self, q):
+        """
+        This function estimates the quantile(s) q in [0, 1] from the weighted items of every level.
+        """
+
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return np.full(np.shape(q), np.nan)[()]
+        weights = np.concatenate([np.full(len(level), 2.**h) for h, level in enumerate(self.levels)])
+
+        order = np.argsort(items)
+        items = items[order]
+        rank = np.cumsum(weights[order]) - 0.5 * weights[order]
+
+        return np.interp(np.asarray(q, dtype=float) * np.sum(weights), rank, items)[()]
+
+    def _compact(self):
+        """
+        This function halves every level above capacity: its items are sorted and every other one,
+        starting at a random offset, is promoted to the next level at double weight.
+        """
+
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self.k:
+                level = np.sort(level)
+                n_even = len(level) - len(level) % 2
+                promoted = level[self.rng.integers(2):n_even:2]
+                self.levels[h] = level[n_even:]  # odd leftover item stays
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h+1] = np.concatenate([self.levels[h+1], promoted])
+            h += 1
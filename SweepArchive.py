@@ -0,0 +1,192 @@
+"""
+This class stores the results of a parameter sweep as memory-mapped .npy files indexed by grid coordinates,
+so sweeps whose results do not fit in memory can be written and read without ever loading them whole.
+
+Every result field is preallocated as one .npy file with the shape of the grid, and a completion bitmap
+(one bit per grid point) records which points are done. A chunk of points is marked done only after its
+results are flushed to disk, so an interrupted sweep resumes from its last completed chunk by running
+the archive again, and downstream analysis opens the archive read-only and zero-copy.
+
+Archive layout (one directory)
+--------
+meta.json       :   grid shape, axis values and field units
+<field>.npy     :   one memory-mapped array over the grid per result field
+done.npy        :   packed completion bitmap, bit i marks flat grid index i done
+
+Functions
+--------
+- create
+- run
+- done
+- progress
+
+Usage
+--------
+archive = SweepArchive.create("output/sweep", axes={"DL": DLs, "sigma": sigmas, "Mtip": Mtips},
+                              fields={"FM": "-", "P": "W"})
+archive.run(lambda DL, sigma, Mtip: compute_momentumTheory(T, rho, a, DL, sigma, Mtip, Np))  # resumes if rerun
+FM = SweepArchive("output/sweep")["FM"]  # read-only memmap over the grid
+
+Last Revised: 17 October 2026
+"""
+import json
+import os
+import time
+import numpy as np
+from Profiler import PROFILER
+
+class SweepArchive:
+
+    def __init__(self, path, mode="r"):
+        """
+        This function opens an existing archive without loading its data.
+
+        Inputs
+        -----
+        path        :   directory of the archive
+        mode        :   str specifying the access; "r" read-only or "r+" read/write
+
+        Outputs
+        -----
+        self.axes   :   dictionary of axis name -> 1-D array of grid values, in grid order
+        self.units  :   dictionary of field name -> units str
+        self.shape  :   grid shape
+        self.fields :   dictionary of field name -> memory-mapped array over the grid
+        self.bitmap :   memory-mapped packed completion bitmap
+        """
+
+        if mode not in ("r", "r+"):
+            raise ValueError("Inappropriate archive mode selected. Available modes include 'r' and 'r+'.")
+
+        with open(os.path.join(path, "meta.json")) as file:
+            meta = json.load(file)
+
+        self.path = path
+        self.mode = mode
+        self.shape = tuple(meta["shape"])
+        self.axes = {key: np.asarray(value) for key, value in meta["axes"].items()}
+        self.units = meta["fields"]
+        self.fields = {key: np.load(os.path.join(path, f"{key}.npy"), mmap_mode=mode) for key in self.units}
+        self.bitmap = np.load(os.path.join(path, "done.npy"), mmap_mode=mode)
+
+    @classmethod
+    def create(cls, path, axes, fields, dtype=np.float64):
+        """
+        This function preallocates a new archive, or reopens an existing one with the same grid and fields
+        for resuming.
+
+        Inputs
+        -----
+        path        :   directory of the archive (created if missing)
+        axes        :   dictionary of axis name -> 1-D array of grid values
+        fields      :   dictionary of result field name -> units str
+        dtype       :   dtype of the result fields
+
+        Outputs
+        -----
+        archive     :   SweepArchive opened in "r+" mode
+        """
+
+        meta = {
+            "shape": [len(value) for value in axes.values()],
+            "axes": {key: np.asarray(value).tolist() for key, value in axes.items()},
+            "fields": dict(fields),
+        }
+
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as file:
+                if json.load(file) != meta:
+                    raise ValueError(f"An archive with a different grid or fields already exists at '{path}'.")
+            return cls(path, mode="r+")
+
+        os.makedirs(path, exist_ok=True)
+        shape = tuple(meta["shape"])
+        for key in fields:
+            np.lib.format.open_memmap(os.path.join(path, f"{key}.npy"), mode="w+", dtype=dtype, shape=shape).flush()
+        np.lib.format.open_memmap(os.path.join(path, "done.npy"), mode="w+", dtype=np.uint8,
+                                  shape=(-(-int(np.prod(shape)) // 8),)).flush()
+
+        # metadata last: an archive without it was never fully allocated
+        with open(meta_path, "w") as file:
+            json.dump(meta, file)
+
+        return cls(path, mode="r+")
+
+    def __getitem__(self, field):
+        return self.fields[field]
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def done(self, index=None):
+        """
+        This function returns the completion flags of flat grid indices, or the boolean grid of all
+        completion flags when index is None.
+        """
+
+        if index is None:
+            return np.unpackbits(self.bitmap, count=self.size, bitorder="little").astype(bool).reshape(self.shape)
+
+        index = np.asarray(index)
+        return ((self.bitmap[index >> 3] >> (index & 7).astype(np.uint8)) & 1).astype(bool)
+
+    def progress(self):
+        """
+        This function returns the number of completed and total grid points.
+        """
+
+        return int(np.unpackbits(self.bitmap, count=self.size, bitorder="little").sum()), self.size
+
+    def run(self, func, chunk_size=65536):
+        """
+        This function evaluates every grid point that is not done yet, chunk by chunk, writing each chunk's
+        results to the memory-mapped fields and then marking it done.
+
+        Inputs
+        -----
+        func        :   function called with keyword arguments axis name -> 1-D array of the coordinates of
+                        a chunk of points; returns a dictionary holding (at least) every field, each an
+                        array (or broadcastable value) over the chunk
+        chunk_size  :   number of grid points evaluated at a time; a multiple of 8 keeps chunks on whole
+                        bitmap bytes
+
+        Outputs
+        -----
+        self        :   SweepArchive with every grid point done
+        """
+
+        if self.mode != "r+":
+            raise ValueError("The archive is opened read-only; open it with mode='r+' to run the sweep.")
+
+        n_done, n = self.progress()
+        if n_done:
+            print(f"Resuming sweep at {n_done} of {n} points done.")
+
+        flat = {key: value.reshape(-1) for key, value in self.fields.items()}
+        t0 = time.perf_counter()
+
+        for start in range(0, n, chunk_size):
+            index = np.arange(start, min(start + chunk_size, n))
+            index = index[~self.done(index)]
+            if len(index) == 0:
+                continue
+
+            with PROFILER.stage("sweep_chunk", points=len(index)):
+                coords = np.unravel_index(index, self.shape)
+                results = func(**{key: axis[i] for (key, axis), i in zip(self.axes.items(), coords)})
+                for key, value in flat.items():
+                    value[index] = np.broadcast_to(results[key], index.shape)
+
+                # results reach the disk before the bitmap claims them
+                for value in self.fields.values():
+                    value.flush()
+                np.bitwise_or.at(self.bitmap, index >> 3, (1 << (index & 7)).astype(np.uint8))
+                self.bitmap.flush()
+
+            PROFILER.count("sweep_points", len(index))
+
+        print(f"Completed sweep of {n} points ({n - n_done} evaluated) in {time.perf_counter() - t0:.3g} s.")
+
+        return self
@@ -9,14 +9,16 @@ units   :   str specifying the unit of the variable
 
 Outputs
 -----
-dict_entry      :   dict for dictionary entry
+dict_entry      :   Quantity for dictionary entry; a slotted record that supports the same
+                    ['name'], ['value'] and ['units'] access as a dict
 
 Author: Matt Asper
-Last Revised: 24 December 2025
+Last Revised: 17 October 2026
 """
+from Quantity import Quantity
 
 def add_dictEntry(name, value, units):
 
-    dict_entry = {'name': name, 'value': value, 'units': units}
+    dict_entry = Quantity(name, value, units)
 
     return dict_entry
@@ -0,0 +1,259 @@
+"""
+This script benchmarks the sizing hot paths at realistic scales and stores throughput and peak memory
+as JSON. Results are compared against the committed benchmarks/hotpaths_baseline.json and the script
+exits with status 1 when any benchmark's throughput drops (or peak memory grows) beyond the threshold.
+
+Timings are the median of several independent repeats, each long enough to swamp timer and scheduling
+noise, and their relative interquartile spread is stored with them. A benchmark only fails when it
+regresses beyond the threshold (widened to twice the measured spread for noisy benchmarks) and the
+regression reproduces on re-measure. The Python and numpy versions and the machine are stored with the
+results, and a warning is printed when they differ from the baseline's, since throughput is then not
+comparable.
+
+Benchmarks
+--------
+- momentumTheory_single     :   Propeller.run_momentumTheory, one scalar rotor
+- momentumTheory_sweep_*    :   Propeller.run_momentumTheory on batched DL x sigma x Mtip grids
+- get_atmos_scalar          :   get_atmos at single altitudes, with the point lookup cache cleared
+- get_atmos_array_*         :   get_atmos segment averages and query_atmos over altitude arrays
+- mission_*                 :   Mission.__init__ + find_positions for 10 to 10,000 segments
+- aircraft_init             :   Aircraft construction (config load + MTOW convergence)
+- aircraft_output_specs     :   Aircraft.output_specs csv export
+
+Usage
+--------
+python benchmarks/bench_hotpaths.py                     # run, store results, compare to baseline
+python benchmarks/bench_hotpaths.py --update            # store the current results as the baseline
+python benchmarks/bench_hotpaths.py --only mission      # run benchmarks whose name contains 'mission'
+python benchmarks/bench_hotpaths.py --retries 3         # a regression must reproduce on 3 re-measures
+
+Last Revised: 17 October 2026
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import numpy as np
+from Aircraft import Aircraft
+from Mission import Mission
+from Propeller import Propeller
+from get_atmos import get_atmos, query_atmos, _get_atmosPoint
+from read_yml import read_yml, thaw
+
+BASELINE = os.path.join(ROOT, "benchmarks", "hotpaths_baseline.json")
+RESULTS = os.path.join(ROOT, "benchmarks", "hotpaths_results.json")
+CONFIG = "configs/group1_quad.yml"
+
+def measure(func, n_items, repeat=7, min_time=0.05):
+    """
+    This function times repeated calls of 'func' and measures the peak memory of one call.
+
+    Inputs
+    -----
+    func        :   function of no arguments to benchmark; called once for warm-up
+    n_items     :   number of items (rotors, altitudes, segments, ...) processed per call
+    repeat      :   number of independent timing repeats
+    min_time    :   minimum duration of one repeat [s]; fast functions are called many times per repeat
+
+    Outputs
+    -----
+    result      :   dictionary of "n_items", "time_s" (median time per call), "spread" (relative
+                    interquartile range of the repeats), "throughput" [items/s] and "peak_mb"
+    """
+
+    func()  # warm-up (caches, lazy imports, compilation)
+
+    # calls per repeat, so microsecond benchmarks are timed over many calls
+    t0 = time.perf_counter()
+    func()
+    number = max(1, min(int(min_time / max(time.perf_counter() - t0, 1e-9)), 10**6))
+
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - t0) / number)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    q1, median, q3 = np.percentile(timings, [25, 50, 75])
+
+    return {"n_items": n_items, "time_s": median, "spread": (q3 - q1) / median, "throughput": n_items / median,
+            "peak_mb": peak / 1e6}
+
+
+def build_benchmarks():
+    """
+    This function builds the dictionary of benchmark name -> (function, items per call).
+    """
+
+    benchmarks = dict()
+    prop_specs = {
+        "Np": {"name": "Np", "value": 4, "units": "-"},
+        "Mtip": {"name": "Mtip", "value": 0.4, "units": "-"},
+        "sigma": {"name": "sigma", "value": 0.08, "units": "-"},
+        "DL": {"name": "DL", "value": 500, "units": "Pa"},
+    }
+    atmos = get_atmos(10)
+
+    # momentum theory, single rotor
+    prop = Propeller(**prop_specs)
+    benchmarks["momentumTheory_single"] = (lambda: prop.run_momentumTheory(65.4, atmos["rho"], atmos["a"]), 1)
+
+    # momentum theory, batched design grids
+    for n in (10**4, 10**6):
+        n_side = round(n ** (1 / 3))
+        grid = np.meshgrid(np.linspace(100, 700, n_side), np.linspace(0.05, 0.15, n_side),
+                           np.linspace(0.3, 0.6, n_side), indexing="ij", sparse=True)
+        specs = dict(prop_specs)
+        specs["DL"] = {"name": "DL", "value": grid[0], "units": "Pa"}
+        specs["sigma"] = {"name": "sigma", "value": grid[1], "units": "-"}
+        specs["Mtip"] = {"name": "Mtip", "value": grid[2], "units": "-"}
+        prop_grid = Propeller(**specs)
+        benchmarks[f"momentumTheory_sweep_{n_side**3}"] = (
+            lambda p=prop_grid: p.run_momentumTheory(65.4, atmos["rho"], atmos["a"]), n_side**3)
+
+    # atmosphere
+    alts = np.random.default_rng(0).uniform(0, 5000, 1000)
+    def atmos_scalar():
+        # time the lookups rather than hits of the memoized point lookup
+        _get_atmosPoint.cache_clear()
+        return [get_atmos(alt) for alt in alts[:100]]
+    benchmarks["get_atmos_scalar"] = (atmos_scalar, 100)
+    benchmarks["get_atmos_array_segment"] = (lambda: [get_atmos([0, alt]) for alt in alts[:100]], 100)
+    alts_big = np.random.default_rng(0).uniform(0, 5000, 10**6)
+    benchmarks["get_atmos_array_query_1000000"] = (lambda: query_atmos(alts_big), 10**6)
+
+    # missions of growing length
+    config = thaw(read_yml(CONFIG))
+    base = config["mission"]["segments"]
+    for n in (10, 100, 1000, 10000):
+        config_n = dict(config)
+        config_n["mission"] = {"segments": [base[i % len(base)] for i in range(n)]}
+        benchmarks[f"mission_{n}"] = (lambda c=config_n: Mission(run_mode="auto", config_params=c), n)
+
+    # aircraft
+    def init_aircraft():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return Aircraft(run_mode="auto", config_path=CONFIG)
+    benchmarks["aircraft_init"] = (init_aircraft, 1)
+
+    aircraft = init_aircraft()
+    tmpdir = tempfile.mkdtemp()
+    def output_specs():
+        with contextlib.redirect_stdout(io.StringIO()):
+            aircraft.output_specs(filepath=tmpdir, filename="bench")
+    benchmarks["aircraft_output_specs"] = (output_specs, 1)
+
+    return benchmarks
+
+
+def get_environment():
+    """
+    This function returns the Python and numpy versions and the machine the benchmarks run on.
+    """
+
+    return {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine()}
+
+
+def compare_environment(baseline):
+    """
+    This function prints a warning for every entry of the environment that differs from the baseline's.
+    """
+
+    for key, value in get_environment().items():
+        if baseline.get(key, value) != value:
+            print(f"Warning: the baseline was recorded with {key} {baseline[key]} (now {value}); throughput "
+                  f"differences may come from the environment. Run with --update to record a new baseline.")
+
+
+def compare(results, baseline, threshold):
+    """
+    This function compares results with a baseline and returns the names of regressed benchmarks. The
+    throughput threshold of a benchmark is widened to twice the spread of its noisier measurement.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:34}: new benchmark")
+            continue
+
+        speed = result["throughput"] / baseline[name]["throughput"]
+        memory = result["peak_mb"] / max(baseline[name]["peak_mb"], 1e-3)
+        tolerance = max(threshold, 2 * max(result.get("spread", 0.), baseline[name].get("spread", 0.)))
+        regressed = speed < 1 - tolerance or memory > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:34}: {speed:5.2f}x throughput (+/-{tolerance:4.0%})  {memory:5.2f}x memory  "
+              f"{'REGRESSION' if regressed else 'ok'}")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the eVTOL sizing hot paths.")
+    parser.add_argument("--only", default="", help="run benchmarks whose name contains this string")
+    parser.add_argument("--threshold", type=float, default=0.3, help="allowed relative regression [-]")
+    parser.add_argument("--retries", type=int, default=2, help="re-measures a regression must reproduce on")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    benchmarks = {name: value for name, value in build_benchmarks().items() if args.only in name}
+
+    results = dict()
+    for name, (func, n_items) in benchmarks.items():
+        results[name] = measure(func, n_items)
+        r = results[name]
+        print(f"{name:34}: {r['time_s'] * 1e3:10.3f} ms  {r['throughput']:12.4g} items/s  "
+              f"(+/-{r['spread']:4.0%})  {r['peak_mb']:9.2f} MB")
+
+    regressions = []
+    if not args.update and os.path.exists(BASELINE):
+        with open(BASELINE) as file:
+            baseline = json.load(file)
+
+        print()
+        compare_environment(baseline)
+        baseline = baseline["benchmarks"]
+        regressions = compare(results, baseline, args.threshold)
+
+        # a regression only counts when it reproduces on every re-measure
+        for _ in range(args.retries):
+            if not regressions:
+                break
+            print(f"\nRe-measuring {len(regressions)} regressed benchmark(s)...")
+            for name in regressions:
+                results[name] = measure(*benchmarks[name])
+            regressions = compare({name: results[name] for name in regressions}, baseline, args.threshold)
+
+    report = {**get_environment(), "benchmarks": results}
+
+    with open(BASELINE if args.update else RESULTS, "w") as file:
+        json.dump(report, file, indent=1)
+
+    if args.update:
+        print(f"Successfully updated '{BASELINE}'")
+    elif not os.path.exists(BASELINE):
+        print("No baseline found; run with --update to store one.")
+
+    return 1 if regressions else 0
+
+
+if __name__=="__main__":
+    sys.exit(main())
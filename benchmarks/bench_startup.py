@@ -0,0 +1,108 @@
+"""
+This script measures the startup time of fresh interpreters importing the command line entry point and
+the pipeline modules, and checks that the heavy optional libraries stay unimported until first use.
+Results are compared against benchmarks/startup_baseline.json; the script exits with status 1 on a
+regression so it can gate CI or nightly jobs.
+
+Usage
+--------
+python benchmarks/bench_startup.py              # compare against the stored baseline
+python benchmarks/bench_startup.py --update     # store the current timings as the baseline
+
+Last Revised: 17 October 2026
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "benchmarks", "startup_baseline.json")
+
+# libraries that must only be imported on first use
+HEAVY_MODULES = ["plotly", "ambiance", "numba", "pandas", "scipy", "astropy", "orjson"]
+
+# interpreter commands to time
+TARGETS = {
+    "python": "pass",
+    "import evtol": "import evtol",
+    "import pipeline": "import Aircraft, Mission, Propeller",
+    "evtol --help": "import evtol, contextlib, io\nwith contextlib.redirect_stdout(io.StringIO()):\n"
+                    "    try: evtol.main(['--help'])\n    except SystemExit: pass",
+}
+
+def time_target(code, repeat):
+    """
+    This function times 'repeat' fresh interpreters running 'code' and returns the timings [s].
+    """
+
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        timings.append(time.perf_counter() - t0)
+
+    return timings
+
+
+def find_heavyImports():
+    """
+    This function returns the heavy libraries imported by importing the entry point and pipeline modules.
+    """
+
+    code = ("import sys, json, evtol, Aircraft, Mission, Propeller, run_batch, ResultsStore\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True)
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Startup-time benchmark of the eVTOL design code.")
+    parser.add_argument("--repeat", type=int, default=10, help="fresh interpreters per target")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown [-]")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = dict()
+    for name, code in TARGETS.items():
+        timings = time_target(code, args.repeat)
+        results[name] = {"min_s": min(timings), "median_s": statistics.median(timings)}
+
+    # report import cost net of the bare interpreter
+    python = results["python"]["min_s"]
+    for name, result in results.items():
+        print(f"{name:20}: min {result['min_s'] * 1e3:8.1f} ms   (+{(result['min_s'] - python) * 1e3:7.1f} ms over python)")
+
+    heavy = find_heavyImports()
+    print(f"\nHeavy modules imported at startup: {heavy if heavy else 'none'}")
+
+    if args.update:
+        with open(BASELINE, "w") as file:
+            json.dump(results, file, indent=1)
+        print(f"Successfully updated '{BASELINE}'")
+        return 0
+
+    failed = len(heavy) > 0
+
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as file:
+            baseline = json.load(file)
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+            ratio = result["min_s"] / baseline[name]["min_s"]
+            status = "REGRESSION" if ratio > 1 + args.threshold else "ok"
+            failed |= status == "REGRESSION"
+            print(f"{name:20}: {ratio:5.2f}x baseline  {status}")
+    else:
+        print("No baseline found; run with --update to store one.")
+
+    return 1 if failed else 0
+
+
+if __name__=="__main__":
+    sys.exit(main())
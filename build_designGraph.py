@@ -0,0 +1,174 @@
+"""
+This function builds the dependency graph (see DependencyGraph) of one vehicle design from a parsed config,
+covering the Aircraft -> Mission -> Propeller pipeline of run_pipeline at the granularity of single
+requirements, parameters and mission segments. Editing an input, e.g.
+    graph["mission.cruise.duration"] = 150.
+    graph["prop.DL"] = 600.
+    graph["reqs.payload"] = 1.5
+and reading an output, e.g. graph["energy"], recomputes only the nodes downstream of the edit: a segment
+duration re-runs that segment's displacement and energy and the positions of the later segments, whose
+atmosphere and energy are reused as long as their altitudes are unchanged; a requirement or propeller
+parameter re-runs the MTOW iteration, the propeller and the segment energies but no mission geometry.
+
+Nodes
+-----
+reqs.<key>, subsystems.<key>, prop.<key>        :   input values of the config sections in the internal units
+                                                    (see read_yml.convert_units), e.g. reqs.range [m],
+                                                    reqs.payload [kg], subsystems.e_batt [J/kg], not the
+                                                    units written in the config
+mission.<segment>.duration                      :   input segment duration [s]
+mission.<segment>.Velocity                      :   input segment velocity [m/s]
+reqs, subsystems, prop                          :   dictionaries of Quantity entries of each section
+sizing                                          :   dictionary of MTOW [kg], subsystem masses [kg], P_hover [W]
+                                                    and converged (see Aircraft.compute_MTOW)
+MTOW                                            :   max takeoff weight [kg]
+E_batt                                          :   usable battery energy [J]
+mission.<segment>.displacement, .start, .end    :   segment displacement and end point positions [m]
+mission.<segment>.alt                           :   (start, end) altitude of the segment [m]
+mission.<segment>.atmos                         :   dictionary of segment-averaged atmospheric quantities
+mission.<segment>.energy                        :   dictionary of the segment's battery energy E [J] and
+                                                    peak power P_max [W]
+mission                                         :   Mission assembled from the segment nodes
+propeller                                       :   Propeller sized with momentum theory for hover at MTOW
+                                                    in the first segment's atmosphere
+energy                                          :   dictionary of mission energy results (see Mission.simulate_energy)
+
+Inputs
+-----
+config_params   :   parsed config dictionary; segment names must be unique. Its values are converted to the
+                    internal units, and edits of the graph inputs must be given in those units, e.g. segment
+                    durations in s and velocities in m/s
+dt              :   mission time step [s]
+
+Outputs
+-----
+graph           :   DependencyGraph
+
+Last Revised: 17 October 2026
+"""
+import contextlib
+import io
+import numpy as np
+from add_dictEntry import add_dictEntry
+from compute_distance import compute_distance
+from compute_subsystemMasses import PROP_DEFAULTS, SUBSYSTEM_DEFAULTS
+from DependencyGraph import DependencyGraph
+from get_atmos import get_atmos_segments
+from read_yml import convert_units, thaw
+
+# gravitational acceleration [m/s^2]
+G = 9.81
+
+def build_designGraph(config_params, dt=1.):
+
+    # imported here, as in run_pipeline, so the graph module itself stays light
+    from Aircraft import Aircraft
+    from Mission import Mission
+    from Propeller import Propeller
+
+    # graph inputs hold internal units; a no-op for configs loaded with read_yml
+    config_params = convert_units(config_params)
+
+    graph = DependencyGraph()
+
+    # config sections: one input node per value, one node assembling the section
+    sections = {
+        "reqs": dict(config_params["reqs"]),
+        "subsystems": {**SUBSYSTEM_DEFAULTS, **config_params.get("subsystems", dict())},
+        "prop": {**PROP_DEFAULTS, **config_params.get("prop", dict())},
+    }
+    for section, entries in sections.items():
+        units = {key: entry["units"] for key, entry in entries.items()}
+        for key, entry in entries.items():
+            graph.add_input(f"{section}.{key}", entry["value"])
+
+        def assemble(*values, units=units):
+            return {key: add_dictEntry(key, value, unit) for (key, unit), value in zip(units.items(), values)}
+
+        graph.add_node(section, assemble, deps=[f"{section}.{key}" for key in entries])
+
+    # MTOW iteration
+    def size(reqs, subsystems, prop):
+        with contextlib.redirect_stdout(io.StringIO()):
+            aircraft = Aircraft(run_mode="auto", config_params={"reqs": reqs, "subsystems": subsystems, "prop": prop})
+        return {
+            "MTOW": aircraft.reqs["MTOW"]["value"],
+            "subsystem": {key: value["value"] for key, value in aircraft.subsystem.items()},
+            "P_hover": aircraft.P_hover["value"],
+            "converged": aircraft.converged,
+        }
+
+    def usable_energy(sizing, subsystems):
+        return float(sizing["subsystem"]["battery"]) * subsystems["e_batt"]["value"] * subsystems["f_usable"]["value"]
+
+    graph.add_node("sizing", size, deps=("reqs", "subsystems", "prop"))
+    graph.add_node("MTOW", lambda sizing: float(sizing["MTOW"]), deps=("sizing",))
+    graph.add_node("E_batt", usable_energy, deps=("sizing", "subsystems"))
+
+    # mission segments
+    segments = [thaw(seg) for seg in config_params["mission"]["segments"]]
+    names = [seg["name"] for seg in segments]
+    if len(set(names)) != len(names):
+        raise ValueError("Mission segment names must be unique to name the nodes of the design graph.")
+
+    def segment_energy(MTOW, prop, subsystems, duration, velocity, alt):
+        mission = Mission.from_arrays(
+            [{"name": "segment"}], [duration], [velocity], compute_distance(duration, np.asarray([velocity])),
+            [[0., alt[0]]], [[0., alt[1]]], {})
+        mission.simulate_energy(MTOW, prop, np.inf, dt=dt, keep_history=False, eta=subsystems["eta"]["value"])
+        return {"E": float(mission.segments[0]["energy"]), "P_max": mission.energy["P_max"]["value"]}
+
+    previous_end = None
+    for seg in segments:
+        node = f"mission.{seg['name']}"
+        graph.add_input(f"{node}.duration", float(seg["duration"]))
+        graph.add_input(f"{node}.Velocity", np.asarray(seg["Velocity"], dtype=float))
+
+        graph.add_node(f"{node}.displacement", compute_distance, deps=(f"{node}.duration", f"{node}.Velocity"))
+        if previous_end is None:
+            graph.add_node(f"{node}.start", lambda: np.zeros(2))
+        else:
+            graph.add_node(f"{node}.start", lambda end: end, deps=(previous_end,))
+        graph.add_node(f"{node}.end", lambda start, displacement: start + displacement,
+                       deps=(f"{node}.start", f"{node}.displacement"))
+        graph.add_node(f"{node}.alt", lambda start, end: (float(start[1]), float(end[1])),
+                       deps=(f"{node}.start", f"{node}.end"))
+        graph.add_node(f"{node}.atmos",
+                       lambda alt: {key: float(value[0]) for key, value in get_atmos_segments([alt[0]], [alt[1]]).items()},
+                       deps=(f"{node}.alt",))
+        graph.add_node(f"{node}.energy", segment_energy,
+                       deps=("MTOW", "prop", "subsystems", f"{node}.duration", f"{node}.Velocity", f"{node}.alt"))
+        previous_end = f"{node}.end"
+
+    def assemble_mission(*values):
+        durations, velocity, displacement, start, end, atmos = (values[i::6] for i in range(6))
+        atmos = {key: np.array([entry[key] for entry in atmos]) for key in atmos[0]}
+        segment_configs = [{**seg, "duration": duration, "Velocity": list(V)}
+                           for seg, duration, V in zip(segments, durations, velocity)]
+        return Mission.from_arrays(segment_configs, durations, velocity, displacement, start, end, atmos)
+
+    graph.add_node("mission", assemble_mission,
+                   deps=[f"mission.{name}.{key}" for name in names
+                         for key in ("duration", "Velocity", "displacement", "start", "end", "atmos")])
+
+    # hover propeller sizing in the first segment's atmosphere
+    def size_propeller(prop, MTOW, atmos):
+        propeller = Propeller(**prop)
+        propeller.run_propLoading("MT", MTOW * G, atmos["rho"], atmos["a"])
+        return propeller
+
+    graph.add_node("propeller", size_propeller, deps=("prop", "MTOW", f"mission.{names[0]}.atmos"))
+
+    # mission energy on the sized battery
+    def total_energy(E_batt, *energies):
+        E = sum(energy["E"] for energy in energies)
+        return {
+            "E": add_dictEntry("E", E, "J"),
+            "SOC": add_dictEntry("SOC", 1 - E / E_batt, "-"),
+            "P_max": add_dictEntry("P_max", max(energy["P_max"] for energy in energies), "W"),
+            "segments": {name: energy["E"] for name, energy in zip(names, energies)},
+        }
+
+    graph.add_node("energy", total_energy, deps=["E_batt"] + [f"mission.{name}.energy" for name in names])
+
+    return graph
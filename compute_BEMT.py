@@ -0,0 +1,190 @@
+"""
+This function applies blade element momentum theory (BEMT) with Prandtl tip losses to a batch of
+propeller operating points. The inflow at every radial station is found by a fixed-point iteration
+on the tip-loss factor; that inner loop is JIT-compiled with numba (cached to disk) and parallelized
+across operating points. numba is only imported when the first BEMT evaluation is made.
+
+Inputs
+-----
+blade           :   dictionary of blade geometry arrays (see Propeller.set_bladeGeometry)
+blade["Nb"]     :   number of blades [-]
+blade["r"]      :   nondimensional radial stations r/R [-]
+blade["dr"]     :   nondimensional width of each station [-]
+blade["sigma"]  :   local solidity at each station [-]; shape (Nr,), or (..., Nr) for a batch of rotors
+blade["twist"]  :   local twist relative to the 3/4 radius pitch at each station [rad]
+R               :   propeller radius [m]
+RPM             :   propeller speed [rev/min]
+theta0          :   collective pitch at 3/4 radius [rad]
+Vc              :   axial freestream (climb) velocity [m/s]
+rho             :   ambient air density [kg/m^3]
+
+R, RPM, theta0, Vc and rho may be scalars or broadcastable numpy arrays; one operating point is
+solved per element of their broadcast shape. A batch of rotor geometries (R and the leading axes of
+blade["sigma"]) is solved together with the operating points it broadcasts against, e.g. every
+candidate rotor of a screening in one kernel call; r, dr, twist and Nb are shared by the batch.
+
+Outputs
+-----
+perf            :   dictionary of numpy arrays with the broadcast shape of the operating points
+perf["CT"]      :   thrust coefficient [-]
+perf["CP"]      :   power coefficient [-]
+perf["CPi"]     :   induced and climb power coefficient [-]
+perf["CP0"]     :   profile power coefficient [-]
+perf["Tp"]      :   individual propeller thrust [N]
+perf["Pp"]      :   individual propeller power required [W]
+perf["Qp"]      :   individual propeller torque [N*m]
+perf["FM"]      :   propeller figure of merit [-]
+
+Last Revised: 17 October 2026
+"""
+from functools import lru_cache
+import numpy as np
+from Profiler import PROFILER
+from compute_momentumTheory import CLA, CD_COEFFS
+
+# replaced by numba.prange when the kernel is compiled (see _get_kernel)
+prange = range
+
+def compute_BEMT(blade, R, RPM, theta0, Vc, rho, tol=1e-8, max_iter=100):
+
+    # broadcast operating points and rotor geometries and flatten them for the kernel
+    sigma = np.asarray(blade["sigma"], dtype=float)
+    R, RPM, theta0, Vc, rho = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (R, RPM, theta0, Vc, rho)), np.empty(sigma.shape[:-1]))[:5]
+    shape = RPM.shape
+
+    # one row of local solidity shared by every operating point, or one row per operating point
+    if sigma.ndim == 1:
+        sigma = sigma[None]
+    else:
+        sigma = np.ascontiguousarray(np.broadcast_to(sigma, shape + sigma.shape[-1:]).reshape(-1, sigma.shape[-1]))
+
+    R = R.ravel()
+    Vtip = RPM.ravel() * 2 * np.pi / 60 * R
+    lam_c = Vc.ravel() / Vtip
+
+    CT, CPi, CP0 = _get_kernel()(blade["r"], blade["dr"], sigma, blade["twist"],
+                                np.ascontiguousarray(theta0.ravel()), lam_c, float(blade["Nb"]),
+                                CLA, CD_COEFFS[0], CD_COEFFS[1], CD_COEFFS[2], tol, max_iter)
+
+    # dimensionalize
+    A = np.pi * R**2
+    rho = rho.ravel()
+    CP = CPi + CP0
+    Tp = CT * rho * A * Vtip**2
+    Pp = CP * rho * A * Vtip**3
+    Qp = Pp / (Vtip / R)
+
+    # figure of merit
+    with np.errstate(invalid="ignore", divide="ignore"):
+        FM = np.where(CT > 0, np.maximum(CT, 0)**1.5 / np.sqrt(2) / CP, 0.)
+
+    perf = {
+        "CT": CT,
+        "CP": CP,
+        "CPi": CPi,
+        "CP0": CP0,
+        "Tp": Tp,
+        "Pp": Pp,
+        "Qp": Qp,
+        "FM": FM,
+    }
+    perf = {key: value.reshape(shape)[()] for key, value in perf.items()}
+
+    return perf
+
+
+def trim_collective(compute_CT, CT_req, theta0, tol=1e-10, max_iter=50):
+    """
+    This function finds the collective pitch that produces a required thrust coefficient for a
+    batch of operating points with a vectorized secant iteration.
+
+    Inputs
+    -----
+    compute_CT  :   function returning the thrust coefficient array for an array of collectives
+    CT_req      :   required thrust coefficient at each operating point [-]
+    theta0      :   initial guess of the 3/4 radius collective pitch at each operating point [rad]
+
+    Outputs
+    -----
+    theta0      :   trimmed 3/4 radius collective pitch [rad]
+    """
+
+    theta_a = np.array(theta0, dtype=float)
+    theta_b = theta_a + 0.01
+    res_a = compute_CT(theta_a) - CT_req
+    res_b = compute_CT(theta_b) - CT_req
+
+    for _ in range(max_iter):
+        if np.all(np.abs(res_b) <= tol * np.maximum(np.abs(CT_req), 1e-12)):
+            break
+
+        # secant update, holding points that have already converged
+        slope = res_b - res_a
+        step = np.where(slope != 0, res_b * (theta_b - theta_a) / np.where(slope != 0, slope, 1), 0.)
+        theta_a, res_a = theta_b, res_b
+        theta_b = theta_b - step
+        res_b = compute_CT(theta_b) - CT_req
+        PROFILER.count("collective_trim_iterations")
+
+    return theta_b
+
+
+@lru_cache(maxsize=1)
+def _get_kernel():
+    """
+    This function imports numba and compiles the BEMT kernel on first use, so importing this module
+    (and Propeller) does not pay the numba import cost.
+    """
+
+    global prange
+    import numba
+    prange = numba.prange
+
+    return numba.njit(cache=True, parallel=True)(_bemt_kernel)
+
+
+def _bemt_kernel(r, dr, sigma, twist, theta0, lam_c, Nb, Cla, cd0, cd1, cd2, tol, max_iter):
+    """
+    This function integrates the BEMT thrust and power coefficients for every operating point; sigma
+    holds one row of local solidity per operating point, or a single row shared by all of them.
+    """
+
+    n_op = theta0.shape[0]
+    n_r = r.shape[0]
+    shared = sigma.shape[0] == 1
+
+    CT = np.zeros(n_op)
+    CPi = np.zeros(n_op)
+    CP0 = np.zeros(n_op)
+
+    for k in prange(n_op):
+        s = sigma[0] if shared else sigma[k]
+        for j in range(n_r):
+            theta = theta0[k] + twist[j]
+
+            # inflow with Prandtl tip loss, iterated on the tip-loss factor F
+            F = 1.
+            lam = 0.
+            for _ in range(max_iter):
+                b = s[j] * Cla / (16 * F) - lam_c[k] / 2
+                lam_new = np.sqrt(max(b**2 + s[j] * Cla / (8 * F) * theta * r[j], 0.)) - b
+                f = Nb / 2 * (1 - r[j]) / max(lam_new, 1e-12)
+                F = max(2 / np.pi * np.arccos(np.exp(-f)), 1e-6)
+                if abs(lam_new - lam) < tol:
+                    lam = lam_new
+                    break
+                lam = lam_new
+
+            # sectional aerodynamics
+            alpha = theta - lam / r[j]
+            Cl = Cla * alpha
+            Cd = cd0 + cd1 * alpha + cd2 * alpha**2
+
+            # integrate thrust, induced/climb and profile power coefficients
+            dCT = 0.5 * s[j] * Cl * r[j]**2 * dr[j]
+            CT[k] += dCT
+            CPi[k] += lam * dCT
+            CP0[k] += 0.5 * s[j] * Cd * r[j]**3 * dr[j]
+
+    return CT, CPi, CP0
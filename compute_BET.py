@@ -0,0 +1,106 @@
+"""
+This function applies blade element theory (BET) with a uniform, momentum theory inflow to a batch of
+propeller operating points. Sectional loads are evaluated on an (operating point x radial station)
+array and integrated across the stations with a single matrix product, so a full thrust-power map of
+one rotor (e.g. RPM[:, None] against theta0[None, :]) is produced in one call.
+
+Inputs
+-----
+blade           :   dictionary of blade geometry arrays (see Propeller.set_bladeGeometry); blade["sigma"]
+                    may hold a batch of rotors along leading axes, shape (..., Nr)
+R               :   propeller radius [m]
+RPM             :   propeller speed [rev/min]
+theta0          :   collective pitch at 3/4 radius [rad]
+Vc              :   axial freestream (climb) velocity [m/s]
+rho             :   ambient air density [kg/m^3]
+kappa           :   induced power factor applied to the uniform inflow [-]
+polar           :   optional AirfoilPolar; replaces Bailey's drag curve with the polar's drag at every
+                    station's angle of attack, Reynolds and Mach number
+a               :   ambient speed of sound [m/s]; required with a polar
+
+R, RPM, theta0, Vc, rho and a may be scalars or broadcastable numpy arrays; a batch of rotor geometries
+(R and the leading axes of blade["sigma"]) is evaluated together with the operating points it broadcasts
+against, e.g. every candidate rotor of a screening at its own operating point.
+
+Outputs
+-----
+perf            :   dictionary of numpy arrays with the broadcast shape of the operating points
+perf["CT"]      :   thrust coefficient [-]
+perf["CP"]      :   power coefficient [-]
+perf["CPi"]     :   induced and climb power coefficient [-]
+perf["CP0"]     :   profile power coefficient [-]
+perf["lam"]     :   uniform inflow ratio [-]
+perf["Tp"]      :   individual propeller thrust [N]
+perf["Pp"]      :   individual propeller power required [W]
+perf["Qp"]      :   individual propeller torque [N*m]
+perf["FM"]      :   propeller figure of merit [-]
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+from compute_BEMT import CLA, CD_COEFFS
+
+def compute_BET(blade, R, RPM, theta0, Vc, rho, kappa=1.15, polar=None, a=None):
+
+    r, dr, sigma, twist = blade["r"], blade["dr"], blade["sigma"], blade["twist"]
+
+    # operating points broadcast against the batch of rotor geometries, if any
+    R, RPM, theta0, Vc, rho = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (R, RPM, theta0, Vc, rho)), np.empty(np.shape(sigma)[:-1]))[:5]
+
+    Vtip = RPM * 2 * np.pi / 60 * R
+    lam_c = Vc / Vtip
+
+    # thrust is linear in inflow: CT = CT_theta - CT_lam * lam
+    CT_theta = ((theta0[..., None] + twist) * sigma) @ (0.5 * CLA * r**2 * dr)
+    CT_lam = sigma @ (0.5 * CLA * r * dr)
+
+    # uniform inflow from momentum theory, lam = lam_c + kappa * (u - lam_c / 2) with
+    # u = sqrt((lam_c / 2)**2 + CT / 2); substituting the linear thrust gives a quadratic in u,
+    # solved in closed form for the whole batch. Non-positive thrust leaves the inflow at lam_c.
+    b = kappa * CT_lam / 4
+    c = lam_c**2 / 4 + (CT_theta - CT_lam * lam_c * (1 - kappa / 2)) / 2
+    u = np.maximum(np.sqrt(np.maximum(b**2 + c, 0)) - b, np.abs(lam_c) / 2)
+    lam = lam_c + kappa * (u - lam_c / 2)
+    CT = CT_theta - CT_lam * lam
+
+    # sectional angle of attack and drag over (operating point x station)
+    alpha = theta0[..., None] + twist - lam[..., None] / r
+    if polar is None:
+        Cd = CD_COEFFS[0] + CD_COEFFS[1] * alpha + CD_COEFFS[2] * alpha**2
+    else:
+        if a is None:
+            raise ValueError("The speed of sound 'a' is required to evaluate the airfoil polar.")
+        U = Vtip[..., None] * np.hypot(r, lam[..., None])
+        chord = sigma * np.pi * R[..., None] / blade["Nb"]
+        Cd = polar.query_section(alpha, rho[..., None], U, chord, np.asarray(a, dtype=float)[..., None])["Cd"]
+
+    # integrate power coefficients across stations
+    CPi = lam * CT
+    CP0 = (Cd * sigma * r**3) @ (0.5 * dr)
+    CP = CPi + CP0
+
+    # dimensionalize
+    A = np.pi * R**2
+    Tp = CT * rho * A * Vtip**2
+    Pp = CP * rho * A * Vtip**3
+    Qp = Pp / (Vtip / R)
+
+    # figure of merit
+    with np.errstate(invalid="ignore", divide="ignore"):
+        FM = np.where(CT > 0, np.maximum(CT, 0)**1.5 / np.sqrt(2) / CP, 0.)
+
+    perf = {
+        "CT": CT,
+        "CP": CP,
+        "CPi": CPi,
+        "CP0": CP0,
+        "lam": lam,
+        "Tp": Tp,
+        "Pp": Pp,
+        "Qp": Qp,
+        "FM": FM,
+    }
+    perf = {key: np.asarray(value)[()] for key, value in perf.items()}
+
+    return perf
@@ -0,0 +1,73 @@
+"""
+This function estimates the electrical power a multirotor draws along a mission with momentum theory
+in forward and axial flight. Every input is broadcast, so whole mission time histories are evaluated
+in one vectorized pass.
+
+Power model
+-----
+thrust      :   T = sqrt(W^2 + D^2), with parasite drag D = 1/2 * rho * Vx^2 * f_e
+induced     :   Glauert inflow vi = vh^2 / sqrt(Vx^2 + (max(Vz, 0) + vi)^2), with vh from the disk loading
+profile     :   momentum theory hover profile power scaled by (1 + 4.65 * mu^2)
+climb       :   W * Vz (negative in descent)
+parasite    :   D * Vx
+
+Inputs
+-----
+W           :   vehicle weight [N]
+Vx          :   horizontal airspeed [m/s]
+Vz          :   vertical (climb) speed [m/s]
+rho         :   ambient air density [kg/m^3]
+a           :   ambient speed of sound [m/s]
+prop        :   dictionary of propeller parameters; uses "Np", "Mtip", "sigma", "DL" and, when present,
+                the total disk area "A" of a sized propeller (see Propeller.run_momentumTheory), which is
+                then held fixed at every weight; without "A" the disk is sized for each weight at "DL"
+f_e         :   equivalent flat plate drag area [m^2]
+kappa       :   induced power factor [-]
+eta         :   battery to shaft efficiency [-]
+
+Outputs
+-----
+P           :   electrical power drawn from the battery [W]
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+from compute_momentumTheory import compute_momentumTheory
+from compute_subsystemMasses import PROP_DEFAULTS
+
+def compute_missionPower(W, Vx, Vz, rho, a, prop, f_e=0.02, kappa=1.15, eta=0.85, n_iter=20):
+
+    A = prop["A"]["value"] if "A" in prop else None
+    prop = {key: prop.get(key, default)["value"] for key, default in PROP_DEFAULTS.items()}
+
+    # hover at the vehicle weight on the sized disk (its disk loading changes with weight), or on a disk
+    # sized for the weight; the tip speed is held at the tip Mach number
+    DL = prop["DL"] if A is None else W / A
+    hover = compute_momentumTheory(W, rho, a, DL, prop["sigma"], prop["Mtip"], prop["Np"], kappa=kappa)
+    A = hover["A"]
+    Vtip = hover["Vtip"]
+
+    # rotor thrust balances weight and parasite drag
+    Vx = np.abs(Vx)
+    D = 0.5 * rho * Vx**2 * f_e
+    T = np.sqrt(W**2 + D**2)
+
+    # Glauert inflow, solved by Newton iteration from the hover value
+    vh = np.sqrt(T / (2 * rho * A))
+    Vc = np.maximum(Vz, 0)
+    vi = vh * np.ones_like(Vx * Vc)
+    for _ in range(n_iter):
+        root = np.sqrt(Vx**2 + (Vc + vi)**2)
+        f = vi - vh**2 / root
+        df = 1 + vh**2 * (Vc + vi) / root**3
+        vi = np.maximum(vi - f / df, 0)
+
+    # power components
+    Pi = kappa * T * vi
+    P0 = hover["P0"] * (1 + 4.65 * (Vx / Vtip)**2)
+    Pc = W * Vz
+    Pp = D * Vx
+
+    P = np.maximum(Pi + P0 + Pc + Pp, 0) / eta
+
+    return P
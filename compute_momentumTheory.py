@@ -0,0 +1,111 @@
+"""
+This function applies momentum theory to estimate propeller performance for one rotor or for an
+entire design space at once. All inputs are broadcast against each other, so scalars, 1-D sweeps
+and N-dimensional grids (e.g. np.meshgrid of DL, sigma and Mtip) are evaluated in a single call.
+
+Inputs
+-----
+T       :   required total propeller thrust [N]
+rho     :   ambient air density [kg/m^3]
+a       :   ambient speed of sound [m/s]
+DL      :   total propeller disk loading [Pa]
+sigma   :   propeller solidity [-]
+Mtip    :   propeller tip Mach number [-]
+Np      :   number of propellers [-]
+kappa   :   induced power factor [-]
+Cla     :   blade section lift curve slope [/rad]
+Cd_coeffs:  coefficients (Cd0, Cd1, Cd2) of Bailey's drag curve Cd = Cd0 + Cd1*alpha + Cd2*alpha^2 [-]
+polar   :   optional AirfoilPolar; replaces Bailey's drag curve with the polar's drag at the mean angle of
+            attack and the Reynolds and Mach numbers of the 3/4 radius section
+Nb      :   number of blades, used for the 3/4 radius chord when a polar is given [-]
+
+kappa, Cla and each drag coefficient may also be arrays, e.g. samples of an uncertainty study.
+
+Outputs
+-----
+perf        :   dictionary of numpy arrays (struct-of-arrays), all with the broadcast shape of the inputs
+perf["A"]   :   total propeller area [m^2]
+perf["Ap"]  :   individual propeller area [m^2]
+perf["R"]   :   individual propeller radius [m]
+perf["Tp"]  :   individual propeller thrust [N]
+perf["Vtip"]:   propeller tip speed [m/s]
+perf["RPM"] :   propeller speed [rev/min]
+perf["CT"]  :   thrust coefficient [-]
+perf["P0"]  :   total profile power [W]
+perf["Pi"]  :   total induced power [W]
+perf["P"]   :   total propeller power required [W]
+perf["Pp"]  :   individual propeller power required [W]
+perf["FM"]  :   propeller figure of merit [-]
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+
+# lift curve slope (/rad) and Bailey's drag curve coefficients
+CLA = 5.73
+CD_COEFFS = (0.0087, -0.035, 0.4)
+
+def compute_momentumTheory(T, rho, a, DL, sigma, Mtip, Np, kappa=1.15, Cla=CLA, Cd_coeffs=CD_COEFFS, polar=None, Nb=3):
+
+    # broadcast inputs to a common shape
+    T, rho, a, DL, sigma, Mtip, Np = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (T, rho, a, DL, sigma, Mtip, Np)))
+
+    # compute propeller geometry
+    A = T / DL
+    Ap = A / Np
+    R = np.sqrt(Ap / np.pi)
+
+    # required propeller thrust
+    Tp = T / Np
+
+    # propeller speed
+    Vtip = Mtip * a
+    RPM = Vtip / R * 60 / (2 * np.pi)
+
+    # thrust coefficient
+    CT = DL / rho / Vtip**2
+
+    # blade loading
+    BL = CT / sigma
+
+    # average lift coefficient across propeller blade
+    Cl_bar = 6 * BL
+
+    # average angle of attack (rad)
+    alpha_bar = Cl_bar / Cla
+
+    # mean drag coefficient based on Bailey's Drag Curve, or on the airfoil polar at the 3/4 radius section
+    if polar is None:
+        Cd_bar = Cd_coeffs[0] + Cd_coeffs[1] * alpha_bar + Cd_coeffs[2] * alpha_bar**2
+    else:
+        Cd_bar = polar.query_section(alpha_bar, rho, 0.75 * Vtip, sigma * np.pi * R / Nb, a)["Cd"]
+
+    # propeller powers
+    P0 = 1/8 * rho * Cd_bar * sigma * A * Vtip**3  # total profile
+    Ph = T * np.sqrt(DL / 2 / rho)  # ideal hover power
+    Pi = kappa * Ph  # actual induced power
+    P = Pi + P0  # total propeller power
+    Pp = P / Np  # individual propeller power
+
+    # figure of merit
+    FM = Ph / P
+
+    # return numpy scalars for scalar inputs and arrays otherwise
+    perf = {
+        "A": A,
+        "Ap": Ap,
+        "R": R,
+        "Tp": Tp,
+        "Vtip": Vtip,
+        "RPM": RPM,
+        "CT": CT,
+        "P0": P0,
+        "Pi": Pi,
+        "P": P,
+        "Pp": Pp,
+        "FM": FM,
+    }
+    perf = {key: value[()] for key, value in perf.items()}
+
+    return perf
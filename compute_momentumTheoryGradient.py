@@ -0,0 +1,72 @@
+"""
+This function evaluates momentum theory (see compute_momentumTheory) together with the analytic
+derivatives of the rotor design outputs with respect to the design variables x = (DL, sigma, Mtip).
+Like compute_momentumTheory, every input is broadcast, so the gradients of a whole batch of designs
+and operating conditions are evaluated in one vectorized pass.
+
+Inputs
+-----
+T, rho, a, DL, sigma, Mtip, Np          :   as in compute_momentumTheory
+kappa, Cla, Cd_coeffs                   :   as in compute_momentumTheory
+
+Outputs
+-----
+perf            :   dictionary of outputs of compute_momentumTheory, plus
+perf["BL"]      :   blade loading CT/sigma [-]
+grad            :   dictionary of derivatives, each an array of shape (..., 3) ordered (DL, sigma, Mtip)
+grad["P"]       :   derivative of the total propeller power [W/Pa, W, W]
+grad["FM"]      :   derivative of the figure of merit [1/Pa, -, -]
+grad["BL"]      :   derivative of the blade loading [1/Pa, -, -]
+grad["R"]       :   derivative of the individual propeller radius [m/Pa, m, m]
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+from compute_momentumTheory import compute_momentumTheory, CLA, CD_COEFFS
+
+def compute_momentumTheoryGradient(T, rho, a, DL, sigma, Mtip, Np, kappa=1.15, Cla=CLA, Cd_coeffs=CD_COEFFS):
+
+    perf = compute_momentumTheory(T, rho, a, DL, sigma, Mtip, Np, kappa=kappa, Cla=Cla, Cd_coeffs=Cd_coeffs)
+
+    T, rho, a, DL, sigma, Mtip = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (T, rho, a, DL, sigma, Mtip)))
+    zero = np.zeros_like(DL)
+
+    # blade loading and its derivatives
+    BL = perf["CT"] / sigma
+    dBL = np.stack([BL / DL, -BL / sigma, -2 * BL / Mtip], axis=-1)
+
+    # mean drag coefficient (Bailey) and its derivatives through the mean angle of attack
+    alpha = 6 * BL / Cla
+    Cd = Cd_coeffs[0] + Cd_coeffs[1] * alpha + Cd_coeffs[2] * alpha**2
+    dCd = ((Cd_coeffs[1] + 2 * Cd_coeffs[2] * alpha) * 6 / Cla)[..., None] * dBL
+
+    # profile power P0 = K * Cd * sigma * Mtip^3 / DL
+    K = 1/8 * rho * T * a**3
+    dP0 = np.stack([
+        K * sigma * Mtip**3 * (dCd[..., 0] / DL - Cd / DL**2),
+        K * Mtip**3 / DL * (dCd[..., 1] * sigma + Cd),
+        K * sigma / DL * (dCd[..., 2] * Mtip**3 + 3 * Cd * Mtip**2),
+    ], axis=-1)
+
+    # ideal hover power Ph = T * sqrt(DL / (2 * rho)) and induced power kappa * Ph
+    Ph = T * np.sqrt(DL / 2 / rho)
+    dPh = np.stack([Ph / (2 * DL), zero, zero], axis=-1)
+
+    # total power and figure of merit FM = Ph / P
+    P = kappa * Ph + perf["P0"]
+    dP = kappa * dPh + dP0
+    dFM = (dPh * P[..., None] - Ph[..., None] * dP) / P[..., None]**2
+
+    # radius R = sqrt(T / (pi * Np * DL))
+    dR = np.stack([-perf["R"] / (2 * DL), zero, zero], axis=-1)
+
+    perf["BL"] = BL[()]
+    grad = {
+        "P": dP,
+        "FM": dFM,
+        "BL": dBL,
+        "R": dR,
+    }
+
+    return perf, grad
@@ -0,0 +1,73 @@
+"""
+This function estimates the mass of each vehicle subsystem for a given maximum takeoff weight.
+All quantities may be numpy arrays, in which case the masses of many designs are estimated at once.
+
+Subsystem models
+-----
+payload     :   required payload
+structure   :   fixed fraction of MTOW
+avionics    :   fixed mass
+propulsion  :   motors/ESCs sized by installed power, P_hover * f_power / p_motor
+battery     :   energy to hover for the required endurance, P_hover * endurance / (eta * f_usable * e_batt)
+
+Hover power is estimated with momentum theory at MTOW using the propeller parameters in 'prop'.
+
+Inputs
+-----
+MTOW                        :   maximum takeoff weight [kg]
+reqs                        :   requirements dictionary; uses "payload" [kg] and "endurance" [s]
+subsystems                  :   dictionary of subsystem model parameters (see SUBSYSTEM_DEFAULTS)
+prop                        :   dictionary of propeller parameters; uses "Np", "Mtip", "sigma", "DL"
+rho                         :   ambient air density [kg/m^3]
+a                           :   ambient speed of sound [m/s]
+kwargs                      :   momentum theory model coefficients (kappa, Cla, Cd_coeffs; see compute_momentumTheory)
+
+Outputs
+-----
+masses                      :   dictionary of subsystem masses [kg]
+P_hover                     :   total hover power at MTOW [W]
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+from compute_momentumTheory import compute_momentumTheory
+
+# gravitational acceleration [m/s^2]
+G = 9.81
+
+# default subsystem model parameters, used for any entry missing from the config
+SUBSYSTEM_DEFAULTS = {
+    "f_struct":     {"name": "f_struct",    "value": 0.3,       "units": "-"},  # structural mass fraction
+    "m_avionics":   {"name": "m_avionics",  "value": 0.25,      "units": "kg"},  # avionics mass
+    "p_motor":      {"name": "p_motor",     "value": 5000,      "units": "W/kg"},  # motor/ESC specific power
+    "f_power":      {"name": "f_power",     "value": 2,         "units": "-"},  # installed to hover power ratio
+    "e_batt":       {"name": "e_batt",      "value": 540000,    "units": "J/kg"},  # battery specific energy
+    "f_usable":     {"name": "f_usable",    "value": 0.8,       "units": "-"},  # usable battery energy fraction
+    "eta":          {"name": "eta",         "value": 0.85,      "units": "-"},  # battery to shaft efficiency
+}
+
+# default propeller parameters for sizing, matching Propeller.py
+PROP_DEFAULTS = {
+    "Np":       {"name": "Np",      "value": 4,     "units": "-"},  # number of propellers
+    "Mtip":     {"name": "Mtip",    "value": 0.4,   "units": "-"},  # tip mach
+    "sigma":    {"name": "sigma",   "value": 0.08,  "units": "-"},  # solidity
+    "DL":       {"name": "DL",      "value": 500,   "units": "Pa"},  # disk loading
+}
+
+def compute_subsystemMasses(MTOW, reqs, subsystems, prop, rho, a, **kwargs):
+
+    sub = {key: subsystems.get(key, default)["value"] for key, default in SUBSYSTEM_DEFAULTS.items()}
+    prop = {key: prop.get(key, default)["value"] for key, default in PROP_DEFAULTS.items()}
+
+    # hover power at MTOW
+    perf = compute_momentumTheory(MTOW * G, rho, a, prop["DL"], prop["sigma"], prop["Mtip"], prop["Np"], **kwargs)
+    P_hover = perf["P"]
+
+    masses = dict()
+    masses["payload"] = reqs["payload"]["value"] * np.ones_like(MTOW)
+    masses["structure"] = sub["f_struct"] * MTOW
+    masses["avionics"] = sub["m_avionics"] * np.ones_like(MTOW)
+    masses["propulsion"] = P_hover * sub["f_power"] / sub["p_motor"]
+    masses["battery"] = P_hover * reqs["endurance"]["value"] / (sub["eta"] * sub["f_usable"] * sub["e_batt"])
+
+    return masses, P_hover
@@ -0,0 +1,38 @@
+"""
+This function decimates a long series for plotting by splitting it into equal buckets of consecutive
+points and keeping only the minimum and maximum point of each bucket, in their original order. Peaks
+and troughs survive decimation, unlike plain striding.
+
+Inputs
+-----
+y           :   1-D array of values to preserve the extremes of
+max_points  :   maximum number of points to keep
+
+Outputs
+-----
+idx         :   sorted array of the indices of the kept points; apply it to every per-point array
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+
+def decimate_minmax(y, max_points):
+
+    y = np.asarray(y)
+    n = len(y)
+
+    if n <= max_points:
+        return np.arange(n)
+
+    # two points per bucket; pad the last bucket with its final value
+    n_bins = max(max_points // 2, 1)
+    size = int(np.ceil(n / n_bins))
+    padded = np.concatenate([y, np.full(n_bins * size - n, y[-1])]).reshape(n_bins, size)
+
+    base = np.arange(n_bins) * size
+    idx = np.concatenate([base + np.argmin(padded, axis=1), base + np.argmax(padded, axis=1)])
+
+    # always keep the end points
+    idx = np.unique(np.concatenate([[0, n - 1], np.minimum(idx, n - 1)]))
+
+    return idx
@@ -0,0 +1,203 @@
+"""
+This module is the command line entry point of the eVTOL design code.
+
+Subcommands
+--------
+- size      :   converge MTOW for a config and display/export the vehicle specifications
+- sweep     :   size many configs or a parameter grid in parallel (see run_batch)
+- mission   :   size a vehicle and report its mission energy use
+- plot      :   size a vehicle and plot (or export) its mission trajectory
+- uq        :   propagate input uncertainty through the sizing chain with Monte Carlo (see run_uncertainty)
+- serve     :   run the long-lived local sizing service with warm workers (see SizingService, SizingClient)
+
+Only argparse is imported at startup; the pipeline modules, and through them numpy, ambiance, plotly,
+numba and pandas, are imported by the subcommand that needs them, on first use. See
+benchmarks/bench_startup.py for the startup-time regression check.
+
+Usage
+--------
+python evtol.py size --config configs/group1_quad.yml
+python evtol.py sweep --base configs/group1_quad.yml --grid reqs.payload.value=1,2,5 --workers 4
+python evtol.py mission --config configs/group1_quad.yml --dt 0.5
+python evtol.py plot --config configs/group1_quad.yml --output output/trajectory.png
+python evtol.py uq --config configs/group1_quad.yml --samples 1000000 --threshold MTOW=4.5
+python evtol.py serve --port 8765 --workers 4
+python evtol.py --profile output/trace.json size    # print a stage profile and write a Chrome trace
+
+Last Revised: 17 October 2026
+"""
+import argparse
+import os
+import sys
+
+DEFAULT_CONFIG = "configs/group1_quad.yml"
+
+def run_size(args):
+    """
+    This function sizes the vehicle in a config and displays its specifications.
+    """
+
+    from Aircraft import Aircraft
+
+    aircraft = Aircraft(run_mode="auto", config_path=args.config)
+    aircraft.display_specs()
+
+    if args.output is not None:
+        aircraft.output_specs(filepath=os.getcwd(), filename=args.output)
+
+
+def run_sweep(args):
+    """
+    This function sizes many configs or a parameter grid in parallel.
+    """
+
+    from run_batch import run_batch, parse_grid
+
+    run_batch(configs=args.configs, base_config=args.base, grid=parse_grid(args.grid),
+              max_workers=args.workers, chunksize=args.chunksize, output=args.output, cache=args.cache)
+
+
+def run_mission(args):
+    """
+    This function sizes the vehicle in a config and reports its mission energy use.
+    """
+
+    from read_yml import read_yml
+    from run_batch import run_pipeline
+
+    aircraft, mission, prop = run_pipeline(read_yml(args.config), dt=args.dt)
+
+    print(f"\nDisplaying mission energy...")
+    print(f"-------------------------------\n")
+
+    for seg in mission.segments:
+        print(f"{seg['name']:15}: \t{seg['energy'] / 1e3:10.1f} kJ\n")
+
+    for key, value in mission.energy.items():
+        print(f"{key:15}: \t{value['value']:10.4g} {value['units']}\n")
+
+
+def run_plot(args):
+    """
+    This function sizes the vehicle in a config and plots its mission trajectory.
+    """
+
+    from read_yml import read_yml
+    from run_batch import run_pipeline
+
+    aircraft, mission, prop = run_pipeline(read_yml(args.config), dt=args.dt, keep_history=True)
+
+    fig = mission.plot_trajectory(mode=args.mode, show=args.output is None)
+
+    if args.output is not None:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        fig.write_image(args.output)
+        print(f"Successfully wrote '{args.output}'")
+
+
+def run_uq(args):
+    """
+    This function runs a Monte Carlo uncertainty study of the vehicle in a config.
+    """
+
+    from read_yml import read_yml
+    from run_uncertainty import run_uncertainty
+
+    thresholds = dict()
+    for item in args.threshold or []:
+        key, value = item.split("=", 1)
+        thresholds.setdefault(key, []).append(float(value))
+
+    run_uncertainty(read_yml(args.config), n_samples=args.samples, chunk_size=args.chunk_size,
+                    thresholds=thresholds, seed=args.seed)
+
+
+def run_serve(args):
+    """
+    This function runs the local sizing service until a client requests shutdown.
+    """
+
+    import asyncio
+    from SizingService import SizingService
+
+    service = SizingService(host=args.host, port=args.port, max_workers=args.workers, cache=args.cache,
+                            warm_config=args.config)
+    asyncio.run(service.serve_forever())
+
+
+def build_parser():
+    """
+    This function builds the command line parser.
+    """
+
+    parser = argparse.ArgumentParser(prog="evtol", description="eVTOL aircraft design code.")
+    parser.add_argument("--profile", default=None, help="print a stage profile and write a Chrome trace to this .json file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    size = subparsers.add_parser("size", help="converge MTOW and display the vehicle specifications")
+    size.add_argument("--config", default=DEFAULT_CONFIG, help="path to the .yml config")
+    size.add_argument("--output", default=None, help="csv filename to export the specifications to (in ./output)")
+    size.set_defaults(func=run_size)
+
+    sweep = subparsers.add_parser("sweep", help="size many configs or a parameter grid in parallel")
+    sweep.add_argument("--configs", help="directory of .yml configs; one case per file")
+    sweep.add_argument("--base", help="base .yml config for a parameter grid")
+    sweep.add_argument("--grid", action="append", help="override grid as key=v1,v2,...; may be repeated")
+    sweep.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    sweep.add_argument("--chunksize", type=int, default=1, help="cases sent to a worker at a time")
+    sweep.add_argument("--output", default="output/batch.npz", help=".npz, .csv or .jsonl results file")
+    sweep.add_argument("--cache", default=None, help="sqlite file caching propeller results across runs")
+    sweep.set_defaults(func=run_sweep)
+
+    mission = subparsers.add_parser("mission", help="size a vehicle and report its mission energy use")
+    mission.add_argument("--config", default=DEFAULT_CONFIG, help="path to the .yml config")
+    mission.add_argument("--dt", type=float, default=1., help="mission time step [s]")
+    mission.set_defaults(func=run_mission)
+
+    plot = subparsers.add_parser("plot", help="size a vehicle and plot its mission trajectory")
+    plot.add_argument("--config", default=DEFAULT_CONFIG, help="path to the .yml config")
+    plot.add_argument("--dt", type=float, default=1., help="mission time step [s]")
+    plot.add_argument("--mode", default="webgl", choices=["webgl", "scatter"], help="plot type")
+    plot.add_argument("--output", default=None, help="png/svg file to export to instead of showing the plot")
+    plot.set_defaults(func=run_plot)
+
+    uq = subparsers.add_parser("uq", help="Monte Carlo uncertainty propagation through the sizing chain")
+    uq.add_argument("--config", default=DEFAULT_CONFIG, help="path to the .yml config")
+    uq.add_argument("--samples", type=int, default=10**6, help="number of Monte Carlo samples")
+    uq.add_argument("--chunk-size", type=int, default=10**5, help="samples evaluated at a time")
+    uq.add_argument("--threshold", action="append", help="exceedance threshold as output=value; may be repeated")
+    uq.add_argument("--seed", type=int, default=0, help="random seed")
+    uq.set_defaults(func=run_uq)
+
+    serve = subparsers.add_parser("serve", help="run the local sizing service with warm workers")
+    serve.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    serve.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    serve.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    serve.add_argument("--cache", default=None, help="sqlite file caching propeller results across runs")
+    serve.add_argument("--config", default=DEFAULT_CONFIG, help="config sized by every worker at startup")
+    serve.set_defaults(func=run_serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.profile is None:
+        args.func(args)
+        return
+
+    # the profiler records this process only; run sweeps with --workers 1 to profile the pipeline
+    from Profiler import PROFILER
+
+    PROFILER.enable()
+    try:
+        args.func(args)
+    finally:
+        PROFILER.disable()
+        PROFILER.report()
+        PROFILER.export_trace(args.profile)
+
+
+if __name__=="__main__":
+    sys.exit(main())
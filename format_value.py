@@ -0,0 +1,26 @@
+"""
+This function formats a parameter value for printing. Arrays from batched runs are summarized
+by their shape and range rather than printed in full.
+
+Inputs
+-----
+value       :   scalar or numpy array
+digits      :   number of decimals to round scalars to; None prints the full value
+
+Outputs
+-----
+text        :   str representation of value
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+
+def format_value(value, digits=None):
+
+    if np.ndim(value) > 0:
+        return f"array{np.shape(value)} in [{np.min(value):.4g}, {np.max(value):.4g}]"
+
+    if digits is not None:
+        value = round(value, digits)
+
+    return f"{value:10}"
@@ -1,10 +1,14 @@
 """
-This function exercises Ambiance's Atmosphere module to find atmospheric quanties and 
+This function exercises Ambiance's Atmosphere module to find atmospheric quanties and
 returns them to the 'atmos' object.
 
+Ambiance is only evaluated once per process to build a dense ISA table (see build_atmosTable);
+every query afterwards is a vectorized linear interpolation of that table, and repeated exact
+altitudes are served from an LRU cache.
+
 Inputs
 -----
-alt         :   geometric height above sea level [m]
+alt         :   geometric height above sea level [m]; scalar or sequence of heights
 
 Outputs
 -----
@@ -18,24 +22,148 @@ atmos["a"]      :   speed of sound [m/s]
 Assumptions
 -----
 If length of alt > 1, then the atmospheric model will return the average value of 100 interpolated
-values of the respective atmospheric quantity. 
+values of the respective atmospheric quantity.
+
+Last Revised: 17 October 2026
 """
 
-from ambiance import Atmosphere
+from functools import lru_cache
 import numpy as np
+from Profiler import PROFILER
+
+# atmospheric quantities stored in the table and their ambiance attribute names
+ATMOS_KEYS = {
+    "rho": "density",
+    "P0": "pressure",
+    "T0": "temperature",
+    "mu": "dynamic_viscosity",
+    "a": "speed_of_sound",
+}
 
+# table bounds and spacing [m]; ambiance is valid from -5004 m to 81020 m
+ALT_MIN = -5000.
+ALT_MAX = 81000.
+ALT_STEP = 10.
+
+@PROFILER.profile("atmosphere")
 def get_atmos(alt):
 
-    atmos = dict()  # initialize atmospheric dictionary
+    alt = np.atleast_1d(np.asarray(alt, dtype=float))
+
+    if len(alt) > 1 and np.min(alt) != np.max(alt):
+        # average the quantities over 100 altitudes spanning the segment
+        alt_interp = np.linspace(np.min(alt), np.max(alt), 100)
+        atmos_interp = query_atmos(alt_interp)
+        atmos = {key: float(np.average(value)) for key, value in atmos_interp.items()}
+
+    else:
+        # single (or constant) altitude; served from the memoized point lookup
+        atmos = dict(zip(ATMOS_KEYS, _get_atmosPoint(float(alt[0]))))
+
+    return atmos
+
+
+def query_atmos(alt):
+    """
+    This function interpolates the ISA table at an arbitrary array of altitudes.
+
+    Inputs
+    -----
+    alt         :   scalar or n-dimensional array of geometric heights above sea level [m]
+
+    Outputs
+    -----
+    atmos       :   dictionary of atmospheric quantities (keys as in get_atmos), each an array
+                    with the shape of alt
+    """
+
+    table = build_atmosTable()
+    alt = np.asarray(alt, dtype=float)
+    PROFILER.count("atmos_evaluations", alt.size)
+
+    if np.any(alt < table["alt"][0]) or np.any(alt > table["alt"][-1]):
+        raise ValueError(f"Altitude out of range of the atmosphere table "
+                         f"[{table['alt'][0]}, {table['alt'][-1]}] m.")
+
+    # locate each altitude in the uniform table and linearly interpolate
+    x = (alt - table["alt"][0]) / ALT_STEP
+    i = np.minimum(x.astype(np.intp), len(table["alt"]) - 2)
+    w = x - i
+
+    atmos = dict()
+    for key in ATMOS_KEYS:
+        y = table[key]
+        atmos[key] = (1 - w) * y[i] + w * y[i+1]
+
+    return atmos
+
+
+def get_atmos_segments(alt_start, alt_end, n_interp=100):
+    """
+    This function applies the segment averaging of get_atmos to many segments at once.
+
+    Inputs
+    -----
+    alt_start   :   array of segment start heights [m]
+    alt_end     :   array of segment end heights [m]
+    n_interp    :   number of interpolated heights averaged per segment
+
+    Outputs
+    -----
+    atmos       :   dictionary of atmospheric quantities (keys as in get_atmos), each an array
+                    with one average value per segment
+    """
+
+    PROFILER.count("atmos_segments", np.size(alt_start))
+
+    alt_start = np.asarray(alt_start, dtype=float)
+    alt_end = np.asarray(alt_end, dtype=float)
+
+    # (segment x n_interp) heights spanning each segment
+    w = np.linspace(0, 1, n_interp)
+    alt_interp = alt_start[..., None] + (alt_end - alt_start)[..., None] * w
+    atmos_interp = query_atmos(alt_interp)
+
+    return {key: np.average(value, axis=-1) for key, value in atmos_interp.items()}
+
+
+@lru_cache(maxsize=4096)
+def _get_atmosPoint(alt):
+    """
+    This function returns the atmospheric quantities at a single altitude, memoized on the exact
+    altitude so repeated hover/cruise points cost one dictionary lookup.
+    """
+
+    atmos = query_atmos(alt)
+
+    return tuple(float(atmos[key]) for key in ATMOS_KEYS)
+
+
+@lru_cache(maxsize=1)
+def build_atmosTable():
+    """
+    This function evaluates ambiance once over a dense altitude grid and caches the result for the
+    lifetime of the process.
+
+    Outputs
+    -----
+    table           :   dictionary of read-only numpy arrays
+    table["alt"]    :   geometric heights of the table [m]
+    table[key]      :   atmospheric quantity at each height, for every key of get_atmos
+    """
+
+    from ambiance import Atmosphere
+
+    PROFILER.count("atmos_table_builds")
+
+    alt = np.arange(ALT_MIN, ALT_MAX + ALT_STEP / 2, ALT_STEP)
+    atmos = Atmosphere(alt)
 
-    if len(alt) > 1:
-        alt_interp = np.linspace(min(alt), max(alt), 100)
-        atmos_interp = Atmosphere(alt_interp)
+    table = {"alt": alt}
+    for key, attr in ATMOS_KEYS.items():
+        table[key] = np.ascontiguousarray(getattr(atmos, attr), dtype=float)
 
-    atmos["rho"] = np.average(Atmosphere(alt).density)
-    atmos["P0"] = np.average(Atmosphere(alt).pressure)
-    atmos["T0"] = np.average(Atmosphere(alt).temperature)
-    atmos["mu"] = np.average(Atmosphere(alt).dynamic_viscosity)
-    atmos["a"] = np.average(Atmosphere(alt).speed_of_sound)
+    for value in table.values():
+        value.flags.writeable = False
 
-    return atmos
\ No newline at end of file
+    return table
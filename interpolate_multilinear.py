@@ -0,0 +1,88 @@
+"""
+This function interpolates a table defined on a rectilinear N-dimensional grid at arbitrary points with
+vectorized multilinear interpolation: every query point is located on every axis with one searchsorted
+call, the 2^N surrounding grid values of all points are gathered with one np.take on the flattened table
+(flat index of the lower corner plus fixed corner offsets), and the gathered hypercubes are reduced one
+axis at a time with the linear weights. Points are processed in chunks so
+the gathered hypercubes stay small.
+
+Inputs
+-----
+axes        :   sequence of N strictly increasing 1-D grid axes; an axis of length 1 holds the table
+                constant along that dimension and only accepts its single value
+values      :   array of shape (len(axes[0]), ..., len(axes[N-1]), ...) of tabulated values; trailing
+                dimensions hold several tabulated quantities interpolated together, e.g. (..., 2) for Cl and Cd
+points      :   sequence of N broadcastable arrays of query coordinates, one per axis
+chunk_size  :   number of query points interpolated at a time
+
+Outputs
+-----
+result      :   array of interpolated values with the broadcast shape of the points, followed by the
+                trailing dimensions of values
+
+Raises
+-----
+ValueError  :   if any query point lies outside the grid
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+
+def interpolate_multilinear(axes, values, points, chunk_size=65536):
+
+    if len(points) != len(axes):
+        raise ValueError(f"Expected {len(axes)} query coordinates, got {len(points)}.")
+
+    points = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in points))
+    shape = points[0].shape
+    points = [x.ravel() for x in points]
+
+    # lower grid index and weight of the upper neighbour on every axis
+    index = []
+    weight = []
+    for d, (axis, x) in enumerate(zip(axes, points)):
+        axis = np.asarray(axis, dtype=float)
+        if len(axis) == 1:
+            if x.size and (x.min() != axis[0] or x.max() != axis[0]):
+                raise ValueError(f"Query out of range of axis {d}, which only holds {axis[0]:g}.")
+            index.append(np.zeros(x.shape, dtype=np.intp))
+            weight.append(None)
+            continue
+
+        if x.size and (x.min() < axis[0] or x.max() > axis[-1]):
+            raise ValueError(f"Query out of range of axis {d} [{axis[0]:g}, {axis[-1]:g}].")
+        i = np.minimum(axis.searchsorted(x, side="right") - 1, len(axis) - 2)
+        index.append(i)
+        weight.append(x - axis[i])
+        weight[-1] /= axis[i+1] - axis[i]
+
+    # flat table with one row per grid point, and the flat offsets of the hypercube corners from the
+    # lower corner; constant axes only have their lower corner
+    values = np.asarray(values)
+    n_dim = len(axes)
+    grid, trailing = values.shape[:n_dim], values.shape[n_dim:]
+    flat = values.reshape((-1,) + trailing)
+    strides = np.cumprod((1,) + grid[:0:-1])[::-1]
+    corners = [1 if w is None else 2 for w in weight]
+    offsets = sum(np.arange(c).reshape((-1,) + (1,) * (n_dim - 1 - d)) * stride
+                  for d, (c, stride) in enumerate(zip(corners, strides))).ravel()
+
+    result = np.empty((len(points[0]),) + trailing)
+    for k in range(0, len(result), chunk_size):
+        chunk = slice(k, k + chunk_size)
+
+        # (point, 2, ..., 2) hypercubes of surrounding grid values
+        base = sum(i[chunk] * stride for i, stride in zip(index, strides))
+        cube = np.take(flat, base[:, None] + offsets, axis=0).reshape((-1,) + tuple(corners) + trailing)
+
+        # reduce the hypercubes axis by axis
+        for w in weight:
+            if w is None:
+                cube = cube[:, 0]
+            else:
+                w = w[chunk].reshape((-1,) + (1,) * (cube.ndim - 2))
+                cube = cube[:, 0] + w * (cube[:, 1] - cube[:, 0])
+
+        result[chunk] = cube
+
+    return result.reshape(shape + values.shape[n_dim:])[()]
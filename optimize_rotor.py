@@ -0,0 +1,133 @@
+"""
+This function finds the momentum theory rotor design x = (DL, sigma, Mtip) that minimizes hover power
+(or maximizes figure of merit) for one or many independent thrust/atmosphere conditions. Each condition
+is solved with scipy.optimize SLSQP using the analytic gradients of compute_momentumTheoryGradient,
+warm-started from the previous condition's optimum, so a design is found in tens of model evaluations
+instead of a dense DL x sigma x Mtip grid.
+
+Constraints
+-----
+tip Mach        :   Mtip <= Mtip_max (bound)
+blade loading   :   CT/sigma <= BL_max
+rotor radius    :   R <= R_max (optional)
+bounds          :   DL, sigma and Mtip within 'bounds'
+
+Inputs
+-----
+T           :   required total propeller thrust [N]; scalar or array of conditions
+rho         :   ambient air density [kg/m^3]; broadcast against T
+a           :   ambient speed of sound [m/s]; broadcast against T
+Np          :   number of propellers [-]
+objective   :   str specifying the objective
+                    "P" minimize total propeller power
+                    "FM" maximize figure of merit
+Mtip_max    :   maximum tip Mach number [-]
+BL_max      :   maximum blade loading CT/sigma [-]
+R_max       :   maximum individual propeller radius [m]; None for no limit
+bounds      :   dictionary of (lower, upper) bounds of "DL" [Pa], "sigma" [-] and "Mtip" [-]
+x0          :   optional initial design (DL, sigma, Mtip); defaults to the middle of the bounds
+kappa       :   induced power factor [-]
+tol         :   SLSQP convergence tolerance on the scaled objective [-]
+max_iter    :   maximum SLSQP iterations per condition [-]
+
+Outputs
+-----
+result              :   dictionary of arrays with the broadcast shape of T, rho and a
+result["DL"]        :   optimal disk loading [Pa]
+result["sigma"]     :   optimal solidity [-]
+result["Mtip"]      :   optimal tip Mach number [-]
+result["P"]         :   total propeller power at the optimum [W]
+result["FM"]        :   figure of merit at the optimum [-]
+result["BL"]        :   blade loading at the optimum [-]
+result["R"]         :   individual propeller radius at the optimum [m]
+result["success"]   :   bool; the optimizer converged
+result["n_eval"]    :   number of model evaluations [-]
+
+Last Revised: 17 October 2026
+"""
+import numpy as np
+from compute_momentumTheoryGradient import compute_momentumTheoryGradient
+
+# default design variable bounds
+BOUNDS = {
+    "DL": (50., 2000.),  # disk loading [Pa]
+    "sigma": (0.03, 0.25),  # solidity [-]
+    "Mtip": (0.2, 0.8),  # tip mach [-]
+}
+VARIABLES = ("DL", "sigma", "Mtip")
+
+def optimize_rotor(T, rho, a, Np, objective="P", Mtip_max=0.6, BL_max=0.12, R_max=None, bounds=None,
+                   x0=None, kappa=1.15, tol=1e-9, max_iter=100):
+
+    from scipy.optimize import minimize
+
+    if objective not in ("P", "FM"):
+        raise ValueError("Inappropriate objective selected. Available objectives include 'P' and 'FM'.")
+
+    T, rho, a = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (T, rho, a)))
+    shape = T.shape
+
+    # bounds, with the tip Mach limit applied; variables are scaled by their upper bound
+    bounds = {**BOUNDS, **(bounds or dict())}
+    lower = np.array([bounds[key][0] for key in VARIABLES])
+    upper = np.array([bounds[key][1] for key in VARIABLES])
+    upper[2] = min(upper[2], Mtip_max)
+    scale = upper
+    z_bounds = list(zip(lower / scale, upper / scale))
+
+    z = (np.asarray(x0, dtype=float) if x0 is not None else 0.5 * (lower + upper)) / scale
+
+    keys = ("DL", "sigma", "Mtip", "P", "FM", "BL", "R")
+    result = {key: np.empty(T.size) for key in keys}
+    result["success"] = np.zeros(T.size, dtype=bool)
+    result["n_eval"] = np.zeros(T.size, dtype=np.int64)
+
+    for i, (T_i, rho_i, a_i) in enumerate(zip(T.ravel(), rho.ravel(), a.ravel())):
+
+        # one model evaluation serves the objective, the constraints and all their gradients
+        cache = dict()
+        def evaluate(z):
+            key = z.tobytes()
+            if key not in cache:
+                cache.clear()
+                x = z * scale
+                cache[key] = compute_momentumTheoryGradient(T_i, rho_i, a_i, x[0], x[1], x[2], Np, kappa=kappa)
+                result["n_eval"][i] += 1
+            return cache[key]
+
+        # normalize the objective by its value at the initial design
+        perf, _ = evaluate(z)
+        sign = 1. if objective == "P" else -1.
+        f_ref = abs(float(perf[objective]))
+
+        def fun(z):
+            perf, grad = evaluate(z)
+            return sign * float(perf[objective]) / f_ref, sign * grad[objective] * scale / f_ref
+
+        constraints = [{
+            "type": "ineq",
+            "fun": lambda z: (BL_max - float(evaluate(z)[0]["BL"])) / BL_max,
+            "jac": lambda z: -evaluate(z)[1]["BL"] * scale / BL_max,
+        }]
+        if R_max is not None:
+            constraints.append({
+                "type": "ineq",
+                "fun": lambda z: (R_max - float(evaluate(z)[0]["R"])) / R_max,
+                "jac": lambda z: -evaluate(z)[1]["R"] * scale / R_max,
+            })
+
+        solution = minimize(fun, z, jac=True, method="SLSQP", bounds=z_bounds, constraints=constraints,
+                            options={"ftol": tol, "maxiter": max_iter})
+
+        # store the optimum and warm-start the next condition from it
+        z = np.clip(solution.x, lower / scale, upper / scale)
+        perf, _ = evaluate(z)
+        for key, value in zip(VARIABLES, z * scale):
+            result[key][i] = value
+        for key in ("P", "FM", "BL", "R"):
+            result[key][i] = perf[key]
+        result["success"][i] = solution.success
+
+    result = {key: value.reshape(shape)[()] for key, value in result.items()}
+
+    return result
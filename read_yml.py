@@ -1,20 +1,249 @@
+import os
+from functools import lru_cache
 import yaml
+from Profiler import PROFILER
+from units import get_unitFactor
 
-def read_yml(full_path):
+# use the libyaml C loader when PyYAML was built with it
+try:
+    Loader = yaml.CSafeLoader
+except AttributeError:
+    Loader = yaml.SafeLoader
+
+# internal units of the requirements; subsystem and prop parameters use the units of their defaults
+# (see compute_subsystemMasses)
+REQS_UNITS = {"range": "m", "payload": "kg", "vtas_cruise": "m/s", "endurance": "s", "MTOW": "kg"}
+
+@PROFILER.profile("config_load")
+def read_yml(full_path, validate=True, convert=True):
     """
     This function reads a .yml file from a specified 'full_path' and returns contents in 'config_data'.
 
+    Each file is parsed once per process; the parsed config is cached on the file's path and
+    modification time, so every Aircraft, Mission, etc. built from the same unchanged file shares
+    one immutable config object. Use thaw() for a mutable copy.
+
+    Units are parsed, validated and converted to the internal units once here (see convert_units), so the
+    sizing never converts units again.
+
+    Inputs
+    -----
+    full_path       :   path to the .yml file
+    validate        :   bool; check the config structure with validate_config
+    convert         :   bool; convert values to the internal units with convert_units
+
+    Outputs
+    -----
+    config_data     :   immutable config (FrozenDict of FrozenDicts and tuples)
+
     Author: Matt Asper (matt.asper101@gmail.com)
-    Date Revised: 23 December 2025
+    Date Revised: 17 October 2026
     """
 
-    # Open the file and load the data safely
     try:
-        with open(full_path, 'r') as file:
-            config_data = yaml.safe_load(file)
-
-        return config_data
+        stat = os.stat(full_path)
     except FileNotFoundError:
-        print(f"Error: The file {full_path} was not found.")
-    except yaml.YAMLError as exc:
-        print(f"Error parsing YAML file: {exc}")
+        raise FileNotFoundError(f"Error: The file {full_path} was not found.") from None
+
+    return _load_yml(os.path.realpath(full_path), stat.st_mtime_ns, stat.st_size, validate, convert)
+
+
+def iter_yml(full_path, validate=True, convert=True):
+    """
+    This function streams the documents of a multi-document .yml file (documents separated by '---'),
+    yielding one immutable config at a time so that files holding thousands of cases are never
+    loaded into memory at once.
+
+    Inputs
+    -----
+    full_path       :   path to the .yml file
+    validate        :   bool; check each config structure with validate_config
+    convert         :   bool; convert values to the internal units with convert_units
+
+    Outputs
+    -----
+    config_data     :   generator of immutable configs
+    """
+
+    with open(full_path, 'r') as file:
+        for i, document in enumerate(yaml.load_all(file, Loader=Loader)):
+            config_data = freeze(document)
+            if validate:
+                validate_config(config_data, source=f"{full_path} (document {i})")
+            if convert:
+                config_data = convert_units(config_data, source=f"{full_path} (document {i})")
+            yield config_data
+
+
+@lru_cache(maxsize=256)
+def _load_yml(real_path, mtime_ns, size, validate, convert):
+    """
+    This function parses a .yml file; memoized on the file's path, modification time and size.
+    """
+
+    PROFILER.count("config_parses")
+
+    with open(real_path, 'r') as file:
+        try:
+            config_data = freeze(yaml.load(file, Loader=Loader))
+        except yaml.YAMLError as exc:
+            raise ValueError(f"Error parsing YAML file {real_path}: {exc}") from exc
+
+    if validate:
+        validate_config(config_data, source=real_path)
+    if convert:
+        config_data = convert_units(config_data, source=real_path)
+
+    return config_data
+
+
+def validate_config(config_data, source="config"):
+    """
+    This function checks the structure of a config and raises a ValueError describing the first problem.
+
+    Required
+    -----
+    reqs                :   mapping of requirements, each with "value" and "units"
+
+    Optional
+    -----
+    prop, subsystems    :   mappings of parameters, each with "value" and "units"
+    mission.segments    :   list of segments, each with "name", "duration" and "Velocity"
+    """
+
+    if not isinstance(config_data, dict):
+        raise ValueError(f"{source}: config must be a mapping of sections.")
+
+    if "reqs" not in config_data:
+        raise ValueError(f"{source}: missing required section 'reqs'.")
+
+    for section in ("reqs", "prop", "subsystems"):
+        if section not in config_data:
+            continue
+        if not isinstance(config_data[section], dict):
+            raise ValueError(f"{source}: section '{section}' must be a mapping.")
+        for key, entry in config_data[section].items():
+            if not isinstance(entry, dict) or "value" not in entry or "units" not in entry:
+                raise ValueError(f"{source}: '{section}.{key}' must define 'value' and 'units'.")
+
+    if "mission" in config_data:
+        segments = config_data["mission"].get("segments") if isinstance(config_data["mission"], dict) else None
+        if not segments:
+            raise ValueError(f"{source}: section 'mission' must define a list of 'segments'.")
+        for i, segment in enumerate(segments):
+            for key in ("name", "duration", "Velocity"):
+                if not isinstance(segment, dict) or key not in segment:
+                    raise ValueError(f"{source}: 'mission.segments[{i}]' must define '{key}'.")
+
+
+def convert_units(config_data, source="config"):
+    """
+    This function validates the units of every reqs, subsystems and prop entry and converts its value
+    to the internal units (e.g. "km" -> "m", "lb" -> "kg", "Wh/kg" -> "J/kg") with one precomputed
+    factor per unit pair; lists of values are converted elementwise. Converted entries keep their
+    original units as "display_units", which Aircraft uses to report results in the units of the
+    config. Entries already in the internal units are kept as they are, so converting twice is a no-op.
+    Raises a ValueError for unknown units or units of the wrong dimension.
+
+    Inputs
+    -----
+    config_data     :   parsed config (see read_yml)
+    source          :   str naming the config in error messages
+
+    Outputs
+    -----
+    config_data     :   immutable config in the internal units
+    """
+
+    from compute_subsystemMasses import PROP_DEFAULTS, SUBSYSTEM_DEFAULTS
+
+    internal_units = {
+        "reqs": REQS_UNITS,
+        "subsystems": {key: default["units"] for key, default in SUBSYSTEM_DEFAULTS.items()},
+        "prop": {key: default["units"] for key, default in PROP_DEFAULTS.items()},
+    }
+
+    config_data = dict(config_data)
+    for section, units in internal_units.items():
+        if not isinstance(config_data.get(section), dict):
+            continue
+
+        entries = dict(config_data[section])
+        for key, entry in entries.items():
+            if not isinstance(entry, dict) or "units" not in entry:
+                continue
+
+            # parameters without internal units are validated, not converted
+            units_from = str(entry["units"])
+            units_to = units.get(key, units_from)
+            try:
+                factor = get_unitFactor(units_from, units_to)
+                if units_from != units_to:
+                    entries[key] = FrozenDict({**entry, "value": _scale(entry["value"], factor), "units": units_to,
+                                               "display_units": entry.get("display_units", units_from)})
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"{source}: '{section}.{key}': {exc}") from None
+
+        config_data[section] = FrozenDict(entries)
+
+    return FrozenDict(config_data)
+
+
+def _scale(value, factor):
+    """
+    This function multiplies a value, or every value of a list, by a conversion factor.
+    """
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_scale(item, factor) for item in value)
+    if isinstance(value, (bool, str)) or value is None:
+        raise TypeError(f"value {value!r} must be numeric to convert its units.")
+
+    return value if factor == 1 else value * factor
+
+
+class FrozenDict(dict):
+    """
+    This class is a read-only dictionary used for parsed configs.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Config objects are immutable; use thaw() for a mutable copy.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze(data):
+    """
+    This function recursively converts dictionaries to FrozenDicts and lists to tuples.
+    """
+
+    if isinstance(data, dict):
+        return FrozenDict((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze(value) for value in data)
+
+    return data
+
+
+def thaw(data):
+    """
+    This function recursively copies a (frozen) config into mutable dictionaries and lists.
+    """
+
+    if isinstance(data, dict):
+        return {key: thaw(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [thaw(value) for value in data]
+
+    return data
@@ -0,0 +1,271 @@
+"""
+This module sizes many vehicles in parallel. Cases are built either from a directory of .yml configs
+or from one base config plus a grid of parameter overrides, spread across a process pool, and run
+through the Aircraft -> Mission -> Propeller pipeline (sizing, hover propeller, mission energy). Results are collected into one pandas
+DataFrame and optionally written to a .npz, .csv or .jsonl file.
+
+Functions
+--------
+- build_cases
+- run_pipeline
+- run_case
+- run_batch
+
+Overrides use dotted keys into the config, with integers indexing lists, e.g.
+    {"reqs.payload.value": [1, 2, 5], "mission.segments.3.duration": [100, 200]}
+
+Last Revised: 17 October 2026
+"""
+import argparse
+import contextlib
+import functools
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import numpy as np
+from read_yml import read_yml, thaw, freeze, validate_config, convert_units
+from ResultsStore import ResultsStore
+from PerformanceCache import PerformanceCache
+
+# gravitational acceleration [m/s^2]
+G = 9.81
+
+def build_cases(configs=None, base_config=None, grid=None):
+    """
+    This function builds the list of cases to run.
+
+    Inputs
+    -----
+    configs         :   directory containing .yml/.yaml config files; one case per file
+    base_config     :   path to a base .yml config file
+    grid            :   dictionary of dotted config keys -> list of values; one case per combination
+
+    Outputs
+    -----
+    cases           :   list of (config_path, overrides) tuples
+    """
+
+    if configs is not None:
+        paths = sorted(p for p in Path(configs).iterdir() if p.suffix in (".yml", ".yaml"))
+        if len(paths) == 0:
+            raise ValueError(f"No .yml config files found in {configs}.")
+        return [(str(path), dict()) for path in paths]
+
+    if base_config is None:
+        raise ValueError("Specify either a directory of configs or a base config.")
+
+    grid = grid or dict()
+    keys = list(grid.keys())
+    cases = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        cases.append((str(base_config), dict(zip(keys, values))))
+
+    return cases
+
+
+def set_override(config, key, value):
+    """
+    This function sets a dotted key (e.g. "reqs.payload.value") in a nested config dictionary.
+    """
+
+    fields = key.split(".")
+    node = config
+    for field in fields[:-1]:
+        node = node[int(field)] if isinstance(node, list) else node[field]
+
+    if isinstance(node, list):
+        node[int(fields[-1])] = value
+    else:
+        node[fields[-1]] = value
+
+
+def run_pipeline(config_params, dt=1., keep_history=False, cache=None):
+    """
+    This function sizes one vehicle with the Aircraft -> Mission -> Propeller pipeline: MTOW convergence,
+    hover propeller sizing in the takeoff segment atmosphere and mission energy on the sized battery.
+
+    Inputs
+    -----
+    config_params   :   parsed config dictionary
+    dt              :   mission time step [s]
+    keep_history    :   bool; keep the mission time history (see Mission.simulate_energy)
+    cache           :   optional PerformanceCache for the propeller loading results
+
+    Outputs
+    -----
+    aircraft, mission, prop :   sized Aircraft, Mission and Propeller objects
+    """
+
+    # imported here so that pool workers load the pipeline once, on first use
+    from Aircraft import Aircraft
+    from Mission import Mission
+    from Propeller import Propeller
+    from compute_subsystemMasses import PROP_DEFAULTS, SUBSYSTEM_DEFAULTS
+
+    aircraft = Aircraft(run_mode="auto", config_params=config_params)
+    mission = Mission(run_mode="auto", config_params=config_params)
+
+    # size the propeller for hover at MTOW in the takeoff segment atmosphere
+    prop = Propeller(**{**PROP_DEFAULTS, **aircraft.prop_params})
+    atmos = mission.segments[0]["atmos"]
+    MTOW = float(aircraft.reqs["MTOW"]["value"])
+    prop.run_propLoading("MT", MTOW * G, atmos["rho"], atmos["a"], cache=cache)
+
+    # fly the mission on the sized battery
+    sub = {key: aircraft.subsystem_params.get(key, default)["value"] for key, default in SUBSYSTEM_DEFAULTS.items()}
+    E_batt = float(aircraft.subsystem["battery"]["value"]) * sub["e_batt"] * sub["f_usable"]
+    mission.simulate_energy(MTOW, prop.params, E_batt, dt=dt, keep_history=keep_history, eta=sub["eta"])
+
+    return aircraft, mission, prop
+
+
+def run_case(case, cache_path=None):
+    """
+    This function runs the Aircraft -> Mission -> Propeller pipeline for one case.
+
+    Inputs
+    -----
+    case        :   (config_path, overrides) tuple
+    cache_path  :   optional sqlite file of a PerformanceCache shared by all workers
+
+    Outputs
+    -----
+    record      :   flat dictionary of case inputs and results; "error" holds the message of a failed case
+    """
+
+    config_path, overrides = case
+    record = {"config": config_path, "overrides": repr(overrides), "error": ""}
+
+    try:
+        # overrides are given in the units of the config file, so they are applied before unit conversion
+        config = read_yml(config_path, convert=not overrides)
+        if overrides:
+            config = thaw(config)
+            for key, value in overrides.items():
+                set_override(config, key, value)
+                record[key] = value
+            validate_config(config, source=config_path)
+            config = convert_units(freeze(config), source=config_path)
+
+        # silence the pipeline's progress printing inside workers
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            cache = PerformanceCache.open(cache_path) if cache_path is not None else None
+            aircraft, mission, prop = run_pipeline(config, cache=cache)
+
+        record["MTOW"] = float(aircraft.reqs["MTOW"]["value"])
+        record["converged"] = bool(aircraft.converged)
+        record["iterations"] = aircraft.iter
+        for key, value in aircraft.subsystem.items():
+            record[f"m_{key}"] = float(value["value"])
+        for key in ("P", "Pp", "RPM", "CT", "FM"):
+            record[key] = float(prop.perf[key]["value"])
+        record["R"] = float(prop.params["R"]["value"])
+        record["duration"] = float(sum(float(seg["duration"]) for seg in mission.segments))
+        record["distance"] = float(sum(np.linalg.norm(seg["Displacement"]) for seg in mission.segments))
+        record["E_mission"] = float(mission.energy["E"]["value"])
+        record["SOC_final"] = float(mission.energy["SOC"]["value"])
+
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+
+    return record
+
+
+def run_batch(configs=None, base_config=None, grid=None, max_workers=None, chunksize=1, output=None, cache=None):
+    """
+    This function runs every case across a process pool and collects the results.
+
+    Inputs
+    -----
+    configs         :   directory of .yml configs (see build_cases)
+    base_config     :   base .yml config (see build_cases)
+    grid            :   dictionary of dotted config keys -> list of values (see build_cases)
+    max_workers     :   number of worker processes; None uses every core
+    chunksize       :   number of cases sent to a worker at a time
+    output          :   optional .npz, .csv or .jsonl path to write the results to
+    cache           :   optional sqlite file of a PerformanceCache for propeller results, shared across
+                        workers and runs
+
+    Outputs
+    -----
+    results         :   pandas DataFrame with one row per case
+    """
+
+    import pandas as pd
+
+    cases = build_cases(configs, base_config, grid)
+
+    run = functools.partial(run_case, cache_path=cache)
+
+    if max_workers == 1:
+        records = [run(case) for case in cases]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            records = list(executor.map(run, cases, chunksize=chunksize))
+
+    results = pd.DataFrame.from_records(records)
+
+    n_failed = int((results["error"] != "").sum())
+    print(f"Ran {len(results)} cases ({n_failed} failed).")
+
+    if output is not None:
+        output = Path(output)
+        os.makedirs(output.parent, exist_ok=True)
+        if output.suffix == ".npz":
+            np.savez(output, **{col: results[col].to_numpy() if pd.api.types.is_numeric_dtype(results[col])
+                                else results[col].to_numpy(dtype=str) for col in results.columns})
+        elif output.suffix == ".csv":
+            results.to_csv(output, index=False)
+        elif output.suffix == ".jsonl":
+            with ResultsStore(str(output.parent), name=output.stem, fmt="jsonl", buffer_size=len(records),
+                              mode="w") as store:
+                for record in records:
+                    store.append(record)
+        else:
+            raise ValueError("Inappropriate output format selected. Available formats include '.npz', '.csv' and '.jsonl'.")
+        print(f"Successfully wrote '{output}'")
+
+    return results
+
+
+def parse_grid(items):
+    """
+    This function parses command line grid overrides of the form key=v1,v2,v3 into a dictionary.
+    """
+
+    grid = dict()
+    for item in items or []:
+        key, values = item.split("=", 1)
+        grid[key] = [read_value(value) for value in values.split(",")]
+
+    return grid
+
+
+def read_value(text):
+    """
+    This function converts a command line value to an int or float when possible.
+    """
+
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+
+    return text
+
+
+if __name__=="__main__":
+    parser = argparse.ArgumentParser(description="Size many eVTOL configurations in parallel.")
+    parser.add_argument("--configs", help="directory of .yml configs; one case per file")
+    parser.add_argument("--base", help="base .yml config for a parameter grid")
+    parser.add_argument("--grid", action="append", help="override grid as key=v1,v2,...; may be repeated")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--chunksize", type=int, default=1, help="cases sent to a worker at a time")
+    parser.add_argument("--output", default="output/batch.npz", help=".npz, .csv or .jsonl results file")
+    parser.add_argument("--cache", default=None, help="sqlite file caching propeller results across runs")
+    args = parser.parse_args()
+
+    run_batch(configs=args.configs, base_config=args.base, grid=parse_grid(args.grid),
+              max_workers=args.workers, chunksize=args.chunksize, output=args.output, cache=args.cache)
@@ -0,0 +1,174 @@
+"""
+This module screens a batch of candidate rotors with multiple fidelities. Every candidate is evaluated
+with cheap, vectorized momentum theory first; candidates are ranked by a metric and only the top-k, or
+those within a margin band of the best, are promoted to a higher fidelity loading model (BET or BEMT).
+The promoted candidates are evaluated together in one batched high fidelity call. The compute saved
+against running the high fidelity model on every candidate is estimated from the measured cost per
+promoted candidate, after an untimed warm-up evaluation.
+
+Functions
+--------
+- rank_candidates
+- run_screening
+
+Usage
+--------
+grid = np.meshgrid(np.linspace(100, 700, 25), np.linspace(0.05, 0.15, 21), indexing="ij")
+prop_specs = {**PROP_DEFAULTS, "DL": {"name": "DL", "value": grid[0], "units": "Pa"},
+              "sigma": {"name": "sigma", "value": grid[1], "units": "-"}}
+screen = run_screening(prop_specs, T, rho, a, metric="FM", top_k=10, model="BEMT")
+
+Last Revised: 17 October 2026
+"""
+import time
+import numpy as np
+from Propeller import Propeller, LOADING_MODELS
+from Profiler import PROFILER
+
+# ranking metrics: perf key -> True when larger is better
+METRICS = {"FM": True, "P": False, "Pp": False}
+
+def rank_candidates(values, metric, top_k=None, band=None):
+    """
+    This function ranks candidates and selects those to promote.
+
+    Inputs
+    -----
+    values      :   array of metric values of every candidate
+    metric      :   str specifying the metric (see METRICS)
+    top_k       :   number of best candidates to promote
+    band        :   relative margin; candidates within this fraction of the best value are promoted
+                    (e.g. 0.02 promotes every candidate within 2% of the best)
+
+    Outputs
+    -----
+    order       :   flat candidate indices, best first
+    promoted    :   flat indices of the promoted candidates, best first
+    """
+
+    if top_k is None and band is None:
+        raise ValueError("Specify top_k and/or band to select the candidates to promote.")
+
+    values = np.ravel(values)
+    larger = METRICS[metric]
+
+    # non-finite candidates (e.g. infeasible designs) rank last and are never promoted
+    key = np.where(np.isfinite(values), -values if larger else values, np.inf)
+    order = np.argsort(key, kind="stable")
+    n_finite = int(np.count_nonzero(np.isfinite(values)))
+
+    # union of the top-k and the candidates within the band of the best value
+    n_promote = 0 if top_k is None else min(top_k, n_finite)
+    if band is not None and n_finite > 0:
+        best = values[order[0]]
+        ranked = values[order[:n_finite]]
+        in_band = ranked >= best - band * abs(best) if larger else ranked <= best + band * abs(best)
+        n_promote = max(n_promote, int(np.count_nonzero(in_band)))
+
+    return order, order[:n_promote]
+
+
+def run_screening(prop_specs, T, rho, a, metric="FM", top_k=10, band=None, model="BEMT", Nb=3,
+                  blade=None, **kwargs):
+    """
+    This function screens candidate rotors with momentum theory and promotes the best to a higher fidelity.
+
+    Inputs
+    -----
+    prop_specs  :   dictionary of propeller parameters; "DL", "sigma", "Mtip" (and "Np") may be arrays,
+                    one candidate per element of their broadcast shape
+    T, rho, a   :   operating condition (scalars) [N, kg/m^3, m/s]
+    metric      :   str specifying the ranking metric; "FM", "P" or "Pp"
+    top_k       :   number of best candidates to promote
+    band        :   relative margin of the best metric value within which candidates are promoted
+    model       :   str specifying the high fidelity loading model; "BET" or "BEMT"
+    Nb          :   number of blades of the promoted rotors [-]
+    blade       :   dictionary of additional keyword arguments of Propeller.set_bladeGeometry
+    kwargs      :   additional keyword arguments passed to the high fidelity model
+
+    Outputs
+    -----
+    screen              :   dictionary of screening results
+    screen["MT"]        :   dictionary of momentum theory metric arrays with the candidates' shape
+    screen["order"]     :   flat candidate indices ranked by momentum theory, best first
+    screen["promoted"]  :   flat indices of the promoted candidates
+    screen["params"]    :   list of the promoted candidates' parameter values
+    screen[model]       :   dictionary of high fidelity metric arrays, one entry per promoted candidate
+    screen["ranking"]   :   promoted candidate indices re-ranked by the high fidelity metric
+    screen["report"]    :   dictionary of candidate counts, timings [s] and the estimated compute saved
+    """
+
+    if metric not in METRICS:
+        raise ValueError(f"Inappropriate metric selected. Available metrics include {', '.join(METRICS)}.")
+    if model not in LOADING_MODELS or model == "MT":
+        raise ValueError("Inappropriate high fidelity model selected. Available models include 'BET' and 'BEMT'.")
+
+    # stage 1: momentum theory on every candidate in one vectorized call
+    with PROFILER.stage("screening_MT"):
+        t0 = time.perf_counter()
+        prop = Propeller(**prop_specs)
+        prop.run_propLoading("MT", T, rho, a)
+        shape = np.broadcast_shapes(*(np.shape(prop.params[key]["value"]) for key in ("DL", "sigma", "Mtip", "Np")),
+                                    np.shape(prop.perf[metric]["value"]))
+        screen_MT = {key: np.broadcast_to(prop.perf[key]["value"], shape) for key in ("FM", "P", "Pp", "CT", "RPM")}
+        screen_MT["R"] = np.broadcast_to(prop.params["R"]["value"], shape)
+        t_MT = time.perf_counter() - t0
+
+    # stage 2: rank and promote
+    order, promoted = rank_candidates(screen_MT[metric], metric, top_k=top_k, band=band)
+    candidates = {key: np.broadcast_to(prop_specs[key]["value"], shape).ravel() for key in ("DL", "sigma", "Mtip", "Np")}
+
+    # stage 3: high fidelity on the promoted candidates only, in one batched call on the radii sized in stage 1
+    R = screen_MT["R"].ravel()
+
+    def evaluate(index):
+        specs = {**prop_specs, **{key: {"name": key, "value": values[index], "units": prop_specs[key]["units"]}
+                                  for key, values in candidates.items()}, "R": {"name": "R", "value": R[index], "units": "m"}}
+        candidate = Propeller(**specs)
+        candidate.set_bladeGeometry(Nb, **(blade or dict()))
+        candidate.run_propLoading(model, T, rho, a, **kwargs)
+        return candidate
+
+    keys = ("FM", "P", "Pp", "CT", "RPM", "theta0")
+    screen_HF = {key: np.empty(0) for key in keys}
+    t_HF = 0.
+    if len(promoted) > 0:
+        # untimed first evaluation, so one-time costs (e.g. compiling or loading the BEMT kernel) are not
+        # extrapolated to every candidate
+        evaluate(promoted[:1])
+
+        with PROFILER.stage("screening_HF", model=model):
+            t0 = time.perf_counter()
+            candidate = evaluate(promoted)
+            t_HF = time.perf_counter() - t0
+        screen_HF = {key: np.broadcast_to(candidate.perf[key]["value"], promoted.shape).copy() for key in keys}
+    params = [{key: float(values[i]) for key, values in candidates.items()} for i in promoted]
+
+    ranking = promoted[rank_candidates(screen_HF[metric], metric, top_k=len(promoted))[0]]
+
+    # compute saved against running the high fidelity model on every candidate
+    n = int(np.prod(shape))
+    t_full = t_HF / max(len(promoted), 1) * n
+    report = {
+        "n_candidates": n,
+        "n_promoted": len(promoted),
+        "t_MT": t_MT,
+        "t_HF": t_HF,
+        "t_full_estimate": t_full,
+        "t_saved": t_full - t_MT - t_HF,
+        "speedup": t_full / (t_MT + t_HF),
+    }
+
+    print(f"Screened {n} candidates with MT in {t_MT:.3g} s; promoted {len(promoted)} to {model} in {t_HF:.3g} s.")
+    print(f"Estimated {model} on every candidate: {t_full:.3g} s; saved {report['t_saved']:.3g} s "
+          f"({report['speedup']:.3g}x faster).")
+
+    return {
+        "MT": screen_MT,
+        "order": order,
+        "promoted": promoted,
+        "params": params,
+        model: screen_HF,
+        "ranking": ranking,
+        "report": report,
+    }
@@ -0,0 +1,164 @@
+"""
+This module propagates input uncertainty through the vectorized sizing chain with Monte Carlo sampling.
+Samples are drawn and pushed through Aircraft.compute_MTOW (subsystem masses and momentum theory hover
+power) in fixed-size chunks; only streaming statistics (see StreamingStats) are kept between chunks,
+so millions of samples run in memory bounded by the chunk size.
+
+Functions
+--------
+- sample_inputs
+- run_uncertainty
+
+Uncertain inputs
+--------
+margin          :   MTOW margin factor [-]
+kappa           :   induced power factor [-]
+Cla             :   blade section lift curve slope [/rad]
+Cd0, Cd1, Cd2   :   coefficients of Bailey's drag curve [-]
+reqs.<key>      :   any requirement, e.g. reqs.payload [kg], reqs.range [m], reqs.endurance [s]
+subsystems.<key>:   any subsystem model parameter, e.g. subsystems.e_batt [J/kg]
+prop.<key>      :   any propeller sizing parameter, e.g. prop.DL [Pa]
+
+Distributions are given as (name, *args) tuples of numpy Generator distributions, e.g.
+    {"kappa": ("normal", 1.15, 0.05), "reqs.payload": ("uniform", 0.8, 1.2)}
+and may also be read from an "uncertainty" section of the config:
+    uncertainty:
+      kappa: {dist: normal, args: [1.15, 0.05]}
+
+Outputs
+--------
+MTOW            :   max takeoff weight [kg]
+P_hover         :   total hover power at MTOW [W]
+m_<subsystem>   :   subsystem masses [kg]
+converged       :   fraction of samples whose MTOW converged [-]
+
+Last Revised: 17 October 2026
+"""
+import contextlib
+import io
+import numpy as np
+from add_dictEntry import add_dictEntry
+from compute_momentumTheory import CLA, CD_COEFFS
+from compute_subsystemMasses import SUBSYSTEM_DEFAULTS, PROP_DEFAULTS
+from StreamingStats import StreamingStats
+
+# distributions of numpy.random.Generator accepted for sampling
+DISTRIBUTIONS = ("normal", "uniform", "lognormal", "triangular", "beta", "gamma", "weibull")
+
+# model coefficient uncertainty used when no distributions are given
+DEFAULT_UNCERTAINTY = {
+    "margin": ("uniform", 1.0, 1.1),
+    "kappa": ("normal", 1.15, 0.05),
+    "Cla": ("normal", CLA, 0.2),
+    "Cd0": ("normal", CD_COEFFS[0], 0.001),
+}
+
+def sample_inputs(distributions, n, rng):
+    """
+    This function draws n samples of every uncertain input.
+
+    Inputs
+    -----
+    distributions   :   dictionary of input name -> (distribution name, *args)
+    n               :   number of samples [-]
+    rng             :   numpy random Generator
+
+    Outputs
+    -----
+    samples         :   dictionary of input name -> array of n samples
+    """
+
+    samples = dict()
+    for key, (dist, *args) in distributions.items():
+        if dist not in DISTRIBUTIONS:
+            raise ValueError(f"Inappropriate distribution selected for '{key}'. "
+                             f"Available distributions include {', '.join(DISTRIBUTIONS)}.")
+        samples[key] = getattr(rng, dist)(*args, size=n)
+
+    return samples
+
+
+def run_uncertainty(config_params, distributions=None, n_samples=10**6, chunk_size=10**5, thresholds=None,
+                    quantiles=(0.05, 0.5, 0.95), seed=0):
+    """
+    This function runs the Monte Carlo uncertainty study.
+
+    Inputs
+    -----
+    config_params   :   parsed config dictionary of the nominal vehicle
+    distributions   :   dictionary of uncertain inputs (see module docstring); defaults to the config's
+                        "uncertainty" section, or DEFAULT_UNCERTAINTY
+    n_samples       :   total number of samples [-]
+    chunk_size      :   number of samples evaluated at a time [-]
+    thresholds      :   dictionary of output name -> list of thresholds for exceedance probabilities,
+                        e.g. {"MTOW": [5.]} for P(MTOW > 5 kg)
+    quantiles       :   quantiles reported in the summary [-]
+    seed            :   random seed
+
+    Outputs
+    -----
+    stats           :   dictionary of output name -> StreamingStats
+    """
+
+    from Aircraft import Aircraft
+
+    if distributions is None:
+        section = config_params.get("uncertainty")
+        distributions = ({key: (entry["dist"], *entry["args"]) for key, entry in section.items()}
+                         if section else DEFAULT_UNCERTAINTY)
+    thresholds = thresholds or dict()
+
+    # nominal vehicle
+    with contextlib.redirect_stdout(io.StringIO()):
+        aircraft = Aircraft(run_mode="auto", config_params=config_params)
+    reqs = {key: value for key, value in aircraft.reqs.items() if key != "MTOW"}
+    subsystem_params = {**SUBSYSTEM_DEFAULTS, **aircraft.subsystem_params}
+    prop_params = {**PROP_DEFAULTS, **aircraft.prop_params}
+
+    for key in distributions:
+        section, _, name = key.partition(".")
+        known = {"reqs": reqs, "subsystems": subsystem_params, "prop": prop_params}
+        if key not in ("margin", "kappa", "Cla", "Cd0", "Cd1", "Cd2") and name not in known.get(section, ()):
+            raise ValueError(f"Inappropriate uncertain input '{key}' selected. Available inputs include margin, "
+                             f"kappa, Cla, Cd0, Cd1, Cd2 and reqs./subsystems./prop. parameters.")
+
+    units = {"MTOW": "kg", "P_hover": "W", "converged": "-",
+             **{f"m_{key}": "kg" for key in aircraft.subsystem}}
+    stats = {key: StreamingStats(key, unit, thresholds.get(key, ()), seed=seed) for key, unit in units.items()}
+
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_samples, chunk_size):
+        n = min(chunk_size, n_samples - start)
+        samples = sample_inputs(distributions, n, rng)
+
+        def sampled(section, params):
+            return {key: add_dictEntry(key, samples.get(f"{section}.{key}", entry["value"]), entry["units"])
+                    for key, entry in params.items()}
+
+        # size every sample of the chunk in one vectorized MTOW iteration
+        aircraft.reqs = sampled("reqs", reqs)
+        aircraft.subsystem_params = sampled("subsystems", subsystem_params)
+        aircraft.prop_params = sampled("prop", prop_params)
+        aircraft.iter = 1
+
+        Cd_coeffs = tuple(samples.get(f"Cd{i}", CD_COEFFS[i]) for i in range(3))
+        with contextlib.redirect_stdout(io.StringIO()):
+            aircraft.compute_MTOW(margin=samples.get("margin", 1.), kappa=samples.get("kappa", 1.15),
+                                  Cla=samples.get("Cla", CLA), Cd_coeffs=Cd_coeffs)
+
+        outputs = {"MTOW": aircraft.reqs["MTOW"]["value"], "P_hover": aircraft.P_hover["value"],
+                   "converged": aircraft.converged,
+                   **{f"m_{key}": value["value"] for key, value in aircraft.subsystem.items()}}
+        for key, value in outputs.items():
+            stats[key].update(np.broadcast_to(value, (n,)))
+
+    print(f"Ran {n_samples} samples in chunks of {chunk_size}.\n")
+    print(f"{'output':15} {'mean':>12} {'std':>12} " + " ".join(f"{'q' + format(q, 'g'):>12}" for q in quantiles))
+    for key, stat in stats.items():
+        values = np.atleast_1d(stat.quantile(quantiles))
+        print(f"{key:15} {stat.mean:12.5g} {stat.std:12.5g} " + " ".join(f"{v:12.5g}" for v in values)
+              + f"  [{stat.units}]")
+        for threshold, probability in stat.exceedance().items():
+            print(f"{'':15} P({key} > {threshold:g}) = {probability:.4g}")
+
+    return stats
@@ -0,0 +1,14 @@
+"""
+This module puts the repository root on the import path so the tests import the flat modules, as the
+scripts do, and runs every test from the repository root so relative config paths resolve.
+"""
+import os
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    monkeypatch.chdir(ROOT)
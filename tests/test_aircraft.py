@@ -0,0 +1,67 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from Aircraft import Aircraft
+from read_yml import read_yml
+
+
+@pytest.fixture
+def aircraft():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Aircraft(run_mode="auto", config_params=read_yml("configs/group1_quad.yml"))
+
+
+def test_compute_MTOW_requires_an_iteration(aircraft):
+    with pytest.raises(ValueError, match="max_iter"):
+        aircraft.compute_MTOW(max_iter=0)
+
+
+def resize(aircraft, **kwargs):
+    aircraft.iter = 1
+    aircraft.compute_MTOW(**kwargs)
+
+    return float(aircraft.reqs["MTOW"]["value"])
+
+
+def test_anderson_converges_to_the_fixed_point(aircraft):
+    MTOW = resize(aircraft, tol=1e-12)
+
+    assert aircraft.converged
+    assert aircraft.residuals[-1] < 1e-12
+    subsystems = sum(float(mass["value"]) for mass in aircraft.subsystem.values())
+    assert subsystems == pytest.approx(MTOW, rel=1e-10)
+
+
+def test_anderson_matches_damped_in_fewer_iterations(aircraft):
+    MTOW_anderson = resize(aircraft, method="anderson", tol=1e-10)
+    n_anderson = len(aircraft.residuals)
+    MTOW_damped = resize(aircraft, method="damped", tol=1e-10, max_iter=1000)
+
+    assert aircraft.converged
+    assert MTOW_anderson == pytest.approx(MTOW_damped, rel=1e-8)
+    assert n_anderson < len(aircraft.residuals)
+
+
+def test_batched_requirements_match_single_designs(aircraft):
+    payloads = np.array([0.5, 1., 2.])
+    MTOW = []
+    for payload in payloads:
+        aircraft.reqs["payload"]["value"] = payload
+        MTOW.append(resize(aircraft, tol=1e-10))
+
+    aircraft.reqs["payload"]["value"] = payloads
+    aircraft.iter = 1
+    aircraft.compute_MTOW(tol=1e-10)
+
+    assert np.all(aircraft.converged)
+    np.testing.assert_allclose(aircraft.reqs["MTOW"]["value"], MTOW, rtol=1e-8)
+
+
+def test_unconverged_MTOW_warns(aircraft):
+    with pytest.warns(RuntimeWarning, match="did not converge"):
+        resize(aircraft, tol=1e-12, max_iter=1)
+
+    assert not aircraft.converged
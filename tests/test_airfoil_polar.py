@@ -0,0 +1,46 @@
+import json
+import shutil
+
+import numpy as np
+import pytest
+
+from AirfoilPolar import AirfoilPolar
+
+
+@pytest.fixture
+def polar_path(tmp_path):
+    path = tmp_path / "bailey.csv"
+    shutil.copy("polars/bailey.csv", path)
+    return str(path)
+
+
+def load(path):
+    return AirfoilPolar.load.__wrapped__(path)
+
+
+def test_load_writes_cache_and_reuses_it(polar_path, tmp_path):
+    built = load(polar_path)
+    cached = load(polar_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bailey.csv", "bailey.csv.cache.json",
+                                                          "bailey.csv.cache.npy"]
+    assert isinstance(cached.table, np.memmap)
+    np.testing.assert_array_equal(cached.table, built.table)
+
+
+def test_interrupted_cache_write_is_rebuilt(polar_path, tmp_path, monkeypatch):
+    load(polar_path)
+    meta = (tmp_path / "bailey.csv.cache.json").read_text()
+
+    # the source changes and the rebuild dies while writing the metadata
+    with open(polar_path, "a") as file:
+        file.write("\n")
+    with monkeypatch.context() as patch:
+        patch.setattr(json, "dump", lambda *args, **kwargs: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            load(polar_path)
+
+    assert (tmp_path / "bailey.csv.cache.json").read_text() == meta
+
+    load(polar_path)
+    assert json.loads((tmp_path / "bailey.csv.cache.json").read_text())["source"] != json.loads(meta)["source"]
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from interpolate_multilinear import interpolate_multilinear
+
+AXES = (np.array([0., 1., 3.]), np.array([-1., 0.5, 2., 4.]), np.array([10., 20.]))
+
+
+def multilinear(x, y, z):
+    return 1 + 2 * x - 3 * y + 0.5 * z + x * y - 0.1 * y * z + 0.05 * x * y * z
+
+
+def test_grid_nodes_are_reproduced():
+    grid = np.meshgrid(*AXES, indexing="ij")
+    values = multilinear(*grid)
+
+    np.testing.assert_allclose(interpolate_multilinear(AXES, values, grid), values, rtol=1e-12)
+
+
+def test_multilinear_functions_are_exact():
+    values = multilinear(*np.meshgrid(*AXES, indexing="ij"))
+    rng = np.random.default_rng(0)
+    points = [rng.uniform(axis[0], axis[-1], 1000) for axis in AXES]
+
+    result = interpolate_multilinear(AXES, values, points, chunk_size=128)
+
+    np.testing.assert_allclose(result, multilinear(*points), rtol=1e-12)
+
+
+def test_trailing_dimensions_and_broadcasting():
+    grid = np.meshgrid(*AXES, indexing="ij")
+    values = np.stack([multilinear(*grid), -multilinear(*grid)], axis=-1)
+    points = (np.array([0.5, 2.])[:, None], np.array([0., 1., 3.])[None, :], 15.)
+
+    result = interpolate_multilinear(AXES, values, points)
+
+    assert result.shape == (2, 3, 2)
+    np.testing.assert_allclose(result[..., 0], multilinear(*np.broadcast_arrays(*points)), rtol=1e-12)
+    np.testing.assert_allclose(result[..., 1], -result[..., 0])
+
+
+def test_single_value_axis_is_constant():
+    axes = (np.array([0., 1.]), np.array([0.3]))
+    values = np.array([[1.], [3.]])
+
+    np.testing.assert_allclose(interpolate_multilinear(axes, values, (np.array([0.25, 0.5]), 0.3)), [1.5, 2.])
+
+
+def test_points_outside_the_grid_raise():
+    values = multilinear(*np.meshgrid(*AXES, indexing="ij"))
+
+    with pytest.raises(ValueError):
+        interpolate_multilinear(AXES, values, (3.5, 0., 15.))
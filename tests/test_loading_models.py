@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from compute_BEMT import compute_BEMT
+from compute_subsystemMasses import PROP_DEFAULTS
+from Propeller import Propeller
+
+T, RHO, A = 40., 1.225, 340.
+
+
+def sized_propeller(model, T=T, twist=-0.2, **specs):
+    prop = Propeller(**{**PROP_DEFAULTS, **specs})
+    prop.run_propLoading("MT", T, RHO, A)
+    if model != "MT":
+        prop.set_bladeGeometry(3, twist=twist)
+        prop.run_propLoading(model, T, RHO, A)
+
+    return prop
+
+
+def value(prop, key):
+    return np.asarray(prop.perf[key]["value"], dtype=float)
+
+
+def test_momentum_theory_matches_ideal_power():
+    prop = sized_propeller("MT")
+    area = np.pi * np.asarray(prop.params["R"]["value"])**2 * PROP_DEFAULTS["Np"]["value"]
+
+    P_ideal = T * np.sqrt(T / (2 * RHO * area))
+
+    assert value(prop, "FM") * value(prop, "P") == pytest.approx(P_ideal, rel=1e-10)
+
+
+@pytest.mark.parametrize("model", ["BET", "BEMT"])
+def test_blade_models_trim_to_required_thrust(model):
+    prop = sized_propeller(model)
+
+    assert value(prop, "Tp") == pytest.approx(T / PROP_DEFAULTS["Np"]["value"], rel=1e-8)
+    assert value(prop, "RPM") == pytest.approx(value(sized_propeller("MT"), "RPM"))
+
+
+def test_blade_models_agree_with_momentum_theory():
+    FM = {model: value(sized_propeller(model), "FM") for model in ("MT", "BET", "BEMT")}
+
+    assert FM["BET"] == pytest.approx(FM["MT"], rel=0.03)
+    assert FM["BEMT"] == pytest.approx(FM["MT"], rel=0.03)
+    # Prandtl tip losses only appear in BEMT
+    assert FM["BEMT"] < FM["BET"]
+
+
+@pytest.mark.parametrize("model", ["BET", "BEMT"])
+def test_batched_rotors_match_single_rotors(model):
+    sigmas, DLs = np.array([0.06, 0.08, 0.12]), np.array([300., 500., 700.])
+    batch = sized_propeller(model, sigma={"name": "sigma", "value": sigmas, "units": "-"},
+                            DL={"name": "DL", "value": DLs, "units": "Pa"})
+
+    for i, (sigma, DL) in enumerate(zip(sigmas, DLs)):
+        single = sized_propeller(model, sigma={"name": "sigma", "value": sigma, "units": "-"},
+                                 DL={"name": "DL", "value": DL, "units": "Pa"})
+        for key in ("P", "theta0", "FM"):
+            assert value(batch, key)[i] == pytest.approx(value(single, key), rel=1e-9)
+
+
+def test_bemt_thrust_grows_with_collective():
+    prop = sized_propeller("MT")
+    prop.set_bladeGeometry(3)
+    theta0 = np.linspace(0.05, 0.25, 5)
+
+    perf = compute_BEMT(prop.blade, prop.params["R"]["value"], value(prop, "RPM"), theta0, 0., RHO)
+
+    assert np.all(np.diff(perf["CT"]) > 0)
+    assert np.all(perf["FM"] < 1)
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from read_yml import read_yml
+from run_batch import run_pipeline
+
+
+@pytest.fixture(scope="module")
+def sized():
+    return run_pipeline(read_yml("configs/group1_quad.yml"))
+
+
+def test_simulate_energy_without_time_steps(sized):
+    aircraft, mission, prop = sized
+    MTOW = float(aircraft.reqs["MTOW"]["value"])
+    durations = mission.durations
+    mission.durations = np.zeros_like(durations)
+    try:
+        mission.simulate_energy(MTOW, prop.params, 1e5)
+    finally:
+        mission.durations = durations
+
+    assert mission.energy["E"]["value"] == 0
+    assert mission.energy["SOC"]["value"] == 1
+    assert all(len(values) == 0 for values in mission.history.values())
+    assert mission.history["segment"].dtype == np.int64
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from compute_momentumTheory import compute_momentumTheory
+from compute_momentumTheoryGradient import compute_momentumTheoryGradient
+
+T, RHO, A, NP = 65.4, 1.2, 340., 4
+
+
+@pytest.mark.parametrize("x", [(500., 0.08, 0.4), (150., 0.05, 0.3), (900., 0.14, 0.6)])
+def test_gradient_matches_finite_differences(x):
+    x = np.array(x)
+    perf, grad = compute_momentumTheoryGradient(T, RHO, A, *x, NP)
+
+    for i in range(3):
+        h = np.zeros(3)
+        h[i] = 1e-6 * x[i]
+        plus, _ = compute_momentumTheoryGradient(T, RHO, A, *(x + h), NP)
+        minus, _ = compute_momentumTheoryGradient(T, RHO, A, *(x - h), NP)
+        for key in ("P", "FM", "BL", "R"):
+            fd = (plus[key] - minus[key]) / (2 * h[i])
+            assert grad[key][i] == pytest.approx(fd, rel=1e-5, abs=1e-9 * abs(perf[key]) / x[i])
+
+
+def test_gradient_outputs_match_momentum_theory():
+    DL, sigma, Mtip = np.meshgrid([200., 500.], [0.06, 0.1], [0.35, 0.5], indexing="ij", sparse=True)
+
+    perf, grad = compute_momentumTheoryGradient(T, RHO, A, DL, sigma, Mtip, NP)
+    reference = compute_momentumTheory(T, RHO, A, DL, sigma, Mtip, NP)
+
+    for key in ("P", "FM", "R"):
+        np.testing.assert_allclose(perf[key], reference[key], rtol=1e-12)
+    assert grad["P"].shape == (2, 2, 2, 3)
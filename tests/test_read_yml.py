@@ -0,0 +1,61 @@
+import contextlib
+import io
+
+import pytest
+import yaml
+
+from Aircraft import Aircraft
+from read_yml import read_yml, thaw
+from run_batch import run_pipeline
+
+CONFIG = "configs/group1_quad.yml"
+
+# the SI entries of CONFIG in other units
+IMPERIAL = {
+    "reqs": {"range": (1, "km"), "payload": (1 / 0.45359237, "lb"), "vtas_cruise": (36, "km/h"),
+             "endurance": (10, "min")},
+    "subsystems": {"m_avionics": (250, "g"), "p_motor": (5, "kW/kg"), "e_batt": (150, "Wh/kg")},
+    "prop": {"DL": (0.5, "kPa")},
+}
+
+
+@pytest.fixture
+def imperial_config(tmp_path):
+    config = thaw(read_yml(CONFIG, convert=False))
+    for section, entries in IMPERIAL.items():
+        for key, (value, units) in entries.items():
+            config[section][key] = {"value": value, "units": units}
+
+    path = tmp_path / "imperial.yml"
+    path.write_text(yaml.safe_dump(config))
+
+    return read_yml(str(path))
+
+
+def test_converted_config_matches_si_config(imperial_config):
+    si_config = read_yml(CONFIG)
+
+    for section, entries in IMPERIAL.items():
+        for key in entries:
+            assert imperial_config[section][key]["value"] == pytest.approx(si_config[section][key]["value"])
+            assert imperial_config[section][key]["units"] == si_config[section][key]["units"]
+
+
+def test_converted_config_sizes_the_same_aircraft(imperial_config):
+    with contextlib.redirect_stdout(io.StringIO()):
+        si_aircraft, si_mission, si_prop = run_pipeline(read_yml(CONFIG))
+        aircraft, mission, prop = run_pipeline(imperial_config)
+
+    assert aircraft.reqs["MTOW"]["value"] == pytest.approx(si_aircraft.reqs["MTOW"]["value"], rel=1e-10)
+    assert prop.perf["P"]["value"] == pytest.approx(si_prop.perf["P"]["value"], rel=1e-10)
+    assert mission.energy["E"]["value"] == pytest.approx(si_mission.energy["E"]["value"], rel=1e-10)
+
+def test_results_are_displayed_in_config_units(imperial_config):
+    with contextlib.redirect_stdout(io.StringIO()):
+        aircraft = Aircraft(run_mode="auto", config_params=imperial_config)
+
+    MTOW, units = aircraft.get_displayValue("MTOW")
+
+    assert units == "lb"
+    assert MTOW == pytest.approx(float(aircraft.reqs["MTOW"]["value"]) / 0.45359237)
+    assert aircraft.get_displayValue("range") == pytest.approx((1, "km"))
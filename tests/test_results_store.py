@@ -0,0 +1,35 @@
+import json
+
+from Quantity import Quantity
+from ResultsStore import ResultsStore
+
+
+def test_append_mode_extends_store_and_merges_units(tmp_path):
+    with ResultsStore(str(tmp_path), fmt="jsonl") as store:
+        store.append({"MTOW": Quantity("MTOW", 3.0, "kg")})
+    with ResultsStore(str(tmp_path), fmt="jsonl") as store:
+        store.append({"E": Quantity("E", 1e5, "J")})
+
+    results = ResultsStore.load(str(tmp_path))
+
+    assert len(results) == 2
+    assert results.attrs["units"] == {"MTOW": "kg", "E": "J"}
+
+
+def test_write_mode_replaces_store(tmp_path):
+    for mtow in (3.0, 4.0):
+        with ResultsStore(str(tmp_path), fmt="jsonl", mode="w") as store:
+            store.append({"MTOW": Quantity("MTOW", mtow, "kg")})
+
+    results = ResultsStore.load(str(tmp_path))
+
+    assert results["MTOW"].tolist() == [4.0]
+
+
+def test_write_mode_restarts_npz_chunks(tmp_path):
+    for mode in ("a", "a", "w"):
+        with ResultsStore(str(tmp_path), mode=mode) as store:
+            store.append({"MTOW": 3.0})
+
+    assert sorted(p.name for p in tmp_path.glob("results_*.npz")) == ["results_00000.npz"]
+    assert json.loads((tmp_path / "results_units.json").read_text()) == {}
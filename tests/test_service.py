@@ -0,0 +1,7 @@
+from compute_BEMT import _get_kernel
+from SizingService import _warm_worker
+
+def test_warm_worker_compiles_bemt_kernel():
+    _warm_worker(None)
+
+    assert _get_kernel().signatures
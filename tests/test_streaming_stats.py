@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from StreamingStats import QuantileSketch, StreamingStats
+
+QUANTILES = np.array([0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99])
+
+
+@pytest.fixture(scope="module")
+def samples():
+    return np.random.default_rng(1).lognormal(1., 0.5, 10**6)
+
+
+def rank_error(samples, estimates):
+    return np.abs(np.searchsorted(np.sort(samples), estimates) / len(samples) - QUANTILES)
+
+
+def test_moments_and_exceedance_match_numpy(samples):
+    stats = StreamingStats("MTOW", "kg", thresholds=(2., 5.))
+    for chunk in np.array_split(samples, 37):
+        stats.update(chunk)
+
+    assert stats.n == len(samples)
+    assert stats.mean == pytest.approx(np.mean(samples), rel=1e-12)
+    assert stats.std == pytest.approx(np.std(samples, ddof=1), rel=1e-10)
+    assert (stats.min, stats.max) == (np.min(samples), np.max(samples))
+    assert stats.exceedance() == pytest.approx({2.: np.mean(samples > 2.), 5.: np.mean(samples > 5.)})
+
+
+def test_sketch_quantiles_are_within_rank_error(samples):
+    stats = StreamingStats("MTOW", "kg", k=1024)
+    for chunk in np.array_split(samples, 10):
+        stats.update(chunk)
+
+    assert sum(len(level) for level in stats.sketch.levels) < 4 * 1024
+    assert np.max(rank_error(samples, stats.quantile(QUANTILES))) < 2 / 1024
+
+
+def test_merged_sketches_match_one_sketch(samples):
+    halves = np.array_split(samples, 2)
+    sketches = [QuantileSketch(k=1024, seed=seed) for seed in range(2)]
+    for sketch, half in zip(sketches, halves):
+        for chunk in np.array_split(half, 5):
+            sketch.update(chunk)
+
+    merged = sketches[0].merge(sketches[1])
+
+    assert np.max(rank_error(samples, merged.quantile(QUANTILES))) < 2 / 1024
+
+
+def test_non_finite_samples_are_ignored():
+    stats = StreamingStats("P", "W")
+    stats.update([1., np.nan, 3., np.inf])
+
+    assert stats.n == 2
+    assert stats.mean == 2.
+    assert np.isnan(StreamingStats("P").quantile(0.5))
@@ -0,0 +1,42 @@
+import sys
+import pytest
+from units import get_unitFactor, parse_units
+
+@pytest.fixture
+def no_astropy(monkeypatch):
+    # any unit reaching the astropy fallback fails to import it
+    monkeypatch.setitem(sys.modules, "astropy", None)
+    monkeypatch.setitem(sys.modules, "astropy.units", None)
+    parse_units.cache_clear()
+    yield
+    parse_units.cache_clear()
+
+
+@pytest.mark.parametrize("units, dimension", [
+    ("m**2", (2, 0, 0, 0, 0)),
+    ("s**-1", (0, 0, -1, 0, 0)),
+    ("kg*m/s**2", (1, 1, -2, 0, 0)),
+    ("kg*m/s^2", (1, 1, -2, 0, 0)),
+    ("J/kg/K", (2, 0, -2, -1, 0)),
+])
+def test_parse_builtin(no_astropy, units, dimension):
+    assert parse_units(units) == (pytest.approx(1.), dimension)
+
+
+def test_factors():
+    assert get_unitFactor("km", "m") == pytest.approx(1000.)
+    assert get_unitFactor("lb", "kg") == pytest.approx(0.45359237)
+    assert get_unitFactor("Wh/kg", "J/kg") == pytest.approx(3600.)
+    assert get_unitFactor("rev/min", "rad/s") == pytest.approx(2 * 3.141592653589793 / 60)
+    assert get_unitFactor("kg*m/s**2", "N") == pytest.approx(1.)
+
+
+@pytest.mark.parametrize("units_from, units_to", [("kg", "m"), ("deg", "-"), ("rpm", "1/s")])
+def test_dimension_mismatch(units_from, units_to):
+    with pytest.raises(ValueError, match="dimensions differ"):
+        get_unitFactor(units_from, units_to)
+
+
+def test_unknown_units(no_astropy):
+    with pytest.raises(ValueError, match="Inappropriate units 'furlong'"):
+        parse_units("furlong")
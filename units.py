@@ -0,0 +1,159 @@
+"""
+This module parses unit strings (e.g. "m/s", "kg/m^3", "rev/min", "Wh/kg") into a scale factor to SI and a
+dimension, and computes the conversion factors between units. Parsing and validation run once per unit
+string (memoized), when a config is loaded; the hot path only multiplies whole arrays by the precomputed
+factors.
+
+Units are products and quotients of the symbols in UNITS, with optional integer or decimal exponents,
+e.g. "kg*m/s^2", "J/kg/K" or "m^2". Symbols missing from UNITS are parsed with astropy.units when it is
+installed; astropy is only imported for such units, on first use.
+
+Functions
+--------
+- parse_units
+- get_unitFactor
+
+Last Revised: 17 October 2026
+"""
+import math
+import re
+from functools import lru_cache
+
+# dimension exponents of (length, mass, time, temperature, angle); angles are kept apart from plain
+# dimensionless units, so e.g. "deg" is never silently converted to or from "-"
+DIMENSIONS = ("m", "kg", "s", "K", "rad")
+
+def _dim(m=0, kg=0, s=0, K=0, rad=0):
+    return (m, kg, s, K, rad)
+
+# unit symbol -> (scale to SI, dimension)
+UNITS = {
+    # dimensionless
+    "-":    (1., _dim()),
+    "%":    (0.01, _dim()),
+    # angle
+    "rad":  (1., _dim(rad=1)),
+    "deg":  (math.pi / 180, _dim(rad=1)),
+    "rev":  (2 * math.pi, _dim(rad=1)),
+    # length
+    "m":    (1., _dim(m=1)),
+    "km":   (1e3, _dim(m=1)),
+    "cm":   (1e-2, _dim(m=1)),
+    "mm":   (1e-3, _dim(m=1)),
+    "ft":   (0.3048, _dim(m=1)),
+    "in":   (0.0254, _dim(m=1)),
+    "mi":   (1609.344, _dim(m=1)),
+    "nmi":  (1852., _dim(m=1)),
+    # mass
+    "kg":   (1., _dim(kg=1)),
+    "g":    (1e-3, _dim(kg=1)),
+    "lb":   (0.45359237, _dim(kg=1)),
+    "oz":   (0.028349523125, _dim(kg=1)),
+    # time
+    "s":    (1., _dim(s=1)),
+    "min":  (60., _dim(s=1)),
+    "h":    (3600., _dim(s=1)),
+    "hr":   (3600., _dim(s=1)),
+    # temperature (differences)
+    "K":    (1., _dim(K=1)),
+    # speed and rotation
+    "kt":   (1852. / 3600, _dim(m=1, s=-1)),
+    "mph":  (0.44704, _dim(m=1, s=-1)),
+    "rpm":  (2 * math.pi / 60, _dim(s=-1, rad=1)),
+    # force and pressure
+    "N":    (1., _dim(m=1, kg=1, s=-2)),
+    "lbf":  (4.4482216152605, _dim(m=1, kg=1, s=-2)),
+    "Pa":   (1., _dim(m=-1, kg=1, s=-2)),
+    "kPa":  (1e3, _dim(m=-1, kg=1, s=-2)),
+    "bar":  (1e5, _dim(m=-1, kg=1, s=-2)),
+    "psi":  (6894.757293168, _dim(m=-1, kg=1, s=-2)),
+    # power and energy
+    "W":    (1., _dim(m=2, kg=1, s=-3)),
+    "kW":   (1e3, _dim(m=2, kg=1, s=-3)),
+    "hp":   (745.69987158227, _dim(m=2, kg=1, s=-3)),
+    "J":    (1., _dim(m=2, kg=1, s=-2)),
+    "kJ":   (1e3, _dim(m=2, kg=1, s=-2)),
+    "MJ":   (1e6, _dim(m=2, kg=1, s=-2)),
+    "Wh":   (3600., _dim(m=2, kg=1, s=-2)),
+    "kWh":  (3.6e6, _dim(m=2, kg=1, s=-2)),
+}
+
+# one factor of a unit: symbol with an optional exponent, e.g. "m^2", "s**-1"
+TERM = re.compile(r"^([A-Za-z%-]+)(?:(?:\^|\*\*)([+-]?\d+(?:\.\d+)?))?$")
+
+@lru_cache(maxsize=None)
+def parse_units(units):
+    """
+    This function parses a unit string.
+
+    Inputs
+    -----
+    units       :   str specifying the units, e.g. "m/s"
+
+    Outputs
+    -----
+    scale       :   factor converting a value in these units to SI [-]
+    dimension   :   tuple of the exponents of DIMENSIONS
+    """
+
+    text = units.strip()
+    if text in ("", "1"):
+        return 1., _dim()
+
+    scale, dimension = 1., [0] * len(DIMENSIONS)
+    for i, group in enumerate(text.split("/")):
+        sign = 1 if i == 0 else -1
+        for term in re.split(r"(?<!\*)\*(?!\*)|\s+", group.strip()):
+            if term in ("", "1"):
+                continue
+            match = TERM.match(term)
+            if match is None or match.group(1) not in UNITS:
+                return _parse_astropy(units)
+            factor, term_dimension = UNITS[match.group(1)]
+            power = sign * float(match.group(2) or 1)
+            scale *= factor**power
+            dimension = [d + power * t for d, t in zip(dimension, term_dimension)]
+
+    return scale, tuple(dimension)
+
+
+@lru_cache(maxsize=None)
+def get_unitFactor(units_from, units_to):
+    """
+    This function returns the factor converting values in 'units_from' to 'units_to', e.g.
+    get_unitFactor("km", "m") = 1000; raises a ValueError if their dimensions differ.
+    """
+
+    scale_from, dimension_from = parse_units(units_from)
+    scale_to, dimension_to = parse_units(units_to)
+
+    if dimension_from != dimension_to:
+        raise ValueError(f"Cannot convert '{units_from}' to '{units_to}'; their dimensions differ.")
+
+    return scale_from / scale_to
+
+
+def _parse_astropy(units):
+    """
+    This function parses a unit string missing from UNITS with astropy.units, if installed.
+    """
+
+    try:
+        import astropy.units as u
+    except ImportError:
+        raise ValueError(f"Inappropriate units '{units}' selected. Available units include "
+                         f"{', '.join(UNITS)} and their products, quotients and powers.") from None
+
+    try:
+        unit = u.Unit(units.replace("^", "**"), parse_strict="raise").decompose()
+    except ValueError as exc:
+        raise ValueError(f"Inappropriate units '{units}' selected: {exc}") from None
+
+    dimension = dict.fromkeys(DIMENSIONS, 0)
+    for base, power in zip(unit.bases, unit.powers):
+        if base.name not in dimension:
+            raise ValueError(f"Inappropriate units '{units}' selected; only length, mass, time, temperature and "
+                             f"angle dimensions are supported.")
+        dimension[base.name] += float(power)
+
+    return float(unit.scale), tuple(dimension.values())